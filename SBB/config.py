@@ -1,3 +1,4 @@
+import os
 import sys
 import re
 import json
@@ -16,6 +17,8 @@ class Config():
     RESTRICTIONS = {
         'task_types': ['classification', 'reinforcement'],
         'environment_types': ['tictactoe', 'poker', 'sockets'],
+        'parallelism_modes': ['serial', 'pool', 'fork', 'distributed'],
+        'registers_precisions': ['float64', 'float32'],
         'round_to_decimals': 5, # if you change this value, you must update the unit tests
         'max_seed': numpy.iinfo(numpy.int32).max + abs(numpy.iinfo(numpy.int32).min), # so it works for both Windows and Ubuntu
         'is_nearly_equal_threshold': 0.0001,
@@ -56,6 +59,11 @@ class Config():
                 'ncd_custom', 'hamming', 'euclidean'],
             'total_bins': 3, # used to organize the distances for the action-based diversity metrics
             'max_ncd': 1.2, # used to normalize NCD
+            'ncd_compressors': ['bz2', 'zlib'],
+        },
+        'selection': {
+            'methods': ['pareto', 'nsga2'],
+            'costs': [None, 'team_size', 'effective_instructions'],
         },
         'second_layer': {
             'action_mapping': {}, # initialized by sbb.py
@@ -108,11 +116,47 @@ class Config():
                     "The valid values are "+str(Config.RESTRICTIONS['diversity']['options'])+"\n")
                 raise SystemExit
 
+        ncd = Config.USER['advanced_training_parameters']['diversity']['ncd']
+        if ncd['compressor'] not in Config.RESTRICTIONS['diversity']['ncd_compressors']:
+            sys.stderr.write("Error: Invalid 'compressor' for 'ncd' in CONFIG! "
+                "The valid values are "+str(Config.RESTRICTIONS['diversity']['ncd_compressors'])+"\n")
+            raise SystemExit
+        if ncd['level'] not in range(1, 10):
+            sys.stderr.write("Error: The 'level' for 'ncd' in CONFIG must be between 1 and 9\n")
+            raise SystemExit
+
         if (Config.USER['advanced_training_parameters']['novelty']['enabled'] 
                 and len(Config.USER['advanced_training_parameters']['diversity']['metrics']) == 0):
             sys.stderr.write("Error: Novelty can only be used along with a diversity metric\n")
             raise SystemExit
 
+        if (Config.USER['advanced_training_parameters']['registers_precision'] 
+                not in Config.RESTRICTIONS['registers_precisions']):
+            sys.stderr.write("Error: Invalid 'registers_precision' in CONFIG! "
+                "The valid values are "+str(Config.RESTRICTIONS['registers_precisions'])+"\n")
+            raise SystemExit
+
+        selection = Config.USER['advanced_training_parameters']['selection']
+        if selection['method'] not in Config.RESTRICTIONS['selection']['methods']:
+            sys.stderr.write("Error: Invalid 'method' for 'selection' in CONFIG! "
+                "The valid values are "+str(Config.RESTRICTIONS['selection']['methods'])+"\n")
+            raise SystemExit
+        if selection['cost'] not in Config.RESTRICTIONS['selection']['costs']:
+            sys.stderr.write("Error: Invalid 'cost' for 'selection' in CONFIG! "
+                "The valid values are "+str(Config.RESTRICTIONS['selection']['costs'])+"\n")
+            raise SystemExit
+        if selection['method'] == 'nsga2' and Config.USER['advanced_training_parameters']['novelty']['enabled']:
+            sys.stderr.write("Error: The 'nsga2' method for 'selection' can't be used along with novelty\n")
+            raise SystemExit
+
+        bloat_control = Config.USER['advanced_training_parameters']['bloat_control']
+        if bloat_control['size_penalty'] < 0.0:
+            sys.stderr.write("Error: For 'bloat_control', 'size_penalty' can't be lower than 0.0\n")
+            raise SystemExit
+        if bloat_control['max_team_instructions'] is not None and bloat_control['max_team_instructions'] < 1:
+            sys.stderr.write("Error: For 'bloat_control', 'max_team_instructions' can't be lower than 1\n")
+            raise SystemExit
+
         valid_operations = (Config.RESTRICTIONS['genotype_options']['simple_operations'] 
             + Config.RESTRICTIONS['genotype_options']['complex_operations'])
         for op in Config.USER['advanced_training_parameters']['use_operations']:  
@@ -127,6 +171,33 @@ class Config():
                     "'generations_total', in order to ensure validation of the last generation.\n")
             raise SystemExit
 
+        parallelism = Config.USER['advanced_training_parameters']['parallelism']
+        if parallelism['mode'] not in Config.RESTRICTIONS['parallelism_modes']:
+            sys.stderr.write("Error: Invalid 'mode' for 'parallelism' in CONFIG! "
+                "The valid values are "+str(Config.RESTRICTIONS['parallelism_modes'])+"\n")
+            raise SystemExit
+
+        if parallelism['mode'] in ['pool', 'fork']:
+            if not hasattr(os, 'fork'):
+                sys.stderr.write("Error: The 'pool' and 'fork' modes for 'parallelism' require a system "
+                    "with os.fork(), use 'serial' instead.\n")
+                raise SystemExit
+
+        if parallelism['mode'] != 'serial':
+            if parallelism['workers'] is not None and parallelism['workers'] < 1:
+                sys.stderr.write("Error: For 'parallelism', 'workers' can't be lower than 1\n")
+                raise SystemExit
+
+        if parallelism['mode'] == 'distributed':
+            if parallelism['workers'] is None:
+                sys.stderr.write("Error: For the 'distributed' mode of 'parallelism', 'workers' must be "
+                    "the total of workers that will connect to the coordinator\n")
+                raise SystemExit
+            if parallelism['distributed']['heartbeat_interval'] >= parallelism['distributed']['heartbeat_timeout']:
+                sys.stderr.write("Error: For the 'distributed' mode of 'parallelism', 'heartbeat_interval' "
+                    "must be lower than 'heartbeat_timeout'\n")
+                raise SystemExit
+
         if isinstance(Config.USER['advanced_training_parameters']['seed'], list):
             if (len(Config.USER['advanced_training_parameters']['seed']) 
                     != Config.USER['training_parameters']['runs_total']):
@@ -185,6 +256,12 @@ class Config():
                 "The valid values are "+str(Config.RESTRICTIONS['environment_types'])+"\n")
             raise SystemExit
 
+        if (Config.USER['reinforcement_parameters']['environment'] == 'sockets' 
+                and Config.USER['advanced_training_parameters']['parallelism']['mode'] != 'serial'):
+            sys.stderr.write("Error: The 'sockets' environment only works with the 'serial' mode "
+                "for 'parallelism', since all the matches use the same client connection.\n")
+            raise SystemExit
+
         total_labels = Config.USER['reinforcement_parameters']['environment_parameters']['point_labels_total']
         if total_labels < 1:
             sys.stderr.write("Error: Invalid 'point_labels_total' in CONFIG! "
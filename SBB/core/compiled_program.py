@@ -0,0 +1,121 @@
+import numpy
+from array import array
+from operations import Operation, PROTECTED_OPERATIONS
+from ..config import Config
+
+class CompiledProgram:
+    """
+    Flat representation of the instructions of a program (without introns), built once per
+    program and executed by a tight interpreter loop.
+
+    The instructions are packed as integer arrays (opcode, target, source, source type), and the
+    code executed by the interpreter has the protected function of each operation. Since
+    'if' instructions compare the indexes of their registers (see Operation.execute_if), the
+    outcome of every 'if' is already known at compile time, so the skip logic of Program.execute
+    is resolved here and the compiled code only contains the instructions that are actually executed.
+    """
+
+    OPERATORS = (Config.RESTRICTIONS['genotype_options']['simple_operations']
+        + Config.RESTRICTIONS['genotype_options']['complex_operations'])
+
+    READ_REGISTER = 0
+    READ_INPUT = 1
+    NO_SOURCE = 2
+
+    def __init__(self, instructions):
+        self.opcodes = array('i')
+        self.targets = array('i')
+        self.sources = array('i')
+        self.source_types = array('i')
+        for instruction in CompiledProgram.executed_instructions(instructions):
+            self.opcodes.append(CompiledProgram.OPERATORS.index(instruction.op))
+            self.targets.append(instruction.target)
+            if instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+                self.sources.append(0)
+                self.source_types.append(CompiledProgram.NO_SOURCE)
+            elif instruction.mode == 'read-register':
+                self.sources.append(instruction.source)
+                self.source_types.append(CompiledProgram.READ_REGISTER)
+            else:
+                self.sources.append(instruction.source)
+                self.source_types.append(CompiledProgram.READ_INPUT)
+        self.code_ = zip([PROTECTED_OPERATIONS[CompiledProgram.OPERATORS[opcode]] for opcode in self.opcodes], 
+            self.targets, self.sources, self.source_types)
+        self.batch_code_ = zip([CompiledProgram.OPERATORS[opcode] for opcode in self.opcodes], 
+            self.targets, self.sources, self.source_types)
+        used_registers = list(self.targets) + [source for source, source_type
+            in zip(self.sources, self.source_types) if source_type == CompiledProgram.READ_REGISTER]
+        self.total_registers_ = max(used_registers + [0]) + 1
+
+    def execute(self, registers, inputs):
+        """
+        Run the compiled code over the registers (modified in place) and return the bid (ie. the
+        output register). The operations never warn for Python numbers, but the caller must ignore the
+        numpy errors (ie. with numpy.errstate) if the inputs may have numpy scalars.
+        """
+        no_source = float('NaN')
+        for operation, target, source, source_type in self.code_:
+            if source_type == CompiledProgram.READ_INPUT:
+                value = inputs[source]
+            elif source_type == CompiledProgram.READ_REGISTER:
+                value = registers[source]
+            else:
+                value = no_source
+            registers[target] = operation(registers[target], value)
+        return registers[0]
+
+    def execute_batch(self, inputs):
+        """
+        Run the compiled code over a (points x inputs) matrix, with one register matrix row per point
+        (all registers starting at zero), and return the bids for all points. Each instruction is
+        executed as a single column operation. Since the 'if' instructions were already resolved by
+        the compilation, all points run the same code and no per-point masks are needed.
+
+        The registers have the precision of the inputs if they are float32 (see 'registers_precision'), 
+        otherwise float64. The protection of the operations is applied in that precision (ie. float32 
+        overflows to Infinity sooner).
+        """
+        inputs = numpy.asarray(inputs)
+        if inputs.dtype != numpy.float32:
+            inputs = numpy.asarray(inputs, dtype = numpy.float64)
+        registers = numpy.zeros((inputs.shape[0], self.total_registers_), dtype = inputs.dtype)
+        execute_batch = Operation.execute_batch
+        for operator, target, source, source_type in self.batch_code_:
+            if source_type == CompiledProgram.READ_INPUT:
+                value = inputs[:, source]
+            elif source_type == CompiledProgram.READ_REGISTER:
+                value = registers[:, source]
+            else:
+                value = None
+            registers[:, target] = execute_batch(operator, registers[:, target], value)
+        return registers[:, 0]
+
+    def __len__(self):
+        return len(self.code_)
+
+    @staticmethod
+    def executed_instructions(instructions):
+        """
+        Simulates the control flow of the interpreter in Program.execute and returns the
+        straight-line sequence of instructions that are executed.
+        """
+        if_instructions = Config.RESTRICTIONS['genotype_options']['if-instructions']
+        executed = []
+        if_instruction = None
+        skip_next = False
+        for instruction in instructions:
+            if if_instruction and not Operation.execute_if(if_instruction.op, if_instruction.target,
+                    if_instruction.source):
+                if_instruction = None
+                if instruction.op in if_instructions:
+                    skip_next = True
+            elif skip_next:
+                if instruction.op in if_instructions:
+                    skip_next = True
+                else:
+                    skip_next = False
+            elif instruction.op in if_instructions:
+                if_instruction = instruction
+            else:
+                executed.append(instruction)
+        return executed
@@ -0,0 +1,241 @@
+import json
+import time
+import select
+import socket
+import struct
+import numpy
+from ..config import Config
+
+# each message is a JSON object, prefixed by its length in bytes (4 bytes, big-endian)
+MESSAGE_HEADER = struct.Struct('!I')
+
+def send_message(connection, message):
+    data = json.dumps(message, default = _to_json_value)
+    connection.sendall(MESSAGE_HEADER.pack(len(data))+data)
+
+def receive_message(connection):
+    """
+    Return the next message received by the connection, or None if the connection was closed.
+    """
+    header = _receive_bytes(connection, MESSAGE_HEADER.size)
+    if header is None:
+        return None
+    data = _receive_bytes(connection, MESSAGE_HEADER.unpack(header)[0])
+    if data is None:
+        return None
+    return _to_str(json.loads(data))
+
+def _receive_bytes(connection, size):
+    chunks = []
+    received = 0
+    while received < size:
+        chunk = connection.recv(min(size-received, 65536))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        received += len(chunk)
+    return "".join(chunks)
+
+def _to_json_value(value):
+    if isinstance(value, numpy.generic):
+        return value.item()
+    raise TypeError(repr(value)+" is not JSON serializable")
+
+def _to_str(value):
+    """
+    The json module reads all strings as unicode, convert them back to str.
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    if isinstance(value, list):
+        return [_to_str(item) for item in value]
+    if isinstance(value, dict):
+        return dict([(_to_str(key), _to_str(item)) for key, item in value.iteritems()])
+    return value
+
+class DistributedCoordinator:
+    """
+    Coordinator of the 'distributed' mode of 'parallelism'. It listens for connections of workers
+    (see DistributedWorker), that may run in other hosts, and sends to them the teams to evaluate.
+
+    For each evaluation, it sends to all workers a 'setup' message, with the CONFIG and the points
+    and opponents used for training (see training_state() in the environments), and then one
+    'evaluate' message per team, with the team as a dict (the same format of the saved teams),
+    to the workers that are not evaluating a team. Each worker sends back a 'result' message with
+    the attributes set by the evaluation, and 'heartbeat' messages while it is connected.
+
+    If a worker closes the connection or doesn't send any message for 'heartbeat_timeout'
+    seconds, it is removed and the team it was evaluating is sent to another worker. New workers
+    may connect at any time.
+    """
+
+    def __init__(self, host, port, total_workers, heartbeat_timeout):
+        self.address_ = (host, port)
+        self.total_workers_ = total_workers
+        self.heartbeat_timeout_ = heartbeat_timeout
+        self.server_ = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_.bind(self.address_)
+        self.server_.listen(5)
+        self.workers_ = {} # connection: [time of the last message received, index of the team being evaluated]
+        self.setup_message_ = None
+        self.waited_for_workers_ = False
+
+    def evaluate(self, environment, teams_population, mode, seed):
+        """
+        Evaluate the teams in the workers and return the results in the format used by
+        TeamEvaluator.merge_result(), in the order of the population.
+        """
+        self.setup_message_ = {
+            'type': 'setup',
+            'config': Config.USER,
+            'second_layer': self._second_layer_actions(),
+            'state': environment.training_state(),
+            'mode': mode,
+            'seed': seed,
+        }
+        for connection in self.workers_.keys():
+            self.workers_[connection] = [time.time(), None]
+            self._send(connection, self.setup_message_)
+        if not self.waited_for_workers_:
+            self._wait_for_workers()
+            self.waited_for_workers_ = True
+
+        pending = range(len(teams_population))
+        results = [None] * len(teams_population)
+        remaining = len(teams_population)
+        last_time_with_workers = time.time()
+        while remaining > 0:
+            for connection, worker in self.workers_.items():
+                if worker[1] is None and pending:
+                    worker[1] = pending.pop(0)
+                    self._send(connection, self._evaluate_message(worker[1], teams_population[worker[1]]),
+                        pending)
+            if self.workers_:
+                last_time_with_workers = time.time()
+            elif time.time()-last_time_with_workers > self.heartbeat_timeout_:
+                raise RuntimeError("There are no workers connected to the coordinator at "
+                    +str(self.address_)+" to evaluate the teams.")
+
+            connections = [self.server_]+self.workers_.keys()
+            ready, _, _ = select.select(connections, [], [], 1.0)
+            for connection in ready:
+                if connection is self.server_:
+                    self._accept_worker()
+                    continue
+                if connection not in self.workers_: # removed while sending a message
+                    continue
+                try:
+                    message = receive_message(connection)
+                except (socket.error, ValueError):
+                    message = None
+                if message is None:
+                    self._remove_worker(connection, pending)
+                    continue
+                worker = self.workers_[connection]
+                worker[0] = time.time()
+                if message['type'] == 'result' and message['job'] == worker[1]:
+                    results[worker[1]] = message['result']
+                    remaining -= 1
+                    worker[1] = None
+                elif message['type'] == 'error':
+                    raise RuntimeError("The evaluation of the team "
+                        +teams_population[message['job']].__repr__()+" failed in a worker:\n"+message['message'])
+
+            for connection, worker in self.workers_.items():
+                if time.time()-worker[0] > self.heartbeat_timeout_:
+                    self._remove_worker(connection, pending)
+
+        return [self._merge_arguments(team, result) for team, result in zip(teams_population, results)]
+
+    def _second_layer_actions(self):
+        if not Config.USER['advanced_training_parameters']['second_layer']['enabled']:
+            return None
+        action_mapping = Config.RESTRICTIONS['second_layer']['action_mapping']
+        return [[action, team.dict()] for action, team in action_mapping.iteritems()]
+
+    def _evaluate_message(self, index, team):
+        return {
+            'type': 'evaluate',
+            'job': index,
+            'team': team.dict(),
+            'memory_actions_per_points': team.memory_actions_per_points_.items(),
+            'encodings': team.encodings_,
+        }
+
+    def _merge_arguments(self, team, result):
+        """
+        The team in the worker is created only with the attributes required by the evaluation,
+        so the results are applied over the current attributes of the team.
+        """
+        results_per_points = dict(team.results_per_points_)
+        results_per_points.update(dict(result['results_per_points']))
+        active_programs = [program.program_id_ for program in team.active_programs_]
+        active_programs += [program_id for program_id in result['active_programs']
+            if program_id not in active_programs]
+        extra_metrics = dict(team.extra_metrics_)
+        extra_metrics.update(result['extra_metrics'])
+        merged = {}
+        merged['fitness'] = result['fitness']
+        merged['results_per_points'] = results_per_points
+        merged['memory_actions_per_points'] = dict(result['memory_actions_per_points'])
+        merged['active_programs'] = active_programs
+        merged['encodings'] = result['encodings']
+        merged['extra_metrics'] = extra_metrics
+        merged['outputs_per_points'] = dict([(program.program_id_, {}) for program in team.programs])
+        merged['matches_per_points'] = team.matches_per_points_ # the workers always play all the matches
+        merged['matches_programs'] = team.matches_programs_
+        merged['environment_state'] = result['environment_state']
+        return merged
+
+    def _wait_for_workers(self):
+        """
+        Before the first evaluation, wait for 'workers' workers to connect (or for at least one
+        worker, after 'heartbeat_timeout' seconds).
+        """
+        start = time.time()
+        while len(self.workers_) < self.total_workers_:
+            remaining_time = self.heartbeat_timeout_-(time.time()-start)
+            if remaining_time <= 0:
+                break
+            ready, _, _ = select.select([self.server_], [], [], remaining_time)
+            if ready:
+                self._accept_worker()
+        if not self.workers_:
+            raise RuntimeError("No workers connected to the coordinator at "+str(self.address_)+".")
+
+    def _accept_worker(self):
+        connection, address = self.server_.accept()
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection.settimeout(self.heartbeat_timeout_) # so an incomplete message doesn't block the coordinator
+        self.workers_[connection] = [time.time(), None]
+        if self.setup_message_ is not None:
+            self._send(connection, self.setup_message_)
+
+    def _send(self, connection, message, pending = None):
+        try:
+            send_message(connection, message)
+        except socket.error:
+            self._remove_worker(connection, pending)
+
+    def _remove_worker(self, connection, pending):
+        """
+        Close the connection with the worker, and put the team it was evaluating back in the
+        pending teams.
+        """
+        if connection not in self.workers_:
+            return
+        _, index = self.workers_.pop(connection)
+        connection.close()
+        if index is not None and pending is not None:
+            pending.insert(0, index)
+
+    def close(self):
+        for connection in self.workers_.keys():
+            try:
+                send_message(connection, {'type': 'shutdown'})
+            except socket.error:
+                pass
+            connection.close()
+        self.workers_ = {}
+        self.server_.close()
@@ -0,0 +1,114 @@
+import json
+import time
+import socket
+import threading
+import traceback
+from team_evaluator import TeamEvaluator
+from distributed_coordinator import send_message, receive_message
+from ..utils.team_reader import read_team_from_json
+from ..sbb import SBB
+from ..config import Config
+
+class DistributedWorker:
+    """
+    Worker of the 'distributed' mode of 'parallelism' (see DistributedCoordinator). It connects
+    to the coordinator, creates its own environment with the CONFIG received from it, and
+    evaluates the teams it receives, one at a time. Run it with: python main.py -w host:port
+
+    Before each evaluation the environment is set up again with the points and opponents of the
+    generation, so each team is evaluated as if it was the first one (as in the 'fork' mode).
+    """
+
+    def __init__(self, host, port, connection_attempts = 60):
+        self.address_ = (host, port)
+        self.connection_attempts_ = connection_attempts
+        self.connection_ = None
+        self.lock_ = threading.Lock() # the heartbeats are sent by another thread
+        self.stop_heartbeats_ = threading.Event()
+        self.heartbeats_ = None
+        self.config_descriptor_ = None
+        self.environment_ = None
+        self.setup_message_ = None
+
+    def run(self):
+        self.connection_ = self._connect()
+        try:
+            while True:
+                message = receive_message(self.connection_)
+                if message is None or message['type'] == 'shutdown':
+                    break
+                if message['type'] == 'setup':
+                    self._setup(message)
+                elif message['type'] == 'evaluate':
+                    try:
+                        result = self._evaluate(message)
+                    except Exception:
+                        self._send({'type': 'error', 'job': message['job'], 'message': traceback.format_exc()})
+                    else:
+                        self._send({'type': 'result', 'job': message['job'], 'result': result})
+        finally:
+            self.stop_heartbeats_.set()
+            self.connection_.close()
+
+    def _connect(self):
+        """
+        Retry once per second, since the worker may start before the coordinator.
+        """
+        for attempt in range(self.connection_attempts_):
+            try:
+                connection = socket.create_connection(self.address_)
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                return connection
+            except socket.error:
+                if attempt == self.connection_attempts_-1:
+                    raise
+                time.sleep(1.0)
+
+    def _setup(self, message):
+        config_descriptor = json.dumps(message['config'], sort_keys = True)
+        if config_descriptor != self.config_descriptor_:
+            Config.USER = message['config']
+            self.environment_ = SBB().environment_ # initialized exactly as in the coordinator
+            self.config_descriptor_ = config_descriptor
+        if message['second_layer'] is not None:
+            Config.RESTRICTIONS['second_layer']['action_mapping'] = {}
+            for action, team_descriptor in message['second_layer']:
+                team = read_team_from_json(team_descriptor, self.environment_)
+                Config.RESTRICTIONS['second_layer']['action_mapping'][action] = team
+            Config.RESTRICTIONS['total_actions'] = len(Config.RESTRICTIONS['second_layer']['action_mapping'])
+        self.setup_message_ = message
+        if self.heartbeats_ is None:
+            interval = Config.USER['advanced_training_parameters']['parallelism']['distributed']['heartbeat_interval']
+            self.heartbeats_ = threading.Thread(target = self._send_heartbeats, args = (interval,))
+            self.heartbeats_.daemon = True
+            self.heartbeats_.start()
+
+    def _evaluate(self, message):
+        self.environment_.load_training_state(self.setup_message_['state'])
+        team_descriptor = message['team']
+        team = read_team_from_json(team_descriptor, self.environment_,
+            generation = team_descriptor['generation'])
+        team.memory_actions_per_points_ = dict(message['memory_actions_per_points'])
+        team.encodings_ = message['encodings']
+        result = TeamEvaluator.evaluate_team(self.environment_, team, self.setup_message_['mode'],
+            self.setup_message_['seed'])
+        return {
+            'fitness': result['fitness'],
+            'results_per_points': result['results_per_points'].items(),
+            'memory_actions_per_points': result['memory_actions_per_points'].items(),
+            'active_programs': result['active_programs'],
+            'encodings': result['encodings'],
+            'extra_metrics': result['extra_metrics'],
+            'environment_state': result['environment_state'],
+        }
+
+    def _send_heartbeats(self, interval):
+        while not self.stop_heartbeats_.wait(interval):
+            try:
+                self._send({'type': 'heartbeat'})
+            except socket.error:
+                break
+
+    def _send(self, message):
+        with self.lock_:
+            send_message(self.connection_, message)
@@ -1,17 +1,31 @@
 import bz2
+import zlib
 import math
 import numpy
-from scipy import stats
-from scipy.spatial.distance import hamming, euclidean
-from collections import defaultdict
-from ..utils.helpers import round_value
+import multiprocessing
+from scipy import stats, sparse
+from scipy.spatial.distance import hamming, euclidean, cdist
+from team_evaluator import TeamEvaluator
+from ..utils.helpers import round_value, results_matrix
 from ..config import Config
 
+def compressed_size(text):
+    """
+    Size of the text compressed by the compressor chosen for 'ncd' in the CONFIG. It is a function of 
+    the module, so it can be used by the workers of a multiprocessing pool.
+    """
+    ncd = Config.USER['advanced_training_parameters']['diversity']['ncd']
+    if ncd['compressor'] == 'zlib':
+        return len(zlib.compress(text, ncd['level']))
+    return len(bz2.compress(text, ncd['level']))
+
 class DiversityMaintenance():
     """
     This class contains all the diversity maintenance methods for teams.
     """
 
+    ASYMMETRIC_DISTANCES = ['ncd', 'ncd_custom'] # the compression of x+y isn't the same of y+x
+
     @staticmethod
     def define_bin_for_actions(actions):
         if len(actions) == 0:
@@ -58,18 +72,14 @@ class DiversityMaintenance():
         points that other individuals can't. It assumes that all dimension have the same weight (if it is not
         true, normalize the dimensions before applying fitness sharing).
         """
+        results = results_matrix(population, [point.point_id_ for point in point_population])
+
         # calculate denominators in each dimension
-        denominators = [1.0] * len(point_population) # initialized to 1 so we don't divide by zero
-        for index, point in enumerate(point_population):
-            for team in population:
-                denominators[index] += float(team.results_per_points_[point.point_id_])
+        denominators = 1.0 + results.sum(axis = 0) # initialized to 1 so we don't divide by zero
 
         # calculate fitness
-        for team in population:
-            score = 0.0
-            for index, point in enumerate(point_population):
-                score += float(team.results_per_points_[point.point_id_]) / denominators[index]
-            diversity = score/float(len(point_population))
+        diversities = (results/denominators).sum(axis = 1)/float(len(point_population))
+        for team, diversity in zip(population, diversities):
             team.diversity_['fitness_sharing'] = round_value(diversity)
 
     @staticmethod
@@ -78,22 +88,156 @@ class DiversityMaintenance():
         The kNN algorithm is applied to the list of 
         distances, to get the k most similar teams. The diversity is average distance of the k teams.
         In the end, teams with more uncommon program sets will obtain higher diversity scores.
+
+        For each distance, a matrix with the distances between all the teams is calculated at once. A 
+        team may appear more than once in the population (ie. in the novelty archive), but it is never 
+        compared with itself.
         """
+        teams = []
+        positions = {}
+        indeces = []
         for team in population:
-            # create array of distances to other teams
-            results = defaultdict(list)
-            for other_team in population:
-                if team != other_team:
-                    for distance in distances:
-                        result = getattr(DiversityMaintenance, "_"+distance)(team, other_team)
-                        results[distance].append(result)
-            # get mean of the k nearest neighbours
-            for distance in distances:
-                sorted_list = sorted(results[distance])
-                min_values = sorted_list[:k]
-                diversity = numpy.mean(min_values)
+            if id(team) not in positions:
+                positions[id(team)] = len(teams)
+                teams.append(team)
+            indeces.append(positions[id(team)])
+        indeces = numpy.array(indeces)
+        others_mask = indeces[:, numpy.newaxis] != indeces[numpy.newaxis, :]
+        for distance in distances:
+            matrix = DiversityMaintenance.distance_matrix(teams, distance)[numpy.ix_(indeces, indeces)]
+            for team, row, others in zip(population, matrix, others_mask):
+                values = row[others]
+                if k < len(values):
+                    values = numpy.partition(values, k-1)[:k]
+                diversity = numpy.mean(numpy.sort(values)) # sorted, so the sum is the same as before
                 team.diversity_[distance] = round_value(diversity)
 
+    @staticmethod
+    def distance_matrix(teams, distance):
+        """
+        Return the (teams x teams) matrix with the distances between all pairs of teams. The genotype, 
+        hamming and euclidean distances are calculated with matrix operations, the other distances are 
+        calculated for each pair of teams (only once for symmetric distances).
+        """
+        matrix_function = getattr(DiversityMaintenance, "_"+distance+"_matrix", None)
+        if matrix_function:
+            return matrix_function(teams)
+        distance_function = getattr(DiversityMaintenance, "_"+distance)
+        symmetric = distance not in DiversityMaintenance.ASYMMETRIC_DISTANCES
+        matrix = numpy.zeros((len(teams), len(teams)))
+        for index, team in enumerate(teams):
+            for other_index, other_team in enumerate(teams):
+                if index == other_index or (symmetric and other_index < index):
+                    continue
+                matrix[index, other_index] = distance_function(team, other_team)
+                if symmetric:
+                    matrix[other_index, index] = matrix[index, other_index]
+        return matrix
+
+    @staticmethod
+    def _genotype_matrix(teams):
+        """
+        The intersections of the active programs of all pairs of teams are obtained at once, by the 
+        product of the sparse (teams x programs) incidence matrix by its transpose. See _genotype().
+        """
+        columns_per_program = {}
+        rows = []
+        columns = []
+        for row, team in enumerate(teams):
+            for program in set(team.active_programs_):
+                rows.append(row)
+                columns.append(columns_per_program.setdefault(program, len(columns_per_program)))
+        incidence = sparse.csr_matrix((numpy.ones(len(rows)), (rows, columns)), 
+            shape = (len(teams), len(columns_per_program)))
+        intersections = incidence.dot(incidence.T).toarray()
+        sizes = numpy.diag(intersections)
+        unions = sizes[:, numpy.newaxis] + sizes[numpy.newaxis, :] - intersections
+        numpy.fill_diagonal(unions, 1.0) # a team is never compared with itself
+        if numpy.any(unions == 0):
+            print "Error: No union between teams' active programs! Look for bugs."
+            raise SystemExit
+        distances = 1.0 - intersections/unions
+        numpy.fill_diagonal(distances, 0.0)
+        return distances
+
+    @staticmethod
+    def _ncd_matrix(teams):
+        for team in teams:
+            if not team.encodings_['encoding_custom_info_per_match']:
+                raise ValueError("No 'encoding_for_actions_per_match' for 'ncd'")
+        sequences = [team.encodings_['encoding_for_actions_per_match'] for team in teams]
+        return DiversityMaintenance._normalized_compression_distance_matrix(sequences)
+
+    @staticmethod
+    def _ncd_custom_matrix(teams):
+        for team in teams:
+            if not team.encodings_['encoding_custom_info_per_match']:
+                raise ValueError("No custom encoding was defined for 'ncd_custom'")
+        sequences = [team.encodings_['encoding_custom_info_per_match'] for team in teams]
+        return DiversityMaintenance._normalized_compression_distance_matrix(sequences)
+
+    @staticmethod
+    def _normalized_compression_distance_matrix(sequences):
+        """
+        Calculate the NCD between all pairs of sequences (see _general_normalized_compression_distance()), 
+        compressing each distinct sequence only once. The concatenations of the pairs of sequences are 
+        compressed by a multiprocessing pool if the 'parallelism' is 'pool' or 'fork', and only for one of 
+        the orders of each pair if 'symmetric' is enabled for 'ncd' in the CONFIG.
+        """
+        symmetric = Config.USER['advanced_training_parameters']['diversity']['ncd']['symmetric']
+        texts = []
+        positions = {}
+        indeces = []
+        for sequence in sequences:
+            key = tuple(sequence)
+            if key not in positions:
+                positions[key] = len(texts)
+                texts.append("".join(sequence))
+            indeces.append(positions[key])
+        pairs = [(index, other_index) for index in range(len(texts)) for other_index in range(len(texts))
+            if index < other_index or (index > other_index and not symmetric)]
+        sizes = DiversityMaintenance._compressed_sizes(texts + [texts[index]+texts[other_index] 
+            for index, other_index in pairs])
+        distinct_matrix = numpy.zeros((len(texts), len(texts))) # the distance between equal sequences is 0.0
+        for (index, other_index), xy_len in zip(pairs, sizes[len(texts):]):
+            distinct_matrix[index, other_index] = DiversityMaintenance._normalized_compression_distance(
+                sizes[index], sizes[other_index], xy_len)
+            if symmetric:
+                distinct_matrix[other_index, index] = distinct_matrix[index, other_index]
+        return distinct_matrix[numpy.ix_(indeces, indeces)]
+
+    @staticmethod
+    def _compressed_sizes(texts):
+        if (Config.USER['advanced_training_parameters']['parallelism']['mode'] not in ['pool', 'fork'] 
+                or len(texts) < 2):
+            return [compressed_size(text) for text in texts]
+        workers = TeamEvaluator.total_workers()
+        pool = multiprocessing.Pool(workers)
+        try:
+            return pool.map(compressed_size, texts, chunksize = max(1, len(texts)/(workers*4)))
+        finally:
+            pool.close()
+            pool.join()
+
+    @staticmethod
+    def _hamming_matrix(teams):
+        encodings = DiversityMaintenance._pattern_of_actions(teams, 'hamming')
+        return cdist(encodings, encodings, 'hamming')
+
+    @staticmethod
+    def _euclidean_matrix(teams):
+        encodings = DiversityMaintenance._pattern_of_actions(teams, 'euclidean')
+        max_value = DiversityMaintenance._get_max_euclidean(Config.RESTRICTIONS['diversity']['total_bins'])
+        return cdist(encodings, encodings, 'euclidean')/float(max_value)
+
+    @staticmethod
+    def _pattern_of_actions(teams, distance):
+        for team in teams:
+            if not team.encodings_['encoding_for_pattern_of_actions_per_match']:
+                raise ValueError("No 'encoding_for_pattern_of_actions_per_match' for '"+distance+"'")
+        return numpy.array([team.encodings_['encoding_for_pattern_of_actions_per_match'] for team in teams], 
+            dtype = numpy.float64)
+
     @staticmethod
     def _genotype(team, other_team):
         """
@@ -185,9 +329,13 @@ class DiversityMaintenance():
         if len(action_sequence) == len(other_action_sequence):
             if action_sequence == other_action_sequence:
                 return 0.0
-        x_len = len(bz2.compress("".join(action_sequence)))
-        y_len = len(bz2.compress("".join(other_action_sequence)))
-        xy_len = len(bz2.compress("".join(action_sequence+other_action_sequence)))
+        x_len = compressed_size("".join(action_sequence))
+        y_len = compressed_size("".join(other_action_sequence))
+        xy_len = compressed_size("".join(action_sequence+other_action_sequence))
+        return DiversityMaintenance._normalized_compression_distance(x_len, y_len, xy_len)
+
+    @staticmethod
+    def _normalized_compression_distance(x_len, y_len, xy_len):
         distance = (xy_len - min(x_len, y_len))/float(max(x_len, y_len))
         distance = distance/Config.RESTRICTIONS['diversity']['max_ncd']
         if distance < 0.0:
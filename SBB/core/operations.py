@@ -1,6 +1,115 @@
 import math
 import numpy
-import warnings
+
+INFINITY = float('inf')
+
+# Protected operations: each one receives the values of the 'target' register and of the source (ignored 
+# by the one operand operations), and returns the value of the 'target' register if the operation results 
+# in an ArithmeticError, NaN, or Infinity (ie. ignores the instruction). They only use Python arithmetic 
+# and the math module, so they never change nor depend on the warning filters. The math module raises a 
+# ValueError instead of returning NaN for some values (ie. the cosine of Infinity), so it is also caught.
+
+def _protected_add(target, source):
+    try:
+        result = target + source
+    except ArithmeticError:
+        return target
+    if -INFINITY < result < INFINITY:
+        return result
+    return target
+
+def _protected_subtract(target, source):
+    try:
+        result = target - source
+    except ArithmeticError:
+        return target
+    if -INFINITY < result < INFINITY:
+        return result
+    return target
+
+def _protected_multiply(target, source):
+    try:
+        result = target * source
+    except ArithmeticError:
+        return target
+    if -INFINITY < result < INFINITY:
+        return result
+    return target
+
+def _protected_divide(target, source):
+    try:
+        result = target / source
+    except ArithmeticError:
+        return target
+    if -INFINITY < result < INFINITY:
+        return result
+    return target
+
+def _protected_ln(target, source):
+    if target > 0:
+        try:
+            return math.log(target)
+        except ArithmeticError:
+            pass
+    return target
+
+def _protected_exp(target, source):
+    try:
+        return math.exp(target)
+    except ArithmeticError:
+        return target
+
+def _protected_cos(target, source):
+    try:
+        return math.cos(target)
+    except (ArithmeticError, ValueError):
+        return target
+
+def _protected_sin(target, source):
+    try:
+        return math.sin(target)
+    except (ArithmeticError, ValueError):
+        return target
+
+def _if_lesser_than_for_signal(target, source):
+    if target < source:
+        return -target
+    return target
+
+def _if_equal_or_higher_than_for_signal(target, source):
+    if target >= source:
+        return -target
+    return target
+
+PROTECTED_OPERATIONS = {
+    '+': _protected_add,
+    '-': _protected_subtract,
+    '*': _protected_multiply,
+    '/': _protected_divide,
+    'ln': _protected_ln,
+    'exp': _protected_exp,
+    'cos': _protected_cos,
+    'sin': _protected_sin,
+    'if_lesser_than_for_signal': _if_lesser_than_for_signal,
+    'if_equal_or_higher_than_for_signal': _if_equal_or_higher_than_for_signal,
+}
+
+# column versions of the operations, the protection is applied by Operation.execute_batch()
+BATCH_OPERATIONS = {
+    '+': numpy.add,
+    '-': numpy.subtract,
+    '*': numpy.multiply,
+    '/': numpy.true_divide,
+    'ln': lambda target, source: numpy.log(target),
+    'exp': lambda target, source: numpy.exp(target),
+    'cos': lambda target, source: numpy.cos(target),
+    'sin': lambda target, source: numpy.sin(target),
+}
+
+BATCH_SIGNAL_OPERATIONS = {
+    'if_lesser_than_for_signal': lambda target, source: numpy.where(target < source, -target, target),
+    'if_equal_or_higher_than_for_signal': lambda target, source: numpy.where(target >= source, -target, target),
+}
 
 class Operation():
     """
@@ -11,41 +120,24 @@ class Operation():
 
     @staticmethod
     def execute(operator, target, source=float('NaN')):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore") # all errors are handled by this method, so there is no need for warnings here
-            error = False
-            try:
-                if operator == '+':
-                    result = target + source
-                elif operator == '-':
-                    result = target - source
-                elif operator == '*':
-                    result = target * source
-                elif operator == '/':
-                    result = target / source
-                elif operator == 'ln':
-                    result = numpy.log(target)
-                elif operator == 'exp':
-                    result = math.exp(target)
-                elif operator == 'cos':
-                    result = numpy.cos(target)
-                elif operator == 'sin':
-                    result = numpy.sin(target)
-                elif operator == 'if_lesser_than_for_signal':
-                    if (target < source):
-                        return -target
-                    else:
-                        return target
-                elif operator == 'if_equal_or_higher_than_for_signal':
-                    if (target >= source):
-                        return -target
-                    else:
-                        return target
-            except ArithmeticError:
-                error = True
-            if error or math.isnan(result) or math.isinf(result):
-                return target
-            return result
+        """
+        Execute a single operation (see PROTECTED_OPERATIONS). The programs get the functions 
+        of the operations once, when compiled, so they don't need to look them up.
+        """
+        return PROTECTED_OPERATIONS[operator](target, source)
+
+    @staticmethod
+    def execute_batch(operator, target, source=None):
+        """
+        Column version of execute(), where 'target' and 'source' are numpy arrays with one value
+        per point. The protection is applied per value, ie. each NaN or Infinity in the result is
+        replaced by the corresponding value of 'target'.
+        """
+        with numpy.errstate(all='ignore'): # all errors are handled by this method
+            if operator in BATCH_SIGNAL_OPERATIONS:
+                return BATCH_SIGNAL_OPERATIONS[operator](target, source)
+            result = BATCH_OPERATIONS[operator](target, source)
+            return numpy.where(numpy.isfinite(result), result, target)
 
     @staticmethod
     def execute_if(operator, target, source):
@@ -59,4 +151,4 @@ class Operation():
                 return True
             else:
                 return False
-        raise ValueError(str(operator)+" is not a valid 'if' operator.")
\ No newline at end of file
+        raise ValueError(str(operator)+" is not a valid 'if' operator.")
@@ -1,3 +1,4 @@
+import numpy
 from diversity_maintenance import DiversityMaintenance
 from ..utils.helpers import is_nearly_equal_to
 from ..config import Config 
@@ -24,28 +25,68 @@ class ParetoDominanceForTeams():
             keep_solutions, remove_solutions = ParetoDominanceForTeams._balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep)
         return keep_solutions, remove_solutions, pareto_front
 
+    @staticmethod
+    def run_nsga2(teams_population, objectives, teams_to_keep):
+        """
+        NSGA-II selection over a (teams x objectives) matrix, where higher is better: keep the teams of the 
+        best ranked fronts, and from the front that doesn't fit, the teams with the highest crowding distances.
+        """
+        fronts = ParetoDominanceForTeams._fronts_indices(
+            ParetoDominanceForTeams.dominance_matrix_for_objectives(objectives))
+        keep_indices = []
+        for front in fronts:
+            if len(keep_indices)+len(front) > teams_to_keep:
+                distances = ParetoDominanceForTeams.crowding_distances(objectives[front])
+                most_isolated = numpy.argsort(-distances, kind = 'mergesort')[:teams_to_keep-len(keep_indices)]
+                keep_indices.extend(front[numpy.sort(most_isolated)])
+                break
+            keep_indices.extend(front)
+        kept = set(keep_indices)
+        keep_solutions = [teams_population[index] for index in keep_indices]
+        remove_solutions = [team for index, team in enumerate(teams_population) if index not in kept]
+        pareto_front = []
+        if len(fronts) > 0:
+            pareto_front = [teams_population[index] for index in fronts[0]]
+        return keep_solutions, remove_solutions, pareto_front
+
+    @staticmethod
+    def crowding_distances(objectives):
+        """
+        The NSGA-II crowding distance of each solution in a (solutions x objectives) matrix: the sum, for 
+        each objective, of the distance between its neighbors, normalized by the range of the objective. The 
+        solutions in the extremes of any objective have an infinite distance.
+        """
+        total_solutions, total_objectives = objectives.shape
+        distances = numpy.zeros(total_solutions)
+        if total_solutions <= 2:
+            distances[:] = numpy.inf
+            return distances
+        for objective in range(total_objectives):
+            order = numpy.argsort(objectives[:, objective], kind = 'mergesort')
+            values = objectives[order, objective]
+            distances[order[0]] = numpy.inf
+            distances[order[-1]] = numpy.inf
+            if values[-1] > values[0]:
+                distances[order[1:-1]] += (values[2:]-values[:-2])/(values[-1]-values[0])
+        return distances
+
     @staticmethod
     def _pareto_front(teams_population, novelty):
         """
         Finds the pareto front, i.e. the pareto dominant solutions.
         """
-        for team in teams_population:
-            team.dom_by_ = 0
-            team.dom_of_ = 0
-
+        dominated_by = ParetoDominanceForTeams.dominance_matrix(teams_population, novelty)
         front = []
         dominateds = []
-        for teamA in teams_population:
-            for teamB in teams_population:
-                # check if there are teams that have a better or equal [fitness, novelty] and that are better in at least 
-                # one of the dimensions. If yes, then teamA is dominated by these teams.
-                if ParetoDominanceForTeams._is_dominated(teamA, teamB, novelty):
-                    teamA.dom_by_ += 1
-                    teamB.dom_of_ += 1
-                    if teamA not in dominateds:
-                        dominateds.append(teamA)
-            if teamA.dom_by_ == 0:
-                front.append(teamA)
+        dominated_ids = set()
+        for team, dom_by, dom_of in zip(teams_population, dominated_by.sum(axis = 1), dominated_by.sum(axis = 0)):
+            team.dom_by_ = int(dom_by)
+            team.dom_of_ = int(dom_of)
+            if team.dom_by_ == 0:
+                front.append(team)
+            elif id(team) not in dominated_ids:
+                dominated_ids.add(id(team))
+                dominateds.append(team)
 
         # use this score to balance the teams between remove and keep
         for team in teams_population:
@@ -53,6 +94,51 @@ class ParetoDominanceForTeams():
             team.dominance_score_ = team.dom_of_/float(len(teams_population)) # use it to remove teams from the front (the higher, the better)
         return front, dominateds
 
+    @staticmethod
+    def fronts(teams_population, novelty):
+        """
+        Sort the teams in ranked fronts (fast non-dominated sorting): the first front is the pareto front, 
+        the second one is the pareto front of the teams that are not in the first one, and so on.
+        """
+        dominated_by = ParetoDominanceForTeams.dominance_matrix(teams_population, novelty)
+        return [[teams_population[index] for index in front] 
+            for front in ParetoDominanceForTeams._fronts_indices(dominated_by)]
+
+    @staticmethod
+    def _fronts_indices(dominated_by):
+        remaining_dominators = dominated_by.sum(axis = 1)
+        sorted_solutions = numpy.zeros(len(remaining_dominators), dtype = bool)
+        fronts = []
+        current_front = numpy.flatnonzero(remaining_dominators == 0)
+        while len(current_front) > 0:
+            fronts.append(current_front)
+            sorted_solutions[current_front] = True
+            remaining_dominators = remaining_dominators - dominated_by[:, current_front].sum(axis = 1)
+            current_front = numpy.flatnonzero((remaining_dominators == 0) & ~sorted_solutions)
+        return fronts
+
+    @staticmethod
+    def dominance_matrix(teams_population, novelty):
+        """
+        Return the (teams x teams) matrix where [a, b] is True if the team b dominates the team a in 
+        fitness and novelty.
+        """
+        objectives = numpy.array([[team.selection_fitness(), team.diversity_[novelty]] for team in teams_population], 
+            dtype = numpy.float64).reshape(len(teams_population), 2)
+        return ParetoDominanceForTeams.dominance_matrix_for_objectives(objectives)
+
+    @staticmethod
+    def dominance_matrix_for_objectives(objectives):
+        """
+        Return the (solutions x solutions) matrix where [a, b] is True if the solution b dominates the 
+        solution a, for a (solutions x objectives) matrix where higher is better. It uses the same comparisons 
+        of _is_dominated(), made for all pairs and objectives at once.
+        """
+        threshold = Config.RESTRICTIONS['is_nearly_equal_threshold']
+        objectives_a, objectives_b = objectives[:, numpy.newaxis, :], objectives[numpy.newaxis, :, :]
+        better = (objectives_b > objectives_a) & ~(numpy.abs(objectives_a - objectives_b) < threshold)
+        return (objectives_b >= objectives_a).all(axis = 2) & better.any(axis = 2)
+
     @staticmethod
     def _is_dominated(teamA, teamB, novelty):
         """
@@ -71,7 +157,8 @@ class ParetoDominanceForTeams():
         if len(available) < teams_to_keep:
             not_available = [team for team in dominateds if team.fitness_ == 0.0]
             available += not_available[:teams_to_keep-len(available)]
-        sorted_solutions = sorted(available, key=lambda solution: solution.submission_score_, reverse = False) # worse ones first
+        sorted_solutions = sorted(available, key=lambda solution: (solution.submission_score_, 
+            solution.parsimony_size()), reverse = False) # worse ones first
         for solution in sorted_solutions:
             if solution not in keep_solutions:
                 keep_solutions.append(solution)
@@ -82,7 +169,8 @@ class ParetoDominanceForTeams():
 
     @staticmethod
     def _balance_pareto_front_to_down(front, keep_solutions, remove_solutions, teams_to_keep):
-        sorted_solutions = sorted(front, key=lambda solution: solution.dominance_score_, reverse = True) # better ones first
+        sorted_solutions = sorted(front, key=lambda solution: (solution.dominance_score_, 
+            solution.parsimony_size()), reverse = True) # better ones first
         for solution in sorted_solutions:
             keep_solutions.remove(solution)
             remove_solutions.append(solution)
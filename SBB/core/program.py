@@ -1,6 +1,9 @@
+import copy
 import random
+import numpy
 from instruction import Instruction
-from operations import Operation
+from program_analysis import ProgramAnalysis
+from program_kernels import get_program_kernel
 from ..config import Config
 
 def reset_programs_ids():
@@ -24,6 +27,10 @@ class Program:
         self.teams_ = []
         self.instructions_without_introns_ = []
         self.inputs_list_ = []
+        self.analysis_ = None # introns and inputs, kept updated by mutate() once it is created
+        self.kernel_ = None # shared by the programs with the same behavior, see ProgramKernels
+        self.compiled_program_ = None
+        self.outputs_per_points_ = {} # only used by classification, bids for the training points
         self.general_registers_ = [0] * Config.RESTRICTIONS['genotype_options']['total_registers']
 
     def reset_registers(self):
@@ -33,49 +40,59 @@ class Program:
         """
         Execute code for each input
         """
-        if len(self.instructions_without_introns_) == 0:
-            self.instructions_without_introns_ = Program.remove_introns(self.instructions)
-            self.inputs_list_ = self._inputs_list()
-        instructions = self.instructions_without_introns_
+        if self.compiled_program_ is None:
+            self.compile()
         if Config.USER['task'] == 'classification' or force_reset:
             self.reset_registers()
-        
-        if_instruction = None
-        skip_next = False
-        for instruction in instructions:
-            if if_instruction and not Operation.execute_if(if_instruction.op, if_instruction.target, 
-                    if_instruction.source):
-                if_instruction = None
-                if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    skip_next = True
-            elif skip_next:
-                if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    skip_next = True
-                else:
-                    skip_next = False
-            elif instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                if_instruction = instruction
-            elif instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
-                self.general_registers_[instruction.target] = Operation.execute(instruction.op, 
-                    self.general_registers_[instruction.target])
-            else:
-                if instruction.mode == 'read-register':
-                    source =  self.general_registers_[instruction.source]
-                else:
-                    source =  input_registers[instruction.source]
-                self.general_registers_[instruction.target] = Operation.execute(instruction.op, 
-                    self.general_registers_[instruction.target], source)
-
-        return self.general_registers_[0] # get bid output
-
-    def _inputs_list(self):
-        inputs = []
-        for instruction in self.instructions_without_introns_:
-            if (instruction.mode == 'read-input' 
-                and instruction.op not in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']
-                and instruction.source not in inputs):
-                inputs.append(instruction.source)
-        return inputs
+        return self.compiled_program_.execute(self.general_registers_, input_registers) # get bid output
+
+    def execute_batch(self, inputs_matrix, point_ids = None):
+        """
+        Execute code for each row of the (points x inputs) matrix at once, with the registers reset
+        for every point, and return the array of bids. If the ids of the points are given, the bids
+        are cached per point, since they only depend on the point inputs, and only the points that
+        are not in the cache are executed.
+        """
+        if self.compiled_program_ is None:
+            self.compile()
+        if point_ids is None:
+            return self.compiled_program_.execute_batch(inputs_matrix)
+        missing_indeces = [index for index, point_id in enumerate(point_ids) 
+            if point_id not in self.outputs_per_points_]
+        if len(missing_indeces) > 0:
+            outputs = self.compiled_program_.execute_batch(numpy.asarray(inputs_matrix)[missing_indeces])
+            for index, output in zip(missing_indeces, outputs):
+                self.outputs_per_points_[point_ids[index]] = output
+        return numpy.array([self.outputs_per_points_[point_id] for point_id in point_ids])
+
+    def compile(self):
+        """
+        Remove the introns and build the flat representation used to execute the program. The
+        programs with the same fingerprint share the compiled program and the cached outputs.
+        """
+        if self.analysis_ is None:
+            self.analysis_ = ProgramAnalysis(self.instructions)
+        self.instructions_without_introns_ = self.analysis_.effective_instructions()
+        self.inputs_list_ = self.analysis_.inputs_list()
+        self.kernel_ = get_program_kernel(self.instructions_without_introns_)
+        self.compiled_program_ = self.kernel_.compiled_program_
+        self.kernel_.outputs_per_points_.update(self.outputs_per_points_)
+        self.outputs_per_points_ = self.kernel_.outputs_per_points_
+
+    def fingerprint(self):
+        if self.kernel_ is None:
+            self.compile()
+        return self.kernel_.fingerprint_
+
+    def clone(self, generation):
+        """
+        Return a new program with a copy of the instructions. The analysis of the introns is
+        copied too, so the mutations of the clone only update it.
+        """
+        clone = Program(generation, copy.deepcopy(self.instructions), self.action)
+        if self.analysis_ is not None:
+            clone.analysis_ = self.analysis_.copy(clone.instructions)
+        return clone
 
     def get_action_result(self, point_id, inputs, valid_actions, is_training):
         if self.is_atomic_action():
@@ -102,22 +119,44 @@ class Program:
             actions = [p.action for p in team.programs]
             return actions
 
-    def mutate(self):
+    def total_effective_instructions(self):
+        """
+        The total of instructions that aren't introns, ie. the cost to execute the program.
+        """
+        if self.analysis_ is None:
+            self.analysis_ = ProgramAnalysis(self.instructions)
+        return self.analysis_.effective_.count(True)
+
+    def mutate(self, max_effective_instructions = None):
+        """
+        Mutate the instructions and the action. If 'max_effective_instructions' isn't None, no 
+        instruction is added after the program reaches it, and effective instructions are removed
+        while the program is above it (and above the min program size).
+        """
         mutation_chance = random.random()
         if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['remove_instruction'] 
                 and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
-            self.instructions.remove(random.choice(self.instructions))
+            index = self.instructions.index(random.choice(self.instructions))
+            del self.instructions[index]
+            if self.analysis_ is not None:
+                self.analysis_.instruction_removed(index)
 
         mutation_chance = random.random()
         if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_instruction']:
             instruction = random.choice(self.instructions)
             instruction.mutate()
+            if self.analysis_ is not None:
+                self.analysis_.instruction_changed(self.instructions.index(instruction))
  
         mutation_chance = random.random()
         if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['add_instruction'] 
-                and len(self.instructions) < Config.USER['training_parameters']['program_size']['max']):
+                and len(self.instructions) < Config.USER['training_parameters']['program_size']['max']
+                and (max_effective_instructions is None 
+                    or self.total_effective_instructions() < max_effective_instructions)):
             index = random.randrange(len(self.instructions))
             self.instructions.insert(index, Instruction())
+            if self.analysis_ is not None:
+                self.analysis_.instruction_inserted(index)
         
         mutation_chance = random.random()
         if (mutation_chance <= Config.USER['training_parameters']['mutation']['program']['swap_instructions'] 
@@ -129,11 +168,23 @@ class Program:
             temp = self.instructions[index1]
             self.instructions[index1] = self.instructions[index2]
             self.instructions[index2] = temp
+            if self.analysis_ is not None:
+                self.analysis_.instructions_swapped(index1, index2)
 
         mutation_chance = random.random()
         if mutation_chance <= Config.USER['training_parameters']['mutation']['program']['change_action']:
             self.action = random.randrange(Config.RESTRICTIONS['total_actions'])
 
+        if max_effective_instructions is not None:
+            while (self.total_effective_instructions() > max_effective_instructions
+                    and len(self.instructions) > Config.USER['training_parameters']['program_size']['min']):
+                effective_indeces = [index for index, effective in enumerate(self.analysis_.effective_) if effective]
+                if len(effective_indeces) == 0:
+                    break
+                index = random.choice(effective_indeces)
+                del self.instructions[index]
+                self.analysis_.instruction_removed(index)
+
     def add_team(self, team):
         self.teams_.append(team)
 
@@ -194,24 +245,4 @@ class Program:
         """
         Remove introns (ie. instructions that don't affect the final output)
         """
-        instructions_without_introns = []
-        relevant_registers = [0]
-        ignore_previous_if = True
-        for instruction in reversed(instructions):
-            if (instruction.target in relevant_registers 
-                or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']):
-                if ignore_previous_if and instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
-                    continue
-                else:
-                    ignore_previous_if = False
-                    instructions_without_introns.insert(0, instruction)
-                    if not instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
-                        if instruction.mode == 'read-register' and instruction.source not in relevant_registers:
-                            relevant_registers.append(instruction.source)
-                    if (instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions'] 
-                        or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions-for-signal']):
-                        if instruction.target not in relevant_registers:
-                            relevant_registers.append(instruction.target)
-            else:
-                ignore_previous_if = True
-        return instructions_without_introns
\ No newline at end of file
+        return ProgramAnalysis(instructions).effective_instructions()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import copy
+from ..config import Config
+
+class ProgramAnalysis:
+    """
+    Finds the introns (ie. instructions that don't affect the final output) and the inputs used by
+    a list of instructions, in a single backward pass that keeps the relevant registers as a bitset.
+
+    The state of the pass before each instruction (the relevant registers and if the previous 'if'
+    must be ignored) is kept, so after a mutation only the instructions before the mutated one are
+    analyzed again, and only until the state is the same as before the mutation.
+    """
+
+    def __init__(self, instructions):
+        self.instructions_ = instructions # the same list of the program, already mutated when updated
+        self.effective_ = [] # for each instruction, if it isn't an intron
+        # state of the pass after analyzing the instructions from the index to the end, so
+        # states_[len(instructions)] is the state before analyzing any instruction
+        self.states_ = []
+        self.analyze()
+
+    def analyze(self):
+        total = len(self.instructions_)
+        self.effective_ = [False] * total
+        self.states_ = [None] * (total+1)
+        self.states_[total] = (1, True) # only the output register (r[0]) is relevant at the end
+        self._update(total-1)
+
+    def copy(self, instructions):
+        """
+        Return the same analysis for a copy of the instructions (ie. for a clone of the program).
+        """
+        analysis = copy.copy(self)
+        analysis.instructions_ = instructions
+        analysis.effective_ = list(self.effective_)
+        analysis.states_ = list(self.states_)
+        return analysis
+
+    def instruction_changed(self, index):
+        self._update(index, force_until = index)
+
+    def instruction_inserted(self, index):
+        self.effective_.insert(index, False)
+        self.states_.insert(index, None)
+        self._update(index, force_until = index)
+
+    def instruction_removed(self, index):
+        del self.effective_[index]
+        del self.states_[index]
+        self._update(index-1, force_until = index-1)
+
+    def instructions_swapped(self, index1, index2):
+        self._update(max(index1, index2), force_until = min(index1, index2))
+
+    def _update(self, start, force_until = 0):
+        """
+        Analyze the instructions from 'start' to the beginning. From 'force_until' on (after the last
+        instruction that was changed), stop as soon as the state is the same as before.
+        """
+        if_instructions = Config.RESTRICTIONS['genotype_options']['if-instructions']
+        if_instructions_for_signal = Config.RESTRICTIONS['genotype_options']['if-instructions-for-signal']
+        one_operand_instructions = Config.RESTRICTIONS['genotype_options']['one-operand-instructions']
+        relevant_registers, ignore_previous_if = self.states_[start+1]
+        for index in range(start, -1, -1):
+            instruction = self.instructions_[index]
+            is_if = instruction.op in if_instructions
+            if (relevant_registers >> instruction.target) & 1 or is_if:
+                if ignore_previous_if and is_if:
+                    self.effective_[index] = False
+                else:
+                    ignore_previous_if = False
+                    self.effective_[index] = True
+                    if instruction.op not in one_operand_instructions and instruction.mode == 'read-register':
+                        relevant_registers |= 1 << instruction.source
+                    if is_if or instruction.op in if_instructions_for_signal:
+                        relevant_registers |= 1 << instruction.target
+            else:
+                ignore_previous_if = True
+                self.effective_[index] = False
+            state = (relevant_registers, ignore_previous_if)
+            if index <= force_until and self.states_[index] == state:
+                return # the previous instructions would be analyzed as before
+            self.states_[index] = state
+
+    def effective_instructions(self):
+        return [instruction for instruction, effective in zip(self.instructions_, self.effective_) if effective]
+
+    def inputs_list(self):
+        """
+        Return the inputs read by the effective instructions, in the order they are first read.
+        """
+        one_operand_instructions = Config.RESTRICTIONS['genotype_options']['one-operand-instructions']
+        inputs = []
+        seen = 0
+        for instruction, effective in zip(self.instructions_, self.effective_):
+            if (effective and instruction.mode == 'read-input' and instruction.op not in one_operand_instructions
+                    and not (seen >> instruction.source) & 1):
+                seen |= 1 << instruction.source
+                inputs.append(instruction.source)
+        return inputs
@@ -0,0 +1,64 @@
+import weakref
+from compiled_program import CompiledProgram
+from ..config import Config
+
+def program_fingerprint(instructions):
+    """
+    Return the key of the behavior of a list of instructions without introns: the sequence of
+    instructions that are actually executed (see CompiledProgram.executed_instructions), ignoring
+    the sources of the one operand instructions. Programs with the same fingerprint (ie. mutations
+    that only changed introns) always output the same bids for the same inputs.
+    """
+    one_operand_instructions = Config.RESTRICTIONS['genotype_options']['one-operand-instructions']
+    fingerprint = []
+    for instruction in CompiledProgram.executed_instructions(instructions):
+        if instruction.op in one_operand_instructions:
+            fingerprint.append((instruction.op, instruction.target))
+        else:
+            fingerprint.append((instruction.op, instruction.target, instruction.mode, instruction.source))
+    return tuple(fingerprint)
+
+class ProgramKernel:
+    """
+    The compiled program and the cache of bids per point shared by all the programs with the same
+    fingerprint, so duplicated programs are compiled once and executed once per point.
+    """
+
+    def __init__(self, fingerprint, instructions):
+        self.fingerprint_ = fingerprint
+        self.compiled_program_ = CompiledProgram(instructions)
+        self.outputs_per_points_ = {} # only used by classification, bids for the training points
+
+class ProgramKernels:
+    """
+    Population-wide index of the kernels per fingerprint. The kernels are only kept while there
+    are programs using them.
+    """
+
+    def __init__(self):
+        self.kernels_ = weakref.WeakValueDictionary()
+        self.compilations_ = 0
+        self.reuses_ = 0
+
+    def kernel(self, instructions):
+        fingerprint = program_fingerprint(instructions)
+        kernel = self.kernels_.get(fingerprint)
+        if kernel is None:
+            kernel = ProgramKernel(fingerprint, instructions)
+            self.kernels_[fingerprint] = kernel
+            self.compilations_ += 1
+        else:
+            self.reuses_ += 1
+        return kernel
+
+    def __len__(self):
+        return len(self.kernels_)
+
+def reset_program_kernels():
+    global program_kernels
+    program_kernels = ProgramKernels()
+
+def get_program_kernel(instructions):
+    return program_kernels.kernel(instructions)
+
+reset_program_kernels()
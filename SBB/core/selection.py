@@ -4,7 +4,7 @@ from team import Team
 from diversity_maintenance import DiversityMaintenance
 from pareto_dominance_for_teams import ParetoDominanceForTeams
 from ..environments.default_environment import DefaultEnvironment
-from ..utils.helpers import round_value
+from ..utils.helpers import round_value, derive_seed
 from ..config import Config
 
 class Selection:
@@ -45,8 +45,11 @@ class Selection:
         teams_to_keep = len(teams_population) - teams_to_remove
 
         diversities_to_apply = Config.USER['advanced_training_parameters']['diversity']['metrics']
-        if len(diversities_to_apply) == 0:
-            sorted_solutions = sorted(teams_population, key=lambda solution: solution.fitness_, reverse=True)
+        if Config.USER['advanced_training_parameters']['selection']['method'] == 'nsga2':
+            keep_teams, remove_teams, pareto_front = self._apply_nsga2(teams_population, teams_to_keep)
+        elif len(diversities_to_apply) == 0:
+            sorted_solutions = sorted(teams_population, 
+                key=lambda solution: (solution.selection_fitness(), -solution.parsimony_size()), reverse=True)
             keep_teams = sorted_solutions[0:teams_to_keep]
             remove_teams = sorted_solutions[teams_to_keep:]
             pareto_front = []
@@ -80,6 +83,28 @@ class Selection:
                 teams_to_keep)
         return keep_teams, remove_teams, pareto_front
 
+    def _apply_nsga2(self, teams_population, teams_to_keep):
+        """
+        Use all the objectives at once: the fitness, all the diversities and the cost (if any).
+        """
+        DiversityMaintenance.calculate_diversities(teams_population, self.environment.point_population_)
+        objectives = numpy.array([self._objectives(team) for team in teams_population], dtype = numpy.float64)
+        return ParetoDominanceForTeams.run_nsga2(teams_population, objectives, teams_to_keep)
+
+    def _objectives(self, team):
+        """
+        The objectives of the team for NSGA-II, where higher is better (so the cost is negative).
+        """
+        objectives = [team.selection_fitness()]
+        for diversity in Config.USER['advanced_training_parameters']['diversity']['metrics']:
+            objectives.append(team.diversity_[diversity])
+        cost = Config.USER['advanced_training_parameters']['selection']['cost']
+        if cost == 'team_size':
+            objectives.append(-len(team.programs))
+        if cost == 'effective_instructions':
+            objectives.append(-team.total_effective_instructions())
+        return objectives
+
     def _update_novelty_archive(self, teams_population, novelty):
         sorted_solutions = sorted(teams_population, key=lambda solution: solution.diversity_[novelty], 
             reverse=True)
@@ -141,8 +166,10 @@ class Selection:
         return teams_population, programs_population
 
     def _clone_teams(self, current_generation, teams_to_clone, teams_population, programs_population):
+        seed = random.randint(0, Config.RESTRICTIONS['max_seed'])
         for team in teams_to_clone:
             clone = Team(current_generation, team.programs, team.environment)
+            random.seed(derive_seed(seed, clone.team_id_, 'mutation'))
             programs_population = clone.mutate(programs_population)
             teams_population.append(clone)
         return teams_population, programs_population
@@ -1,9 +1,7 @@
 import random
 import numpy
-import copy
 import json
 from collections import Counter, defaultdict
-from program import Program
 from ..environments.reinforcement.default_opponent import DefaultOpponent
 from ..utils.helpers import round_value, round_array, flatten
 from ..config import Config
@@ -41,6 +39,8 @@ class Team(DefaultOpponent):
         self.memory_actions_per_points_ = {}
         self.results_per_points_ = {}
         self.results_per_points_for_validation_ = {}
+        self.matches_per_points_ = {} # only for training in deterministic environments, see played_matches()
+        self.matches_programs_ = None # ids of the programs used to play the matches in matches_per_points_
         self.diversity_ = {}
         self.encodings_ = {} # only used by reinforcement learning
         self.last_selected_program_ = None
@@ -86,6 +86,54 @@ class Team(DefaultOpponent):
                 self.validation_active_programs_.append(selected_program)
             return selected_program.get_action_result(point_id, inputs, valid_actions, is_training)
 
+    def execute_batch(self, point_ids, inputs_matrix, valid_actions, is_training):
+        """
+        Batch version of execute() for a list of points, where each row of the (points x inputs) matrix
+        are the inputs of the corresponding point. The bids of all programs are computed at once as a
+        (programs x points) matrix and the selected programs are obtained by its argmax along the programs
+        axis. Since the registers are reset for each point, it can only be used when the programs have no
+        memory between points (ie. classification). Returns the list of actions, one per point.
+        """
+        if (not self._actions_are_available(valid_actions)
+                or not all([program.is_atomic_action() for program in self.programs])):
+            return [self.execute(point_id, inputs, valid_actions, is_training)
+                for point_id, inputs in zip(point_ids, inputs_matrix)]
+
+        if is_training and Config.RESTRICTIONS['use_memmory_for_actions']:
+            pending = [index for index, point_id in enumerate(point_ids)
+                if point_id not in self.memory_actions_per_points_]
+        else:
+            pending = range(len(point_ids))
+
+        outputs = [None] * len(point_ids)
+        if len(pending) > 0:
+            valid_programs = [program for program in self.programs
+                if len(set(program.get_raw_actions()).intersection(valid_actions)) > 0]
+            inputs_matrix = numpy.asarray(inputs_matrix)[pending]
+            if is_training: # the bids for the training points are shared by all teams with the same programs
+                pending_point_ids = [point_ids[index] for index in pending]
+                bids = numpy.array([program.execute_batch(inputs_matrix, pending_point_ids) 
+                    for program in valid_programs])
+            else:
+                bids = numpy.array([program.execute_batch(inputs_matrix) for program in valid_programs])
+            selected_indeces = numpy.argmax(bids, axis = 0) # the first highest bid, as in _select_program()
+            for index, selected_index in zip(pending, selected_indeces):
+                selected_program = valid_programs[selected_index]
+                outputs[index] = selected_program.action
+                if is_training:
+                    if Config.RESTRICTIONS['use_memmory_for_actions']:
+                        self.memory_actions_per_points_[point_ids[index]] = selected_program.action
+                    if selected_program not in self.active_programs_:
+                        self.active_programs_.append(selected_program)
+                else:
+                    self.last_selected_program_ = selected_program.program_id_
+                    if selected_program not in self.validation_active_programs_:
+                        self.validation_active_programs_.append(selected_program)
+
+        if is_training and Config.RESTRICTIONS['use_memmory_for_actions']:
+            outputs = [self.memory_actions_per_points_[point_id] for point_id in point_ids]
+        return outputs
+
     def _actions_are_available(self, valid_actions):
         """
         Test if there are at least one program in the team that is able to provide a valid action
@@ -105,12 +153,13 @@ class Team(DefaultOpponent):
         """
         partial_outputs = []
         valid_programs = []
-        for program in self.programs:
-            actions = program.get_raw_actions()
-            possible_action = set(actions).intersection(valid_actions)
-            if len(possible_action) > 0:
-                partial_outputs.append(program.execute(inputs, force_reset))
-                valid_programs.append(program)
+        with numpy.errstate(all = 'ignore'): # the operations of the programs handle all errors
+            for program in self.programs:
+                actions = program.get_raw_actions()
+                possible_action = set(actions).intersection(valid_actions)
+                if len(possible_action) > 0:
+                    partial_outputs.append(program.execute(inputs, force_reset))
+                    valid_programs.append(program)
         selected_program = valid_programs[partial_outputs.index(max(partial_outputs))]
         return selected_program
 
@@ -148,14 +197,41 @@ class Team(DefaultOpponent):
                 if mutation_chance <= Config.USER['training_parameters']['mutation']['team']['mutate_program']:
                     to_mutate.append(program)
         for program in to_mutate:
-            clone = Program(self.generation, copy.deepcopy(program.instructions), program.action)
-            clone.mutate()
+            clone = program.clone(self.generation)
+            budget = self._instructions_budget_left()
+            if budget is not None: # the clone will probably replace the program, but the team may be above the budget
+                budget = max(0, budget+program.total_effective_instructions())
+            clone.mutate(max_effective_instructions = budget)
             self._add_program(clone)
             programs_population.append(clone)
             if self._is_ok_to_remove(program):
                 self.remove_program(program)
+
+        if Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions'] is not None:
+            self._remove_programs_above_instructions_budget()
         return programs_population
 
+    def _instructions_budget_left(self):
+        """
+        Return how many instructions (without introns) can still be added to the team, or None if 
+        there is no ['bloat_control']['max_team_instructions'].
+        """
+        max_instructions = Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions']
+        if max_instructions is None:
+            return None
+        return max_instructions - self.total_effective_instructions()
+
+    def _remove_programs_above_instructions_budget(self):
+        """
+        Remove the biggest programs while the team is above the instructions budget, as long as 
+        ['team_size']['min'] distinct actions are kept.
+        """
+        while self._instructions_budget_left() < 0:
+            candidates = [program for program in self.programs if self._is_ok_to_remove(program)]
+            if len(candidates) == 0:
+                return
+            self.remove_program(max(candidates, key = lambda program: program.total_effective_instructions()))
+
     def _randomly_remove_program(self):
         """
         Remove a program from the team. A program can be removed only if removing it will 
@@ -177,7 +253,46 @@ class Team(DefaultOpponent):
     def _randomly_add_program(self, programs_population):
         candidate_program = random.choice(programs_population)
         if candidate_program not in self.programs:
-            self._add_program(candidate_program)
+            budget = self._instructions_budget_left()
+            if budget is None or candidate_program.total_effective_instructions() <= budget:
+                self._add_program(candidate_program)
+
+    def total_effective_instructions(self):
+        """
+        The total of instructions without introns in the programs of the team, ie. the cost to evaluate 
+        the team for each input.
+        """
+        return sum([program.total_effective_instructions() for program in self.programs])
+
+    def selection_fitness(self):
+        """
+        The fitness used by the selection: the fitness minus the ['bloat_control']['size_penalty'] for 
+        each instruction without introns.
+        """
+        size_penalty = Config.USER['advanced_training_parameters']['bloat_control']['size_penalty']
+        if size_penalty == 0.0:
+            return self.fitness_
+        return self.fitness_ - size_penalty*self.total_effective_instructions()
+
+    def parsimony_size(self):
+        """
+        The size used to break the ties in selection (lexicographic parsimony pressure), always 0 if 
+        ['bloat_control']['parsimony_tie_breaking'] is disabled.
+        """
+        if Config.USER['advanced_training_parameters']['bloat_control']['parsimony_tie_breaking']:
+            return self.total_effective_instructions()
+        return 0
+
+    def played_matches(self):
+        """
+        Return the results and encodings of the training matches already played, per point and per
+        opponent. They are only reused while the team has the same programs.
+        """
+        programs = [program.program_id_ for program in self.programs]
+        if programs != self.matches_programs_:
+            self.matches_per_points_ = {}
+            self.matches_programs_ = programs
+        return self.matches_per_points_
 
     def remove_program(self, program):
         program.remove_team(self)
@@ -195,7 +310,7 @@ class Team(DefaultOpponent):
             p.remove_team(self)
 
     def prune_partial(self):
-        inactive_programs = list(set(self.programs) - set(self.active_programs_))
+        inactive_programs = [p for p in self.programs if p not in self.active_programs_]
         while len(inactive_programs) > 0:
             candidate_to_remove = random.choice(inactive_programs)
             if self._is_ok_to_remove(candidate_to_remove):
@@ -205,7 +320,7 @@ class Team(DefaultOpponent):
                 inactive_programs.remove(candidate_to_remove)
 
     def prune_total(self):
-        inactive_programs = list(set(self.programs) - set(self.active_programs_))
+        inactive_programs = [p for p in self.programs if p not in self.active_programs_]
         for program in inactive_programs:
             self.remove_program(program)
 
@@ -278,7 +393,7 @@ class Team(DefaultOpponent):
         for p in self.active_programs_:
             text += "\n"+str(p)
         text += "\n\n\n######## PROGRAMS (INACTIVE)"
-        inactive_programs = list(set(self.programs) - set(self.active_programs_))
+        inactive_programs = [p for p in self.programs if p not in self.active_programs_]
         if inactive_programs:
             for p in inactive_programs:
                 text += "\n"+str(p)
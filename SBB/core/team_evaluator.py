@@ -0,0 +1,213 @@
+import os
+import select
+import random
+import traceback
+import numpy
+import cPickle
+import multiprocessing
+from distributed_coordinator import DistributedCoordinator
+from ..utils.helpers import derive_seed
+from ..config import Config
+
+# set before the workers are forked, so the child processes inherit the populations without copying them
+_shared_evaluation_arguments = {}
+
+def _evaluate_team_in_child_process(index):
+    environment = _shared_evaluation_arguments['environment']
+    teams_population = _shared_evaluation_arguments['teams_population']
+    mode = _shared_evaluation_arguments['mode']
+    seed = _shared_evaluation_arguments['seed']
+    return TeamEvaluator.evaluate_team(environment, teams_population[index], mode, seed)
+
+class TeamEvaluator:
+    """
+    Evaluates the teams for training using the mode defined in 'parallelism' in the CONFIG:
+    - 'serial': the teams are evaluated one after the other in the current process.
+    - 'pool': the teams are evaluated by a multiprocessing pool.
+    - 'fork': the teams are evaluated by child processes created with os.fork(), that send their
+    results back using pipes.
+    - 'distributed': the teams are evaluated by worker processes, that may run in other hosts,
+    connected to a coordinator via TCP (see DistributedCoordinator).
+
+    In all modes each team is evaluated with its own random stream. In the parallel modes each team is evaluated in a new process forked from the current one, so it
+    inherits the populations and the environment already set up for the generation, and it doesn't
+    see the changes done by the evaluations of the other teams. Only the attributes set by the
+    evaluation are sent back and merged into the teams of the current process, in the order of the
+    population, so the results are the same for any number of workers. The changes done by the
+    evaluations in the environment (ie. in the opponents) are merged the same way (see 
+    evaluation_state() in the environments).
+    """
+
+    coordinator_ = None # used by the 'distributed' mode, kept between the generations
+
+    @staticmethod
+    def evaluate(environment, teams_population, mode):
+        parallelism = Config.USER['advanced_training_parameters']['parallelism']
+        seed = random.randint(0, Config.RESTRICTIONS['max_seed']) # so the runs are still reproducible by seed
+        if parallelism['mode'] == 'serial' or len(teams_population) < 2:
+            # restore the random state after the evaluations, as if they were executed in other processes
+            random_state = random.getstate()
+            numpy_random_state = numpy.random.get_state()
+            for team in teams_population:
+                TeamEvaluator.evaluate_team(environment, team, mode, seed)
+            random.setstate(random_state)
+            numpy.random.set_state(numpy_random_state)
+            return
+
+        workers = TeamEvaluator.total_workers()
+        _shared_evaluation_arguments['environment'] = environment
+        _shared_evaluation_arguments['teams_population'] = teams_population
+        _shared_evaluation_arguments['mode'] = mode
+        _shared_evaluation_arguments['seed'] = seed
+        try:
+            if parallelism['mode'] == 'pool':
+                results = TeamEvaluator._evaluate_with_pool(len(teams_population), workers)
+            elif parallelism['mode'] == 'distributed':
+                results = TeamEvaluator._evaluate_with_coordinator(environment, teams_population, mode, 
+                    seed, workers)
+            else:
+                results = TeamEvaluator._evaluate_with_fork(len(teams_population), workers)
+        finally:
+            _shared_evaluation_arguments.clear()
+        for team, result in zip(teams_population, results):
+            TeamEvaluator.merge_result(environment, team, result)
+
+    @staticmethod
+    def total_workers():
+        workers = Config.USER['advanced_training_parameters']['parallelism']['workers']
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        return workers
+
+    @staticmethod
+    def close():
+        """
+        Stop the workers of the 'distributed' mode, if there are any.
+        """
+        if TeamEvaluator.coordinator_ is not None:
+            TeamEvaluator.coordinator_.close()
+            TeamEvaluator.coordinator_ = None
+
+    @staticmethod
+    def _evaluate_with_coordinator(environment, teams_population, mode, seed, workers):
+        """
+        The coordinator is kept between the generations, so the workers stay connected.
+        """
+        distributed = Config.USER['advanced_training_parameters']['parallelism']['distributed']
+        address = (distributed['host'], distributed['port'])
+        if TeamEvaluator.coordinator_ is not None and TeamEvaluator.coordinator_.address_ != address:
+            TeamEvaluator.close()
+        if TeamEvaluator.coordinator_ is None:
+            TeamEvaluator.coordinator_ = DistributedCoordinator(distributed['host'], distributed['port'], 
+                workers, distributed['heartbeat_timeout'])
+        try:
+            return TeamEvaluator.coordinator_.evaluate(environment, teams_population, mode, seed)
+        except:
+            TeamEvaluator.close() # so the workers don't wait forever
+            raise
+
+    @staticmethod
+    def evaluate_team(environment, team, mode, seed):
+        """
+        Evaluate the team with a seed derived from the team id, so the result doesn't depend on
+        the order of the evaluations or on which worker evaluated it, and return the attributes
+        that were set by the evaluation.
+        """
+        team_seed = derive_seed(seed, team.team_id_, 'evaluation')
+        random.seed(team_seed)
+        numpy.random.seed(team_seed)
+        environment.evaluate_team(team, mode)
+        result = {}
+        result['fitness'] = team.fitness_
+        result['results_per_points'] = team.results_per_points_
+        result['memory_actions_per_points'] = team.memory_actions_per_points_
+        result['active_programs'] = [program.program_id_ for program in team.active_programs_]
+        result['encodings'] = team.encodings_
+        result['extra_metrics'] = team.extra_metrics_
+        result['outputs_per_points'] = dict([(program.program_id_, program.outputs_per_points_)
+            for program in team.programs])
+        result['matches_per_points'] = team.matches_per_points_
+        result['matches_programs'] = team.matches_programs_
+        result['environment_state'] = environment.evaluation_state(team)
+        return result
+
+    @staticmethod
+    def merge_result(environment, team, result):
+        programs_by_id = dict([(program.program_id_, program) for program in team.active_programs_+team.programs])
+        team.fitness_ = result['fitness']
+        team.results_per_points_ = result['results_per_points']
+        team.memory_actions_per_points_ = result['memory_actions_per_points']
+        team.active_programs_ = [programs_by_id[program_id] for program_id in result['active_programs']]
+        team.encodings_ = result['encodings']
+        team.extra_metrics_ = result['extra_metrics']
+        for program in team.programs:
+            program.outputs_per_points_.update(result['outputs_per_points'][program.program_id_])
+        team.matches_per_points_ = result['matches_per_points']
+        team.matches_programs_ = result['matches_programs']
+        environment.merge_evaluation_state(team, result['environment_state'])
+
+    @staticmethod
+    def _evaluate_with_pool(total_teams, workers):
+        """
+        Each process of the pool evaluates only one team (maxtasksperchild = 1), and is then replaced
+        by a new process forked from the current one.
+        """
+        pool = multiprocessing.Pool(processes = workers, maxtasksperchild = 1)
+        try:
+            results = pool.map(_evaluate_team_in_child_process, range(total_teams), chunksize = 1)
+        finally:
+            pool.terminate()
+            pool.join()
+        return results
+
+    @staticmethod
+    def _evaluate_with_fork(total_teams, workers):
+        """
+        Fork one child process per team, with at most 'workers' child processes running at the same
+        time. Each child writes its pickled result to a pipe and exits.
+        """
+        results = [None] * total_teams
+        pending = range(total_teams)
+        running = {} # read file descriptor: [team index, pid, received data]
+        try:
+            while pending or running:
+                while pending and len(running) < workers:
+                    index = pending.pop(0)
+                    read_fd, write_fd = os.pipe()
+                    pid = os.fork()
+                    if pid == 0:
+                        TeamEvaluator._run_child_process(index, read_fd, write_fd)
+                    os.close(write_fd)
+                    running[read_fd] = [index, pid, []]
+                ready, _, _ = select.select(running.keys(), [], [])
+                for read_fd in ready:
+                    data = os.read(read_fd, 65536)
+                    if data:
+                        running[read_fd][2].append(data)
+                        continue
+                    index, pid, received = running.pop(read_fd)
+                    os.close(read_fd)
+                    _, status = os.waitpid(pid, 0)
+                    if status != 0 or not received:
+                        raise RuntimeError("The process that evaluated the team "
+                            +str(_shared_evaluation_arguments['teams_population'][index])+" failed.")
+                    results[index] = cPickle.loads("".join(received))
+        finally:
+            for read_fd, (index, pid, received) in running.items():
+                os.close(read_fd)
+                os.waitpid(pid, 0)
+        return results
+
+    @staticmethod
+    def _run_child_process(index, read_fd, write_fd):
+        os.close(read_fd)
+        status = 1
+        try:
+            data = cPickle.dumps(_evaluate_team_in_child_process(index), cPickle.HIGHEST_PROTOCOL)
+            with os.fdopen(write_fd, 'wb') as output:
+                output.write(data)
+            status = 0
+        except:
+            traceback.print_exc()
+        finally:
+            os._exit(status) # dont run the cleanup of the parent process
@@ -6,6 +6,7 @@ from classification_point import ClassificationPoint
 from classification_metrics import ClassificationMetrics
 from ..default_environment import DefaultEnvironment
 from ..default_point import  reset_points_ids
+from ...core.team_evaluator import TeamEvaluator
 from ...utils.helpers import round_array, flatten
 from ...config import Config
 
@@ -17,10 +18,12 @@ class ClassificationEnvironment(DefaultEnvironment):
     def __init__(self):
         reset_points_ids()
         self.point_population_ = None
+        self.point_population_inputs_ = None
 
         train, test = self._initialize_datasets()
         self.train_population_ = self._dataset_to_points(train)
         self.test_population_ = self._dataset_to_points(test)
+        self.test_population_inputs_ = self._inputs_matrix(self.test_population_)
         self.trainset_class_distribution_ = Counter([p.output for p in self.train_population_])
         self.testset_class_distribution_ = Counter([p.output for p in self.test_population_])
 
@@ -40,6 +43,14 @@ class ClassificationEnvironment(DefaultEnvironment):
             *self.total_actions_)
         self.metrics_ = ClassificationMetrics(self)
 
+    def _inputs_matrix(self, population):
+        """
+        The (points x inputs) matrix used by the batch execution of the programs, already in the 
+        precision of the registers, so it is converted only once.
+        """
+        return numpy.array([p.inputs for p in population], 
+            dtype = Config.USER['advanced_training_parameters']['registers_precision'])
+
     def _initialize_datasets(self):
         """
         Read from file and normalize the train and tests sets.
@@ -130,6 +141,7 @@ class ClassificationEnvironment(DefaultEnvironment):
 
     def reset(self):
         self.point_population_ = None
+        self.point_population_inputs_ = None
 
     def setup(self, teams_population):
         """
@@ -156,6 +168,7 @@ class ClassificationEnvironment(DefaultEnvironment):
         sample = flatten(samples_per_class) # join samples per class
         random.shuffle(sample)
         self.point_population_ = sample
+        self.point_population_inputs_ = self._inputs_matrix(sample) # used for the batch execution
         self._check_for_bugs()
 
     def _sample_subset(self, subset, sample_size):
@@ -167,7 +180,7 @@ class ClassificationEnvironment(DefaultEnvironment):
 
     def _remove_points(self, points_to_remove, teams_population):
         """
-        Remove the points to remove from the teams, in order to save memory.
+        Remove the points to remove from the teams and from the programs, in order to save memory.
         """
         for team in teams_population:
             for point in points_to_remove:
@@ -175,6 +188,11 @@ class ClassificationEnvironment(DefaultEnvironment):
                     team.results_per_points_.pop(point.point_id_)
                 if point.point_id_ in team.memory_actions_per_points_:
                     team.memory_actions_per_points_.pop(point.point_id_)
+        programs_population = set(flatten([team.programs for team in teams_population]))
+        for program in programs_population:
+            for point in points_to_remove:
+                if point.point_id_ in program.outputs_per_points_:
+                    program.outputs_per_points_.pop(point.point_id_)
 
     def _check_for_bugs(self):
         if len(self.point_population_) != Config.USER['training_parameters']['populations']['points']:
@@ -197,14 +215,24 @@ class ClassificationEnvironment(DefaultEnvironment):
             kept_subsets = random.sample(subset, samples_per_class_to_keep) # get points that will be kept
             kept_subsets += self._sample_subset(self.trainset_per_action_[i], total_samples_per_class_to_add) # add new points
             kept_subsets_per_class.append(kept_subsets)
-            removed_subsets_per_class.append(list(set(subset) - set(kept_subsets))) # find the remvoed points
+            removed_subsets_per_class.append([point for point in subset if point not in kept_subsets]) # find the remvoed points
 
         self.samples_per_class_to_keep_ = kept_subsets_per_class
         self.samples_per_class_to_remove_ = removed_subsets_per_class
 
+    def training_state(self):
+        return {'points': [point.point_id_ for point in self.point_population_]}
+
+    def load_training_state(self, state):
+        """
+        The ids of the points are the same for all environments created with the same CONFIG.
+        """
+        points_per_id = dict([(point.point_id_, point) for point in self.train_population_])
+        self.point_population_ = [points_per_id[point_id] for point_id in state['points']]
+        self.point_population_inputs_ = self._inputs_matrix(self.point_population_)
+
     def evaluate_teams_population_for_training(self, teams_population):
-        for team in teams_population:
-            self.evaluate_team(team, Config.RESTRICTIONS['mode']['training'])
+        TeamEvaluator.evaluate(self, teams_population, Config.RESTRICTIONS['mode']['training'])
 
     def evaluate_team(self, team, mode):
         """
@@ -212,16 +240,16 @@ class ClassificationEnvironment(DefaultEnvironment):
         """
         if mode == Config.RESTRICTIONS['mode']['training']:
             population = self.point_population_
+            inputs_matrix = self.point_population_inputs_
             is_training = True
         else:
             population = self.test_population_
+            inputs_matrix = self.test_population_inputs_
             is_training = False
 
-        outputs = []
-        for point in population:
-            output = team.execute(point.point_id_, point.inputs, range(Config.RESTRICTIONS['total_raw_actions']),
-                is_training)
-            outputs.append(output)
+        outputs = team.execute_batch([point.point_id_ for point in population], inputs_matrix,
+            range(Config.RESTRICTIONS['total_raw_actions']), is_training)
+        for point, output in zip(population, outputs):
             if is_training:
                 if output == point.output:
                     result = 1 # correct
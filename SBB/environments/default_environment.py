@@ -58,5 +58,35 @@ class DefaultEnvironment(object):
         - All teams go against the validation set, and then the best one go against the champion set
         """
 
+    def training_state(self):
+        """
+        Return a JSON serializable description of the points (and opponents) used by 
+        evaluate_team() for training in the current generation. Used by the 'distributed' 
+        parallelism, to set up the environments of the workers with load_training_state().
+        """
+        raise NotImplementedError("The environment doesn't support the 'distributed' parallelism.")
+
+    def load_training_state(self, state):
+        """
+        Set up the environment to evaluate teams for training with the points (and opponents) 
+        described by training_state(), in an environment created with the same CONFIG.
+        """
+        raise NotImplementedError("The environment doesn't support the 'distributed' parallelism.")
+
+    def evaluation_state(self, team):
+        """
+        Return a JSON serializable description of the changes done by evaluate_team() for training 
+        in the environment (ie. in the opponents), besides the attributes of the team. Used by the 
+        parallel modes of 'parallelism', that evaluate the team in another process, to apply the 
+        changes to the environment of the current process with merge_evaluation_state().
+        """
+        return None
+
+    def merge_evaluation_state(self, team, state):
+        """
+        Apply the changes described by evaluation_state() for the team.
+        """
+        pass
+
     def hall_of_fame(self):
         return []
\ No newline at end of file
@@ -49,6 +49,12 @@ class DefaultMetrics(object):
             run_info.global_fitness_per_diversity_per_generation_[previous_diversity].append(mean_fitness)
             run_info.novelty_type_per_generation_.append(Config.USER['advanced_training_parameters']['diversity']['metrics'].index(previous_diversity))
 
+        programs = set(flatten([team.programs for team in teams_population]))
+        fingerprints = set([program.fingerprint() for program in programs])
+        run_info.duplicated_programs_rate_per_generation_.append(round_value(1.0-len(fingerprints)/float(len(programs)), 3))
+        run_info.mean_evaluation_cost_per_generation_.append(round_value(numpy.mean([team.total_effective_instructions() 
+            for team in teams_population]), 3))
+
     def store_per_validation_metrics(self, run_info, best_team, teams_population, programs_population, current_generation):
         run_info.train_score_per_validation_.append(best_team.fitness_)
         run_info.champion_score_per_validation_.append(best_team.score_champion_)
@@ -116,6 +122,8 @@ class DefaultMetrics(object):
 
         print
         print "Global Fitness (last 10 gen.): "+str(run_info.global_mean_fitness_per_generation_[-10:])
+        print "Duplicated Programs Rate (last 10 gen.): "+str(run_info.duplicated_programs_rate_per_generation_[-10:])
+        print "Mean Evaluation Cost (last 10 gen.): "+str(run_info.mean_evaluation_cost_per_generation_[-10:])
                
         if len(Config.USER['advanced_training_parameters']['diversity']['metrics']) > 0:
             print "Global Diversity (last 10 gen.):"
@@ -14,6 +14,7 @@ class DefaultPoint(object):
     Encapsulates a value from the environment as a point.
     """
     __metaclass__  = abc.ABCMeta
+    __slots__ = ('point_id_', 'age_') # subclasses without __slots__ still have a __dict__
 
     def __init__(self):
         self.point_id_ = get_point_id()
@@ -0,0 +1,31 @@
+import importlib
+from ..config import Config
+
+# name: [module, class name], the modules are imported only when the environment is used
+_environments = {}
+
+def register_environment(name, module, class_name, task = 'reinforcement'):
+    """
+    Register an environment, so it can be used by SBB without changing sbb.py. The 'module' may
+    be relative to this package (ie. '.poker.poker_environment') or absolute (ie.
+    'my_package.my_environment'), and it is only imported when the environment is initialized.
+
+    The reinforcement environments are selected by the 'environment' in 'reinforcement_parameters'
+    in the CONFIG, and the classification environment by the 'task'.
+    """
+    _environments[name] = [module, class_name]
+    if task == 'reinforcement' and name not in Config.RESTRICTIONS['environment_types']:
+        Config.RESTRICTIONS['environment_types'].append(name)
+
+def get_environment_class(name):
+    if name not in _environments:
+        raise ValueError("No environment exists for "+str(name))
+    module, class_name = _environments[name]
+    return getattr(importlib.import_module(module, __name__.rsplit('.', 1)[0]), class_name)
+
+register_environment('classification', '.classification.classification_environment', 'ClassificationEnvironment',
+    task = 'classification')
+register_environment('tictactoe', '.reinforcement.tictactoe.tictactoe_environment', 'TictactoeEnvironment')
+register_environment('poker', '.reinforcement.poker.poker_environment', 'PokerEnvironment')
+register_environment('sockets', '.reinforcement.sockets.reinforcement_with_sockets_environment',
+    'ReinforcementEnvironmentWithSockets')
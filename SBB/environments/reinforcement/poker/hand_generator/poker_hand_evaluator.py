@@ -0,0 +1,123 @@
+import numpy
+from poker_hands_converter import card_to_code
+
+# the value of a hand is: category << 26 | primary << 13 | secondary, where primary and secondary
+# are masks of ranks (bit i is the i-th rank), so the masks with the same number of ranks are
+# ordered by their highest ranks, and a higher value is always a better hand
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+
+TOTAL_RANKS = 13
+TOTAL_SUITS = 4
+TOTAL_MASKS = 1 << TOTAL_RANKS
+RANK_BITS = 1 << numpy.arange(TOTAL_RANKS, dtype = numpy.int64)
+
+def _build_tables():
+    popcount = numpy.zeros(TOTAL_MASKS, dtype = numpy.int64)
+    top = dict([(k, numpy.zeros(TOTAL_MASKS, dtype = numpy.int64)) for k in [1, 2, 3, 5]])
+    straight = numpy.zeros(TOTAL_MASKS, dtype = numpy.int64) # mask of the highest rank of the best straight, or 0
+    straights = [(0b11111 << low, 1 << (low+4)) for low in range(TOTAL_RANKS-4)]
+    straights.insert(0, (0b1000000001111, 1 << 3)) # A-2-3-4-5, the ace is the lowest card
+    for mask in range(TOTAL_MASKS):
+        ranks = [rank for rank in reversed(range(TOTAL_RANKS)) if mask & (1 << rank)]
+        popcount[mask] = len(ranks)
+        for k in top:
+            top[k][mask] = sum([1 << rank for rank in ranks[:k]])
+        for straight_mask, high in straights:
+            if mask & straight_mask == straight_mask:
+                straight[mask] = high
+    return popcount, top, straight
+
+POPCOUNT, TOP, STRAIGHT_HIGH = _build_tables()
+
+class PokerHandEvaluator():
+    """
+    Evaluator of poker hands with 5 to 7 cards, using only numpy. The hands are evaluated in
+    batches, so all the hands of the opponents (or all the boards to come) are evaluated at once.
+
+    The values follow the same order of pokereval.evaln(), so the metrics calculated with them are
+    the same (see PokerMetricsCalculator.cross_check()).
+    """
+
+    CHUNK_SIZE = 65536 # hands evaluated at a time, to limit the memory used by large batches
+
+    @staticmethod
+    def evaluate(cards):
+        """
+        Evaluate a single hand, as a list of cards (ie. ['As', 'Td', ...]).
+        """
+        codes = numpy.array([[card_to_code(card) for card in cards]], dtype = numpy.int64)
+        return int(PokerHandEvaluator.evaluate_codes(codes)[0])
+
+    @staticmethod
+    def evaluate_codes(codes):
+        """
+        Evaluate an array of hands with shape (total hands, cards per hand), with the cards as the
+        codes of card_to_code().
+        """
+        codes = numpy.asarray(codes, dtype = numpy.int64)
+        values = numpy.empty(len(codes), dtype = numpy.int64)
+        for start in range(0, len(codes), PokerHandEvaluator.CHUNK_SIZE):
+            end = start+PokerHandEvaluator.CHUNK_SIZE
+            values[start:end] = PokerHandEvaluator._evaluate_chunk(codes[start:end])
+        return values
+
+    @staticmethod
+    def _evaluate_chunk(codes):
+        total_hands, total_cards = codes.shape
+        ranks = codes/TOTAL_SUITS
+        suits = codes%TOTAL_SUITS
+        hands = numpy.arange(total_hands)
+
+        counts = numpy.zeros((total_hands, TOTAL_RANKS), dtype = numpy.int64)
+        suit_masks = numpy.zeros((total_hands, TOTAL_SUITS), dtype = numpy.int64)
+        for card in range(total_cards):
+            counts[hands, ranks[:, card]] += 1
+            suit_masks[hands, suits[:, card]] |= RANK_BITS[ranks[:, card]]
+        mask1 = (counts >= 1).dot(RANK_BITS)
+        mask2 = (counts >= 2).dot(RANK_BITS)
+        mask3 = (counts >= 3).dot(RANK_BITS)
+        mask4 = (counts >= 4).dot(RANK_BITS)
+
+        # with at most 7 cards there is at most one suit with 5 cards or more
+        flush_mask = numpy.where(POPCOUNT[suit_masks] >= 5, suit_masks, 0).max(axis = 1)
+        straight_flush_high = STRAIGHT_HIGH[flush_mask]
+        straight_high = STRAIGHT_HIGH[mask1]
+        pairs = POPCOUNT[mask2]
+        trips = TOP[1][mask3]
+        two_pairs = TOP[2][mask2]
+
+        conditions = [
+            straight_flush_high > 0,
+            mask4 > 0,
+            (mask3 > 0) & (pairs >= 2),
+            flush_mask > 0,
+            straight_high > 0,
+            mask3 > 0,
+            pairs >= 2,
+            mask2 > 0,
+        ]
+        categories = [STRAIGHT_FLUSH, QUADS, FULL_HOUSE, FLUSH, STRAIGHT, TRIPS, TWO_PAIR, PAIR]
+        primaries = [
+            straight_flush_high,
+            mask4,
+            trips,
+            TOP[5][flush_mask],
+            straight_high,
+            trips,
+            two_pairs,
+            mask2,
+        ]
+        secondaries = [
+            0,
+            TOP[1][mask1 & ~mask4],
+            TOP[1][mask2 & ~trips],
+            0,
+            0,
+            TOP[2][mask1 & ~trips],
+            TOP[1][mask1 & ~two_pairs],
+            TOP[3][mask1 & ~mask2],
+        ]
+        category = numpy.select(conditions, categories, default = HIGH_CARD)
+        primary = numpy.select(conditions, primaries, default = TOP[5][mask1])
+        secondary = numpy.select(conditions, secondaries, default = 0)
+        return (category << 26) | (primary << 13) | secondary
@@ -1,24 +1,17 @@
 import os
 import json
-import socket
+import time
 import random
+import multiprocessing
+from optparse import OptionParser
 from poker_metrics_calculator import PokerMetricsCalculator
+from poker_hands_converter import convert_hands_file
+from poker_metrics_cache import PokerMetricsCache
 from ..match_state import MatchState
 from ..poker_config import PokerConfig
 from .....utils.helpers import round_value
 from .....config import Config
 
-def available_ports():
-    socket_tmp1 = socket.socket()
-    socket_tmp1.bind(('', 0))
-    socket_tmp2 = socket.socket()
-    socket_tmp2.bind(('', 0))
-    port1 = socket_tmp1.getsockname()[1]
-    port2 = socket_tmp2.getsockname()[1]
-    socket_tmp1.close()
-    socket_tmp2.close()
-    return port1, port2
-
 def set_metrics(point, round_id, full_deck, key):
     s = PokerMetricsCalculator.calculate_hand_strength(point[key]['hc'], point['bc'], full_deck)
     if round_id == 1 or round_id == 2:
@@ -31,7 +24,7 @@ def set_metrics(point, round_id, full_deck, key):
     point[key]['ep'][round_id] = round_value(ep*Config.RESTRICTIONS['multiply_normalization_by'], 3)
     return point
 
-def initialize_metrics(seed, port_pos0, port_pos1, full_deck):
+def initialize_metrics(seed, full_deck):
     seeded_deck = PokerMetricsCalculator.initialize_deck()
     random.seed(seed)
     random.shuffle(seeded_deck)
@@ -78,43 +71,191 @@ def get_hand_strength_label(value):
         return 1
     return 2
 
-def generate_poker_hands(from_seed, to_seed):
-    path = "hands_generated/hands"+str(to_seed)
+def generate_hands_for_seeds(from_seed, to_seed, full_deck):
+    """
+    Return the hands for the seeds, as (label, hand) pairs in the order they are written to the
+    files of hands (for each seed, the hand for the position 0 and then the one for the position 1).
+    """
     index = 0
-    indeces = 9
-    mapping = {'00': 0, '01': 1, '02': 2, '10': 3, '11': 4, '12': 5, '20': 6, '21': 7, '22': 8}
-
-    print "starting"
-    full_deck = PokerMetricsCalculator.initialize_deck()
-    port0, port1 = available_ports()
-    if not os.path.exists('hands_generated'):
-        os.makedirs('hands_generated')
-    if not os.path.exists(path):
-        os.makedirs(path)
-    files = []
-    for x in range(indeces):
-        files.append(open(path+'/hands_type_'+str(x)+'.json','a'))
+    mapping = PokerConfig.CONFIG['label_mapping']
+    hands = []
     for seed in range(from_seed, to_seed):
-        point_pos0, point_pos1 = initialize_metrics(seed, port0, port1, full_deck)
+        point_pos0, point_pos1 = initialize_metrics(seed, full_deck)
         point_pos0['id'] = seed
         point_pos1['id'] = seed
-        label0_player = get_hand_strength_label(point_pos0['p']['str'][index])
-        label0_opp = get_hand_strength_label(point_pos0['o']['str'][index])
-        label1_player = get_hand_strength_label(point_pos1['p']['str'][index])
-        label1_opp = get_hand_strength_label(point_pos1['o']['str'][index])
-        label0 = str(label0_player)+str(label0_opp)
-        label1 = str(label1_player)+str(label1_opp)
-        print str(label0)+","+str(mapping[label0])+": "+str(point_pos0)
-        print str(label1)+","+str(mapping[label1])+": "+str(point_pos1)
-        print "#"
-        files[mapping[label0]].write(json.dumps(point_pos0)+'\n')
-        files[mapping[label1]].write(json.dumps(point_pos1)+'\n')
-        print "#"
-    for f in files:
-        f.close()
+        for point in [point_pos0, point_pos1]:
+            label_player = get_hand_strength_label(point['p']['str'][index])
+            label_opp = get_hand_strength_label(point['o']['str'][index])
+            hands.append((mapping[str(label_player)+str(label_opp)], point))
+    return hands
+
+def _initialize_worker(cache_path):
+    if cache_path is not None:
+        PokerMetricsCalculator.cache_ = PokerMetricsCache(cache_path)
+
+def _generate_shard(arguments):
+    """
+    Generate the hands of a range of seeds in a file of the 'shards' folder, one 'label<tab>hand'
+    per line. The file is written with another name and then renamed, so an interrupted shard is 
+    never seen as finished.
+
+    Return the shard and the entries added to the cache of metrics of the worker, with its hits
+    and misses, so they are saved by the main process.
+    """
+    path, from_seed, to_seed = arguments
+    full_deck = PokerMetricsCalculator.initialize_deck()
+    hands = generate_hands_for_seeds(from_seed, to_seed, full_deck)
+    filename = _shard_filename(path, from_seed, to_seed)
+    with open(filename+'.tmp', 'w') as shard_file:
+        for label, hand in hands:
+            shard_file.write(str(label)+'\t'+json.dumps(hand)+'\n')
+    os.rename(filename+'.tmp', filename)
+    cache = PokerMetricsCalculator.cache_
+    if cache is None:
+        return (from_seed, to_seed), {}, 0, 0
+    result = (from_seed, to_seed), cache.new_entries_, cache.hits_, cache.misses_
+    cache.new_entries_ = {}
+    cache.hits_ = 0
+    cache.misses_ = 0
+    return result
+
+def _shard_filename(path, from_seed, to_seed):
+    return path+'/shards/shard_'+str(from_seed)+'_'+str(to_seed)+'.json'
+
+def _load_manifest(path, from_seed, to_seed, shard_size):
+    """
+    The manifest has the finished shards, so an interrupted generation skips them when it is
+    executed again with the same parameters.
+    """
+    manifest = {'from_seed': from_seed, 'to_seed': to_seed, 'shard_size': shard_size, 'finished_shards': []}
+    manifest_path = path+'/manifest.json'
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as manifest_file:
+            saved_manifest = json.load(manifest_file)
+        for key in ['from_seed', 'to_seed', 'shard_size']:
+            if saved_manifest[key] != manifest[key]:
+                raise ValueError("The hands in '"+path+"' were generated with "+key+" = "
+                    +str(saved_manifest[key])+", instead of "+str(manifest[key])+".")
+        manifest['finished_shards'] = [tuple(shard) for shard in saved_manifest['finished_shards']
+            if os.path.exists(_shard_filename(path, shard[0], shard[1]))]
+    return manifest
+
+def _save_manifest(path, manifest):
+    with open(path+'/manifest.json.tmp', 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.rename(path+'/manifest.json.tmp', path+'/manifest.json')
+
+def merge_shards(path, manifest, total_labels, binary = False):
+    """
+    Write the hands of all shards to the files of hands per label, in the order of the seeds (so
+    the files are the same for any number of workers), and also to .npy files if 'binary' is True.
+    """
+    files = [open(path+'/hands_type_'+str(label)+'.json', 'w') for label in range(total_labels)]
+    try:
+        for from_seed, to_seed in sorted(manifest['finished_shards']):
+            with open(_shard_filename(path, from_seed, to_seed)) as shard_file:
+                for line in shard_file:
+                    label, hand = line.split('\t', 1)
+                    files[int(label)].write(hand)
+    finally:
+        for f in files:
+            f.close()
+    if binary:
+        for label in range(total_labels):
+            convert_hands_file(path+'/hands_type_'+str(label)+'.json', path+'/hands_type_'+str(label)+'.npy')
+
+def generate_poker_hands(from_seed, to_seed, path = None, workers = None, shard_size = 100, binary = False, 
+        cache_path = None):
+    """
+    Generate the hands for the seeds in range(from_seed, to_seed) with 'workers' processes (all
+    cores, if None), split in shards of 'shard_size' seeds. If the generation is interrupted, run 
+    it again with the same parameters to generate only the shards that weren't finished.
+
+    If 'cache_path' is set, the hand strengths and potentials are read from and saved to a 
+    PokerMetricsCache in that file, that may be shared by all generations.
+    """
+    if path is None:
+        path = "hands_generated/hands"+str(to_seed)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    total_labels = len(PokerConfig.CONFIG['label_mapping'])
+    if not os.path.exists(path+'/shards'):
+        os.makedirs(path+'/shards')
+    manifest = _load_manifest(path, from_seed, to_seed, shard_size)
+    shards = [(seed, min(seed+shard_size, to_seed)) for seed in range(from_seed, to_seed, shard_size)]
+    pending = [shard for shard in shards if shard not in manifest['finished_shards']]
+    print "starting: "+str(len(pending))+" of "+str(len(shards))+" shards to generate, with "+str(workers)+" workers"
+    cache = PokerMetricsCache(cache_path) if cache_path is not None else None
+    if pending:
+        pool = multiprocessing.Pool(processes = workers, initializer = _initialize_worker, initargs = (cache_path,))
+        try:
+            arguments = [(path, shard[0], shard[1]) for shard in pending]
+            for shard, new_entries, hits, misses in pool.imap_unordered(_generate_shard, arguments):
+                if cache is not None:
+                    cache.update(new_entries)
+                    cache.hits_ += hits
+                    cache.misses_ += misses
+                    cache.save() # only the new entries, they are merged to the cache file at the end
+                manifest['finished_shards'].append(shard)
+                _save_manifest(path, manifest)
+                print "finished shard "+str(shard)+" ("+str(len(manifest['finished_shards']))+"/"+str(len(shards))+")"
+        finally:
+            pool.terminate()
+            pool.join()
+    _save_manifest(path, manifest)
+    merge_shards(path, manifest, total_labels, binary)
+    if cache is not None:
+        cache.merge()
+        print "cache of metrics: "+str(cache)
+
+def cross_check_hands(json_path, total_hands = None):
+    """
+    Calculate again the metrics of the hands in a file of hands (ie. generated with pokereval by
+    a previous version of PokerMetricsCalculator), and return the number of hands with different
+    metrics.
+    """
+    full_deck = PokerMetricsCalculator.initialize_deck()
+    checked = 0
+    mismatches = 0
+    with open(json_path) as hands_file:
+        for line in hands_file:
+            if total_hands is not None and checked == total_hands:
+                break
+            expected = json.loads(line)
+            points = initialize_metrics(expected['id'], full_deck)
+            point = points[expected['pos']]
+            point['id'] = expected['id']
+            if point != expected:
+                mismatches += 1
+                print "Mismatch for the hand "+str(expected['id'])+":\nexpected: "+str(expected)+"\nresult: "+str(point)
+            checked += 1
+    print "Checked "+str(checked)+" hands, "+str(mismatches)+" mismatches"
+    return mismatches
 
 if __name__ == "__main__":
+    # run from the root folder with: python -m SBB.environments.reinforcement.poker.hand_generator.poker_hand_generator
+    parser = OptionParser()
+    parser.add_option("--from_seed", dest="from_seed", type="int", default=20000)
+    parser.add_option("--to_seed", dest="to_seed", type="int", default=25000)
+    parser.add_option("--path", dest="path", help="output folder (default: hands_generated/hands[to_seed])")
+    parser.add_option("--workers", dest="workers", type="int", help="number of processes (default: all cores)")
+    parser.add_option("--shard_size", dest="shard_size", type="int", default=100, help="seeds per shard")
+    parser.add_option("--binary", dest="binary", action="store_true", default=False,
+                      help="also write the hands as .npy files (see poker_hands_converter.py)")
+    parser.add_option("--cache", dest="cache_path", default="hands_generated/metrics_cache.json",
+                      help="file of the cache of hand strengths and potentials, shared by all generations")
+    parser.add_option("--no_cache", dest="cache_path", action="store_const", const=None, 
+                      help="don't use the cache of hand strengths and potentials")
+    parser.add_option("--cross_check", dest="cross_check", metavar="FILE",
+                      help="instead of generating hands, compare the hands in FILE with the hands generated again from their seeds")
+    parser.add_option("--total_hands", dest="total_hands", type="int", help="number of hands to cross check (default: all)")
+    (options, args) = parser.parse_args()
+
     start_time = time.time()
-    generate_poker_hands(from_seed=20000, to_seed=25000)
+    if options.cross_check:
+        cross_check_hands(options.cross_check, options.total_hands)
+    else:
+        generate_poker_hands(options.from_seed, options.to_seed, options.path, options.workers, 
+            options.shard_size, options.binary, options.cache_path)
     elapsed_time = round_value((time.time() - start_time)/60.0)
-    print("\nFinished, elapsed time: "+str(elapsed_time)+" mins")
\ No newline at end of file
+    print("\nFinished, elapsed time: "+str(elapsed_time)+" mins")
@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import numpy
+from ..poker_config import PokerConfig
+
+# one row per hand, with the same values of a line in the .json files
+HANDS_DTYPE = numpy.dtype([
+    ('id', numpy.int32),
+    ('pos', numpy.uint8),
+    ('bc', numpy.uint8, 5), # board cards, as card codes
+    ('p_hc', numpy.uint8, 2), # hole cards of the player, as card codes
+    ('p_str', numpy.float64, 4), # hand strength of the player per round
+    ('p_ep', numpy.float64, 4), # effective potential of the player per round
+    ('o_hc', numpy.uint8, 2),
+    ('o_str', numpy.float64, 4),
+    ('o_ep', numpy.float64, 4),
+])
+
+def card_to_code(card):
+    return (PokerConfig.CONFIG['ranks'].index(card[0])*len(PokerConfig.CONFIG['suits'])
+        + PokerConfig.CONFIG['suits'].index(card[1]))
+
+def code_to_card(code):
+    total_suits = len(PokerConfig.CONFIG['suits'])
+    return PokerConfig.CONFIG['ranks'][code/total_suits]+PokerConfig.CONFIG['suits'][code%total_suits]
+
+def hand_to_row(hand):
+    """
+    Return the hand, in the format of the .json files, as a tuple with the fields of HANDS_DTYPE.
+    """
+    row = [hand['id'], hand['pos'], [card_to_code(card) for card in hand['bc']]]
+    for key in ['p', 'o']:
+        row += [[card_to_code(card) for card in hand[key]['hc']], hand[key]['str'], hand[key]['ep']]
+    return tuple(row)
+
+def row_to_hand(row):
+    """
+    Return the hand in the same format of the .json files, as used by PokerPoint.
+    """
+    hand = {}
+    hand['id'] = int(row['id'])
+    hand['pos'] = int(row['pos'])
+    hand['bc'] = [code_to_card(code) for code in row['bc']]
+    for key in ['p', 'o']:
+        hand[key] = {}
+        hand[key]['hc'] = [code_to_card(code) for code in row[key+'_hc']]
+        hand[key]['str'] = row[key+'_str'].tolist()
+        hand[key]['ep'] = row[key+'_ep'].tolist()
+    return hand
+
+def hands_filename(label, extension):
+    return PokerConfig.CONFIG['hands_path']+"hands_type_"+str(label)+extension
+
+def convert_hands_file(json_path, npy_path):
+    with open(json_path) as json_file:
+        rows = [hand_to_row(json.loads(line)) for line in json_file if line.strip()]
+    rows = numpy.array(rows, dtype = HANDS_DTYPE)
+    numpy.save(npy_path, rows)
+    return len(rows)
+
+def load_hands(npy_path):
+    """
+    The file is memory-mapped, so only the sampled rows are read, and the pages are shared by
+    all processes that load the same file.
+    """
+    return numpy.load(npy_path, mmap_mode = 'r')
+
+def convert_all_hands(total_labels):
+    """
+    Create a .npy file for each .json file of hands in 'hands_path'. Since PokerEnvironment uses
+    the .npy files when they exist, run it again every time the .json files are changed.
+    """
+    for label in range(total_labels):
+        json_path = hands_filename(label, ".json")
+        if os.path.exists(json_path):
+            total = convert_hands_file(json_path, hands_filename(label, ".npy"))
+            print "Converted "+str(total)+" hands from "+json_path
+
+if __name__ == "__main__":
+    # run from the root folder with: python -m SBB.environments.reinforcement.poker.hand_generator.poker_hands_converter
+    if len(sys.argv) > 1:
+        PokerConfig.CONFIG['hands_path'] = sys.argv[1]
+    convert_all_hands(len(PokerConfig.CONFIG['labels_per_subdivision']['sbb_label']))
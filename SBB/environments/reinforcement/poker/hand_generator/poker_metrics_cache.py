@@ -0,0 +1,148 @@
+import os
+import json
+import fcntl
+import tempfile
+import itertools
+from poker_hands_converter import card_to_code, code_to_card
+from ..poker_config import PokerConfig
+
+SUIT_PERMUTATIONS = list(itertools.permutations(range(len(PokerConfig.CONFIG['suits']))))
+
+def canonical_cards(hole_cards, board_cards):
+    """
+    Return the hole cards and the board cards with the suits renamed so all the hands that are
+    the same except for the suits (ie. ['As', 'Ks'] + ['2d', '5d', '9h'] and ['Ah', 'Kh'] +
+    ['2s', '5s', '9d']) have the same cards. The order of the cards is ignored.
+    """
+    total_suits = len(PokerConfig.CONFIG['suits'])
+    hole_codes = [card_to_code(card) for card in hole_cards]
+    board_codes = [card_to_code(card) for card in board_cards]
+    best = None
+    for permutation in SUIT_PERMUTATIONS:
+        hole = sorted([code-code%total_suits+permutation[code%total_suits] for code in hole_codes])
+        board = sorted([code-code%total_suits+permutation[code%total_suits] for code in board_codes])
+        if best is None or (hole, board) < best:
+            best = (hole, board)
+    return [code_to_card(code) for code in best[0]], [code_to_card(code) for code in best[1]]
+
+class PokerMetricsCache():
+    """
+    Persistent cache for the metrics calculated by PokerMetricsCalculator, keyed by the metric
+    and the canonical cards (see canonical_cards()), so the metrics of hands that are the same
+    except for the suits are calculated only once, and the hands generated again (or for other
+    seeds) reuse the metrics calculated before.
+
+    The cache is a .json file, plus the .json files in the '[path].parts' folder, that are all
+    read when the cache is created. save() writes the entries added since the last save() (kept in
+    new_entries_, so the entries calculated by other processes can be added with update()) to a new
+    file in the parts folder, so its cost doesn't depend on the size of the cache, and merge() moves
+    the entries of all parts to the .json file. The merge is locked, so the entries saved by other
+    caches that use the same file are never lost.
+    """
+
+    def __init__(self, path = None):
+        self.path_ = path
+        self.entries_ = {}
+        self.new_entries_ = {}
+        self.hits_ = 0
+        self.misses_ = 0
+        if path is not None:
+            self.entries_, _ = self._read_entries()
+
+    @staticmethod
+    def key(metric, hole_cards, board_cards):
+        hole, board = canonical_cards(hole_cards, board_cards)
+        return metric+":"+"".join(hole)+"|"+"".join(board)
+
+    def get(self, key, calculate):
+        """
+        Return the value for the key, or calculate it with calculate() and add it to the cache.
+        """
+        if key in self.entries_:
+            self.hits_ += 1
+            return self.entries_[key]
+        self.misses_ += 1
+        value = calculate()
+        self.entries_[key] = value
+        self.new_entries_[key] = value
+        return value
+
+    def update(self, entries):
+        self.entries_.update(entries)
+        self.new_entries_.update(entries)
+
+    def save(self):
+        """
+        Write the new entries to a new file in the parts folder.
+        """
+        if self.path_ is None or not self.new_entries_:
+            return
+        folder = self.path_+'.parts'
+        if not os.path.exists(folder):
+            try:
+                os.makedirs(folder)
+            except OSError: # created by another cache
+                if not os.path.isdir(folder):
+                    raise
+        file_descriptor, temp_path = tempfile.mkstemp(suffix = '.tmp', dir = folder)
+        with os.fdopen(file_descriptor, 'w') as cache_file:
+            json.dump(self.new_entries_, cache_file)
+        os.rename(temp_path, temp_path[:-len('.tmp')]+'.json')
+        self.new_entries_ = {}
+
+    def merge(self):
+        """
+        Save the new entries, and move the entries of all the files in the parts folder to the 
+        .json file. It is called once per generation, since the whole file is written again.
+        """
+        if self.path_ is None:
+            return
+        self.save()
+        if not os.path.exists(self.path_+'.parts'):
+            return
+        with open(self.path_+'.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries, part_files = self._read_entries()
+                if not part_files:
+                    return
+                with open(self.path_+'.tmp', 'w') as cache_file:
+                    json.dump(entries, cache_file)
+                os.rename(self.path_+'.tmp', self.path_)
+                for part_file in part_files:
+                    os.remove(part_file)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        self.entries_.update(entries)
+
+    def _read_entries(self):
+        """
+        Return the entries in the .json file and in the parts folder, and the files of the parts. The
+        parts are read before the .json file, since another cache may be merging them to it.
+        """
+        entries = {}
+        part_files = []
+        folder = self.path_+'.parts'
+        if os.path.exists(folder):
+            for filename in sorted(os.listdir(folder)):
+                if filename.endswith('.json'):
+                    try:
+                        with open(os.path.join(folder, filename)) as cache_file:
+                            entries.update(json.load(cache_file))
+                        part_files.append(os.path.join(folder, filename))
+                    except IOError: # already merged by another cache
+                        pass
+        if os.path.exists(self.path_):
+            with open(self.path_) as cache_file:
+                entries.update(json.load(cache_file))
+        return entries, part_files
+
+    def statistics(self):
+        total = self.hits_+self.misses_
+        hit_rate = self.hits_/float(total) if total > 0 else 0.0
+        return {'entries': len(self.entries_), 'hits': self.hits_, 'misses': self.misses_, 'hit_rate': hit_rate}
+
+    def __str__(self):
+        statistics = self.statistics()
+        return ("entries: "+str(statistics['entries'])+", hits: "+str(statistics['hits'])+", misses: "
+            +str(statistics['misses'])+", hit rate: "+str(round(statistics['hit_rate']*100.0, 2))+"%")
@@ -2,12 +2,55 @@ import os
 import numpy
 import random
 import itertools
-from pokereval import PokerEval
-from tables.normalized_equity_table import NORMALIZED_HAND_EQUITY
-from tables.strenght_table_for_2cards import STRENGTH_TABLE_FOR_2_CARDS
+from tables.hole_cards_table import NORMALIZED_HAND_EQUITY, STRENGTH_TABLE_FOR_2_CARDS
+from poker_hand_evaluator import PokerHandEvaluator
+from poker_hands_converter import card_to_code
+from poker_metrics_cache import PokerMetricsCache
 from ..poker_config import PokerConfig
 
+def _codes(cards):
+    return numpy.array([card_to_code(card) for card in cards], dtype = numpy.int64)
+
+def _combinations(total, size):
+    """
+    Return all the combinations of 'size' indices in range(total), one per row, as in itertools.
+    They are created once, since the same decks sizes are used by all hands.
+    """
+    if (total, size) not in _combinations_cache:
+        combinations = numpy.array(list(itertools.combinations(range(total), size)), dtype = numpy.int64)
+        _combinations_cache[(total, size)] = combinations.reshape((-1, size))
+    return _combinations_cache[(total, size)]
+
+_combinations_cache = {}
+
+def _combination_index(combinations):
+    """
+    Return the position of each combination (with sorted indices, in the last axis) in the 
+    colexicographic order, so each combination of the same size has a distinct index.
+    """
+    index = numpy.zeros(combinations.shape[:-1], dtype = numpy.int64)
+    for position in range(combinations.shape[-1]):
+        index += BINOMIALS[combinations[..., position], position+1]
+    return index
+
+def _with_board(cards, board):
+    return numpy.concatenate([cards, numpy.tile(board, (len(cards), 1))], axis = 1)
+
+def _compare(our_ranks, opponent_ranks):
+    """
+    Return 0 where we are ahead, 1 where we are tied and 2 where we are behind the opponent.
+    """
+    return numpy.where(our_ranks > opponent_ranks, 0, numpy.where(our_ranks == opponent_ranks, 1, 2))
+
+# BINOMIALS[n, k] = n choose k, for the indices of the cards in a deck
+BINOMIALS = numpy.zeros((53, 6), dtype = numpy.int64)
+BINOMIALS[:, 0] = 1
+for n in range(1, 53):
+    BINOMIALS[n, 1:] = BINOMIALS[n-1, 1:] + BINOMIALS[n-1, :-1]
+
 class PokerMetricsCalculator():
+
+    cache_ = None # a PokerMetricsCache for the hand strengths and potentials, if set
     
     @staticmethod
     def initialize_deck():
@@ -19,13 +62,11 @@ class PokerMetricsCalculator():
 
     @staticmethod
     def initialize_hole_cards_based_on_equity():
-        deck = initialize_deck()
+        deck = PokerMetricsCalculator.initialize_deck()
         hole_cards = list(itertools.combinations(deck, 2))
-        equities = []
-        for card1, card2 in hole_cards:
-            equities.append(NORMALIZED_HAND_EQUITY[frozenset([card1, card2])])
-        total_equities = sum(equities)
-        probabilities = [e/float(total_equities) for e in equities]
+        codes = _codes(deck)[_combinations(len(deck), 2)]
+        equities = NORMALIZED_HAND_EQUITY.values(codes[:, 0], codes[:, 1])
+        probabilities = equities/equities.sum()
         hole_cards_indices = numpy.random.choice(range(len(hole_cards)), size = int(len(hole_cards)*0.3), replace = False, p = probabilities)
         final_cards = []
         for index in hole_cards_indices:
@@ -41,106 +82,89 @@ class PokerMetricsCalculator():
         our_cards_set = frozenset(our_cards)
         if len(our_cards_set) == 2:
             return STRENGTH_TABLE_FOR_2_CARDS[our_cards_set]
+        elif PokerMetricsCalculator.cache_ is not None:
+            key = PokerMetricsCache.key('strength', current_hole_cards, board_cards)
+            return PokerMetricsCalculator.cache_.get(key, 
+                lambda: PokerMetricsCalculator._calculate_hand_strength(current_hole_cards, board_cards, full_deck))
         else:
-            pokereval = PokerEval()
-            ahead = 0.0
-            tied = 0.0
-            behind = 0.0
-            our_rank = pokereval.evaln(our_cards)
-            # considers all two card combinations of the remaining cards
-
-            deck = list(full_deck)
-            for card in our_cards:
-                if card not in deck:
-                    print "Warning! Card not in deck: "+str(card)+", current_hole_cards: "+str(current_hole_cards)+", board_cards: "+str(board_cards)
-                deck.remove(card)
-            opponent_cards_combinations = itertools.combinations(deck, 2)
-
-            for opponent_card1, opponent_card2 in opponent_cards_combinations:
-                opponent_rank = pokereval.evaln([opponent_card1] + [opponent_card2] + board_cards)
-                if our_rank > opponent_rank:
-                    ahead += 1.0
-                elif our_rank == opponent_rank:
-                    tied += 1.0
-                else:
-                    behind += 1.0
-            hand_strength = (ahead + tied/2.0) / (ahead + tied + behind)
-            return hand_strength
+            return PokerMetricsCalculator._calculate_hand_strength(current_hole_cards, board_cards, full_deck)
+
+    @staticmethod
+    def _calculate_hand_strength(current_hole_cards, board_cards, full_deck):
+        our_cards = current_hole_cards + board_cards
+        for card in our_cards:
+            if card not in full_deck:
+                print "Warning! Card not in deck: "+str(card)+", current_hole_cards: "+str(current_hole_cards)+", board_cards: "+str(board_cards)
+        board = _codes(board_cards)
+        deck = _codes([card for card in full_deck if card not in our_cards])
+        our_rank = PokerHandEvaluator.evaluate_codes([_codes(our_cards)])[0]
+        # considers all two card combinations of the remaining cards
+        opponent_cards_combinations = deck[_combinations(len(deck), 2)]
+        opponent_ranks = PokerHandEvaluator.evaluate_codes(_with_board(opponent_cards_combinations, board))
+        ahead = float(numpy.sum(our_rank > opponent_ranks))
+        tied = float(numpy.sum(our_rank == opponent_ranks))
+        behind = float(numpy.sum(our_rank < opponent_ranks))
+        hand_strength = (ahead + tied/2.0) / (ahead + tied + behind)
+        return hand_strength
 
     @staticmethod
     def calculate_hand_potential_without_heuristics(current_hole_cards, board_cards, round_id, full_deck):
         """
         Implemented as described in the page 23 of the thesis in: http://poker.cs.ualberta.ca/publications/davidson.msc.pdf
         """
+        if PokerMetricsCalculator.cache_ is not None:
+            key = PokerMetricsCache.key('potential', current_hole_cards, board_cards)
+            return PokerMetricsCalculator.cache_.get(key, lambda: PokerMetricsCalculator._calculate_hand_potential(
+                current_hole_cards, board_cards, round_id, full_deck))
+        return PokerMetricsCalculator._calculate_hand_potential(current_hole_cards, board_cards, round_id, full_deck)
+
+    @staticmethod
+    def _calculate_hand_potential(current_hole_cards, board_cards, round_id, full_deck):
+        """
+        All the combinations of opponent cards and board cards to come are evaluated at once. The
+        final hand of the opponent is the board plus a set of 4 (flop) or 3 (turn) of the remaining
+        cards, whatever the cards that came to the board, so each set is evaluated only once.
+        """
         our_cards = current_hole_cards + board_cards
-        out_cards_set = frozenset(our_cards)
+        hole_cards = _codes(current_hole_cards)
+        board = _codes(board_cards)
+        deck = _codes([card for card in full_deck if card not in our_cards])
 
         # hand potential array, each index represents ahead, tied, and behind
         ahead = 0
         tied = 1
         behind = 2
-        hp = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
-        hp_total = [0.0, 0.0, 0.0]
-        total = 0.0
-        pokereval = PokerEval()
-        our_rank = pokereval.evaln(our_cards)
-        # considers all two card combinations of the remaining cards for the opponent
+        our_rank = PokerHandEvaluator.evaluate_codes([_codes(our_cards)])[0]
 
-        opponent_cards_combinations = list(itertools.combinations(full_deck, 2))
-        indices = []
-        for index, cards in enumerate(opponent_cards_combinations):
-            card1, card2 = cards
-            if card1 in our_cards or card2 in our_cards:
-                indices.append(index)
-        for index in reversed(indices):
-            opponent_cards_combinations.pop(index)
-
-        for opponent_card1, opponent_card2 in opponent_cards_combinations:
-            opponent_rank = pokereval.evaln([opponent_card1] + [opponent_card2] + board_cards)
-            if our_rank > opponent_rank:
-                index = ahead
-            elif our_rank == opponent_rank:
-                index = tied
-            else:
-                index = behind
-            # hp_total[index] += 1.0 # original version
-
-            # all possible board cards to come
-            deck = list(full_deck)
-            dealt_card = current_hole_cards + board_cards + [opponent_card1] + [opponent_card2]
-            deck_without_dealt_cards = [card for card in deck if card not in dealt_card]
-            if round_id == 1: # flop
-                cards_combinations = list(itertools.combinations(deck_without_dealt_cards, 2))
-                # cards_combinations = random.sample(cards_combinations, int(len(cards_combinations)*0.2))
-                for turn, river in cards_combinations:
-                    # final 5-card board
-                    board = board_cards + [turn] + [river]
-                    our_future_rank = pokereval.evaln(current_hole_cards + board)
-                    opponent_future_rank = pokereval.evaln([opponent_card1] + [opponent_card2] + board)
-                    if our_future_rank > opponent_future_rank:
-                        hp[index][ahead] += 1.0
-                    elif our_future_rank == opponent_future_rank:
-                        hp[index][tied] += 1.0
-                    else:
-                        hp[index][behind] += 1.0
-                    total += 1.0
-                    hp_total[index] += 1.0 # new version
-            else: # turn
-                # cards = random.sample(deck_without_dealt_cards, int(len(deck_without_dealt_cards)*0.75))
-                cards = deck_without_dealt_cards
-                for river in cards:
-                    # final 5-card board
-                    board = board_cards + [river]
-                    our_future_rank = pokereval.evaln(current_hole_cards + board)
-                    opponent_future_rank = pokereval.evaln([opponent_card1] + [opponent_card2] + board)
-                    if our_future_rank > opponent_future_rank:
-                        hp[index][ahead] += 1.0
-                    elif our_future_rank == opponent_future_rank:
-                        hp[index][tied] += 1.0
-                    else:
-                        hp[index][behind] += 1.0
-                    total += 1.0
-                    hp_total[index] += 1.0 # new version
+        # considers all two card combinations of the remaining cards for the opponent
+        opponent_cards_combinations = _combinations(len(deck), 2)
+        opponent_ranks = PokerHandEvaluator.evaluate_codes(_with_board(deck[opponent_cards_combinations], board))
+        current_index = _compare(our_rank, opponent_ranks)
+
+        # all possible board cards to come
+        if round_id == 1: # flop
+            cards_combinations = _combinations(len(deck), 2)
+        else: # turn
+            cards_combinations = _combinations(len(deck), 1)
+        final_hands = _combinations(len(deck), 2+cards_combinations.shape[1])
+        final_opponent_ranks = numpy.empty(len(final_hands), dtype = numpy.int64)
+        final_opponent_ranks[_combination_index(final_hands)] = PokerHandEvaluator.evaluate_codes(
+            _with_board(deck[final_hands], board))
+        our_future_ranks = PokerHandEvaluator.evaluate_codes(
+            _with_board(deck[cards_combinations], numpy.concatenate([hole_cards, board])))
+
+        # one row per opponent cards, one column per board cards to come
+        cards = numpy.concatenate([
+            numpy.repeat(opponent_cards_combinations[:, numpy.newaxis, :], len(cards_combinations), axis = 1),
+            numpy.repeat(cards_combinations[numpy.newaxis, :, :], len(opponent_cards_combinations), axis = 0)],
+            axis = 2)
+        cards.sort(axis = 2)
+        valid = numpy.all(cards[:, :, 1:] != cards[:, :, :-1], axis = 2)
+        opponent_future_ranks = final_opponent_ranks[_combination_index(numpy.where(valid[:, :, numpy.newaxis], cards, 0))]
+        future_index = _compare(our_future_ranks[numpy.newaxis, :], opponent_future_ranks)
+        hp = numpy.bincount((current_index[:, numpy.newaxis]*3 + future_index)[valid], minlength = 9)
+        hp = hp.reshape((3, 3)).astype(float)
+        hp_total = hp.sum(axis = 1) # new version
 
         # the original formula:
         # ppot = (hp[behind][ahead] + hp[behind][tied]/2.0 + hp[tied][ahead]/2.0) / (hp_total[behind] + hp_total[tied]/2.0)
@@ -153,7 +177,7 @@ class PokerMetricsCalculator():
         # npot: were ahead but fell behind
         # npot = ((hp[ahead][behind]/total)*2.0 + (hp[ahead][tied]/total)*1.0 + (hp[tied][behind]/total)*1.0)/4.0
 
-        return ppot
+        return float(ppot)
 
     @staticmethod
     def calculate_ehs(hand_strength, hand_equity, hand_potential, round_id):
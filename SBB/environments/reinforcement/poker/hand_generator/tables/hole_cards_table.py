@@ -0,0 +1,55 @@
+import os
+import numpy
+from ..poker_hands_converter import card_to_code
+
+TOTAL_HOLE_CARDS = 1326 # 52 choose 2
+
+TABLES_PATH = os.path.dirname(os.path.abspath(__file__))
+
+def hole_cards_index(code1, code2):
+    """
+    Return the index, in range(TOTAL_HOLE_CARDS), of two distinct card codes (see card_to_code()),
+    in any order. It also works with arrays of codes.
+    """
+    high = numpy.maximum(code1, code2)
+    low = numpy.minimum(code1, code2)
+    return high*(high-1)/2+low
+
+class HoleCardsTable():
+    """
+    Table with one value for each pair of hole cards, stored as an array of TOTAL_HOLE_CARDS
+    floats in a .npy file that is only read the first time the table is used.
+
+    The values are read with the hole cards (ie. table[['As', 'Kd']], in any order, or a
+    frozenset as in the previous dict tables), or for arrays of card codes with values().
+    """
+
+    def __init__(self, filename):
+        self.filename_ = filename
+        self.values_ = None
+
+    def values(self, codes1 = None, codes2 = None):
+        if self.values_ is None:
+            self.values_ = numpy.load(os.path.join(TABLES_PATH, self.filename_))
+        if codes1 is None:
+            return self.values_
+        return self.values_[hole_cards_index(numpy.asarray(codes1), numpy.asarray(codes2))]
+
+    def __getitem__(self, hole_cards):
+        card1, card2 = hole_cards
+        return float(self.values()[hole_cards_index(card_to_code(card1), card_to_code(card2))])
+
+def save_hole_cards_table(filename, values_per_hole_cards):
+    """
+    Create the .npy file of a table from a dict with the hole cards as keys.
+    """
+    values = numpy.zeros(TOTAL_HOLE_CARDS, dtype = numpy.float64)
+    for (card1, card2), value in values_per_hole_cards.iteritems():
+        values[hole_cards_index(card_to_code(card1), card_to_code(card2))] = value
+    numpy.save(os.path.join(TABLES_PATH, filename), values)
+
+# pre-flop equity of the hole cards, normalized
+NORMALIZED_HAND_EQUITY = HoleCardsTable("normalized_equity_table.npy")
+
+# pre-flop hand strength, as calculated by PokerMetricsCalculator.calculate_hand_strength()
+STRENGTH_TABLE_FOR_2_CARDS = HoleCardsTable("strength_table_for_2cards.npy")
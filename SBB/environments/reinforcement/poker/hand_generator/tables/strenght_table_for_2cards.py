@@ -1,1328 +0,0 @@
-STRENGTH_TABLE_FOR_2_CARDS = {
-    frozenset(['Qd', '5s']): 0.5914285714285714,
-    frozenset(['Qh', 'Jc']): 0.6502040816326531,
-    frozenset(['5s', '2c']): 0.036326530612244896,
-    frozenset(['As', 'Kd']): 0.9375510204081633,
-    frozenset(['7s', '9d']): 0.3073469387755102,
-    frozenset(['Ad', '7h']): 0.8787755102040816,
-    frozenset(['4c', '5s']): 0.05591836734693877,
-    frozenset(['4d', '5c']): 0.05591836734693877,
-    frozenset(['Ks', '5h']): 0.7187755102040816,
-    frozenset(['Ah', 'Ts']): 0.9081632653061225,
-    frozenset(['7d', '5c']): 0.15061224489795919,
-    frozenset(['2d', '5c']): 0.036326530612244896,
-    frozenset(['3h', '2s']): 0.003673469387755102,
-    frozenset(['9c', 'Kh']): 0.7579591836734694,
-    frozenset(['Qh', '3d']): 0.5718367346938775,
-    frozenset(['Jh', '6d']): 0.4869387755102041,
-    frozenset(['7s', '2h']): 0.12122448979591836,
-    frozenset(['2h', 'Ad']): 0.8297959183673469,
-    frozenset(['Ah', '7c']): 0.8787755102040816,
-    frozenset(['4h', '2s']): 0.013469387755102041,
-    frozenset(['6h', '8s']): 0.22244897959183674,
-    frozenset(['Ac', '7h']): 0.8787755102040816,
-    frozenset(['Jd', 'Jh']): 0.9848979591836735,
-    frozenset(['3s', '3h']): 0.9457142857142857,
-    frozenset(['8s', '8h']): 0.970204081632653,
-    frozenset(['8c', '4s']): 0.20285714285714285,
-    frozenset(['Jd', '5h']): 0.47714285714285715,
-    frozenset(['Ts', 'Tc']): 0.98,
-    frozenset(['5d', '8c']): 0.2126530612244898,
-    frozenset(['6h', 'Kh']): 0.7285714285714285,
-    frozenset(['3s', '7s']): 0.1310204081632653,
-    frozenset(['Qh', '6d']): 0.6012244897959184,
-    frozenset(['9s', '9d']): 0.9751020408163266,
-    frozenset(['2d', 'Jd']): 0.4477551020408163,
-    frozenset(['4d', '2s']): 0.013469387755102041,
-    frozenset(['Ks', 'Kd']): 0.9946938775510205,
-    frozenset(['9c', '3h']): 0.26816326530612244,
-    frozenset(['6s', '3h']): 0.08204081632653061,
-    frozenset(['8h', '7d']): 0.23224489795918368,
-    frozenset(['Ad', '2s']): 0.8297959183673469,
-    frozenset(['9h', '5c']): 0.28775510204081634,
-    frozenset(['Kc', 'Ts']): 0.7677551020408163,
-    frozenset(['Qh', 'Js']): 0.6502040816326531,
-    frozenset(['8c', '8h']): 0.970204081632653,
-    frozenset(['Ah', '9c']): 0.8983673469387755,
-    frozenset(['3c', '2h']): 0.003673469387755102,
-    frozenset(['7c', '5s']): 0.15061224489795919,
-    frozenset(['8s', '4h']): 0.20285714285714285,
-    frozenset(['3c', '6h']): 0.08204081632653061,
-    frozenset(['5d', '6s']): 0.10163265306122449,
-    frozenset(['6h', '2s']): 0.07224489795918368,
-    frozenset(['6s', 'Kd']): 0.7285714285714285,
-    frozenset(['6s', '4s']): 0.09183673469387756,
-    frozenset(['Kc', 'Ad']): 0.9375510204081633,
-    frozenset(['9c', 'Qd']): 0.6306122448979592,
-    frozenset(['7c', '9d']): 0.3073469387755102,
-    frozenset(['Jd', 'Tc']): 0.5261224489795918,
-    frozenset(['4d', '8d']): 0.20285714285714285,
-    frozenset(['Jh', '5s']): 0.47714285714285715,
-    frozenset(['Ac', '4c']): 0.8493877551020408,
-    frozenset(['Ah', '8d']): 0.8885714285714286,
-    frozenset(['Ad', '5c']): 0.8591836734693877,
-    frozenset(['6c', '2s']): 0.07224489795918368,
-    frozenset(['Qs', '5h']): 0.5914285714285714,
-    frozenset(['Kh', '6s']): 0.7285714285714285,
-    frozenset(['4s', '4h']): 0.9506122448979591,
-    frozenset(['Ts', '5c']): 0.3759183673469388,
-    frozenset(['Ah', '2h']): 0.8297959183673469,
-    frozenset(['2d', '6c']): 0.07224489795918368,
-    frozenset(['9h', '5s']): 0.28775510204081634,
-    frozenset(['Jh', '7s']): 0.49673469387755104,
-    frozenset(['6c', '4c']): 0.09183673469387756,
-    frozenset(['7d', '8d']): 0.23224489795918368,
-    frozenset(['4d', 'Qd']): 0.5816326530612245,
-    frozenset(['Kh', '6d']): 0.7285714285714285,
-    frozenset(['9d', '7h']): 0.3073469387755102,
-    frozenset(['Kh', '8d']): 0.7481632653061224,
-    frozenset(['As', '7d']): 0.8787755102040816,
-    frozenset(['4d', '4c']): 0.9506122448979591,
-    frozenset(['Tc', 'Th']): 0.98,
-    frozenset(['6h', 'Th']): 0.38571428571428573,
-    frozenset(['3s', 'Ac']): 0.8395918367346938,
-    frozenset(['8h', 'Jh']): 0.5065306122448979,
-    frozenset(['9h', '4s']): 0.2779591836734694,
-    frozenset(['Ah', 'Js']): 0.9179591836734694,
-    frozenset(['Td', '4s']): 0.36612244897959184,
-    frozenset(['5d', '9h']): 0.28775510204081634,
-    frozenset(['Qh', '9s']): 0.6306122448979592,
-    frozenset(['9c', '7c']): 0.3073469387755102,
-    frozenset(['Ah', '3d']): 0.8395918367346938,
-    frozenset(['5c', '3d']): 0.046122448979591835,
-    frozenset(['9h', 'Js']): 0.5163265306122449,
-    frozenset(['Kc', '7d']): 0.7383673469387755,
-    frozenset(['9c', '3d']): 0.26816326530612244,
-    frozenset(['3c', '5c']): 0.046122448979591835,
-    frozenset(['2d', 'Jc']): 0.4477551020408163,
-    frozenset(['Ac', '6s']): 0.8689795918367347,
-    frozenset(['2d', '8h']): 0.18326530612244898,
-    frozenset(['7s', 'Kd']): 0.7383673469387755,
-    frozenset(['5h', 'Tc']): 0.3759183673469388,
-    frozenset(['9c', 'Jh']): 0.5163265306122449,
-    frozenset(['6c', 'Jc']): 0.4869387755102041,
-    frozenset(['9h', '6d']): 0.2975510204081633,
-    frozenset(['Jh', '5c']): 0.47714285714285715,
-    frozenset(['Qs', '4s']): 0.5816326530612245,
-    frozenset(['5h', '8d']): 0.2126530612244898,
-    frozenset(['8c', '6c']): 0.22244897959183674,
-    frozenset(['9d', '2s']): 0.2583673469387755,
-    frozenset(['5s', 'Kd']): 0.7187755102040816,
-    frozenset(['2d', '3c']): 0.003673469387755102,
-    frozenset(['Kc', '5s']): 0.7187755102040816,
-    frozenset(['Kc', '7s']): 0.7383673469387755,
-    frozenset(['Jd', '8c']): 0.5065306122448979,
-    frozenset(['3s', 'Qc']): 0.5718367346938775,
-    frozenset(['Jd', '7h']): 0.49673469387755104,
-    frozenset(['3c', 'Ah']): 0.8395918367346938,
-    frozenset(['Td', '2h']): 0.34653061224489795,
-    frozenset(['4d', '4h']): 0.9506122448979591,
-    frozenset(['2d', 'Qd']): 0.5620408163265306,
-    frozenset(['Kc', 'As']): 0.9375510204081633,
-    frozenset(['5d', '8s']): 0.2126530612244898,
-    frozenset(['3d', '2c']): 0.003673469387755102,
-    frozenset(['9s', '6d']): 0.2975510204081633,
-    frozenset(['7d', 'Ad']): 0.8787755102040816,
-    frozenset(['5h', 'Kd']): 0.7187755102040816,
-    frozenset(['Td', '3d']): 0.3563265306122449,
-    frozenset(['As', '5s']): 0.8591836734693877,
-    frozenset(['Jc', 'Js']): 0.9848979591836735,
-    frozenset(['Jd', '9s']): 0.5163265306122449,
-    frozenset(['7s', '2c']): 0.12122448979591836,
-    frozenset(['7d', '4c']): 0.14081632653061224,
-    frozenset(['Ad', 'Th']): 0.9081632653061225,
-    frozenset(['9c', '5c']): 0.28775510204081634,
-    frozenset(['Qc', 'Kh']): 0.7873469387755102,
-    frozenset(['As', '9d']): 0.8983673469387755,
-    frozenset(['As', 'Ad']): 0.9995918367346939,
-    frozenset(['Ah', '5h']): 0.8591836734693877,
-    frozenset(['Kh', 'Qd']): 0.7873469387755102,
-    frozenset(['6h', '6s']): 0.9604081632653061,
-    frozenset(['9s', 'Ac']): 0.8983673469387755,
-    frozenset(['3h', '4h']): 0.02326530612244898,
-    frozenset(['6s', '2h']): 0.07224489795918368,
-    frozenset(['8s', 'Jc']): 0.5065306122448979,
-    frozenset(['3c', '4s']): 0.02326530612244898,
-    frozenset(['Kh', '4c']): 0.7089795918367346,
-    frozenset(['9h', '8d']): 0.3171428571428571,
-    frozenset(['3c', '5d']): 0.046122448979591835,
-    frozenset(['6h', '5c']): 0.10163265306122449,
-    frozenset(['3s', '2s']): 0.003673469387755102,
-    frozenset(['Ah', 'Ad']): 0.9995918367346939,
-    frozenset(['9s', '5s']): 0.28775510204081634,
-    frozenset(['2h', '5c']): 0.036326530612244896,
-    frozenset(['6d', 'Jc']): 0.4869387755102041,
-    frozenset(['4d', '7s']): 0.14081632653061224,
-    frozenset(['3h', 'Jc']): 0.45755102040816326,
-    frozenset(['3c', 'Tc']): 0.3563265306122449,
-    frozenset(['Ah', '4h']): 0.8493877551020408,
-    frozenset(['3s', '6h']): 0.08204081632653061,
-    frozenset(['4d', 'Ts']): 0.36612244897959184,
-    frozenset(['3s', '5s']): 0.046122448979591835,
-    frozenset(['Kc', '7h']): 0.7383673469387755,
-    frozenset(['6c', 'Kd']): 0.7285714285714285,
-    frozenset(['9c', '2s']): 0.2583673469387755,
-    frozenset(['Ks', '8d']): 0.7481632653061224,
-    frozenset(['Kd', 'Js']): 0.7775510204081633,
-    frozenset(['Jd', '9d']): 0.5163265306122449,
-    frozenset(['2d', '9s']): 0.2583673469387755,
-    frozenset(['Ah', '7h']): 0.8787755102040816,
-    frozenset(['Qc', '9d']): 0.6306122448979592,
-    frozenset(['8s', '3h']): 0.19306122448979593,
-    frozenset(['6c', '6d']): 0.9604081632653061,
-    frozenset(['Jh', 'Ad']): 0.9179591836734694,
-    frozenset(['Jd', '8s']): 0.5065306122448979,
-    frozenset(['Qs', 'Qc']): 0.9897959183673469,
-    frozenset(['Td', 'Qc']): 0.6404081632653061,
-    frozenset(['Jh', '4c']): 0.4673469387755102,
-    frozenset(['9h', '6c']): 0.2975510204081633,
-    frozenset(['9h', 'As']): 0.8983673469387755,
-    frozenset(['8s', '4s']): 0.20285714285714285,
-    frozenset(['8d', 'Js']): 0.5065306122448979,
-    frozenset(['Jh', 'Qd']): 0.6502040816326531,
-    frozenset(['Jd', '5c']): 0.47714285714285715,
-    frozenset(['3s', '6d']): 0.08204081632653061,
-    frozenset(['As', '6d']): 0.8689795918367347,
-    frozenset(['7c', '4c']): 0.14081632653061224,
-    frozenset(['Kc', '8h']): 0.7481632653061224,
-    frozenset(['8h', 'Kd']): 0.7481632653061224,
-    frozenset(['Ac', '9d']): 0.8983673469387755,
-    frozenset(['6c', '3h']): 0.08204081632653061,
-    frozenset(['Ac', '2c']): 0.8297959183673469,
-    frozenset(['4s', 'Jc']): 0.4673469387755102,
-    frozenset(['6d', '5h']): 0.10163265306122449,
-    frozenset(['5d', 'Jc']): 0.47714285714285715,
-    frozenset(['9h', 'Qh']): 0.6306122448979592,
-    frozenset(['Td', '2c']): 0.34653061224489795,
-    frozenset(['8s', 'Kh']): 0.7481632653061224,
-    frozenset(['Jh', 'Th']): 0.5261224489795918,
-    frozenset(['8s', 'Ac']): 0.8885714285714286,
-    frozenset(['Kh', 'Kd']): 0.9946938775510205,
-    frozenset(['5h', 'Qd']): 0.5914285714285714,
-    frozenset(['4d', '7h']): 0.14081632653061224,
-    frozenset(['Tc', 'Jc']): 0.5261224489795918,
-    frozenset(['7s', '4c']): 0.14081632653061224,
-    frozenset(['3c', '7c']): 0.1310204081632653,
-    frozenset(['Jd', 'Ts']): 0.5261224489795918,
-    frozenset(['9s', '8d']): 0.3171428571428571,
-    frozenset(['4c', '5h']): 0.05591836734693877,
-    frozenset(['Ac', '3d']): 0.8395918367346938,
-    frozenset(['Kc', '2s']): 0.6893877551020409,
-    frozenset(['9s', '3h']): 0.26816326530612244,
-    frozenset(['8h', '8d']): 0.970204081632653,
-    frozenset(['Jc', '2s']): 0.4477551020408163,
-    frozenset(['Ah', '7d']): 0.8787755102040816,
-    frozenset(['Qd', '5c']): 0.5914285714285714,
-    frozenset(['3s', 'Jh']): 0.45755102040816326,
-    frozenset(['Kc', '4s']): 0.7089795918367346,
-    frozenset(['7s', 'Th']): 0.3955102040816327,
-    frozenset(['4d', '9d']): 0.2779591836734694,
-    frozenset(['Td', '9d']): 0.4151020408163265,
-    frozenset(['Kh', '4h']): 0.7089795918367346,
-    frozenset(['8c', '4h']): 0.20285714285714285,
-    frozenset(['8s', '6c']): 0.22244897959183674,
-    frozenset(['Kh', '2h']): 0.6893877551020409,
-    frozenset(['3s', '7c']): 0.1310204081632653,
-    frozenset(['8s', 'Jh']): 0.5065306122448979,
-    frozenset(['Qh', '7h']): 0.6110204081632653,
-    frozenset(['Qh', '5c']): 0.5914285714285714,
-    frozenset(['2d', '3s']): 0.003673469387755102,
-    frozenset(['4d', '7c']): 0.14081632653061224,
-    frozenset(['Tc', '5s']): 0.3759183673469388,
-    frozenset(['Kh', '2s']): 0.6893877551020409,
-    frozenset(['3c', 'Qc']): 0.5718367346938775,
-    frozenset(['Jd', '9c']): 0.5163265306122449,
-    frozenset(['4d', '3d']): 0.02326530612244898,
-    frozenset(['6h', 'Kd']): 0.7285714285714285,
-    frozenset(['8s', '7c']): 0.23224489795918368,
-    frozenset(['3s', '6c']): 0.08204081632653061,
-    frozenset(['Kc', 'Kd']): 0.9946938775510205,
-    frozenset(['Th', 'Kd']): 0.7677551020408163,
-    frozenset(['6h', '5d']): 0.10163265306122449,
-    frozenset(['Qh', 'Ts']): 0.6404081632653061,
-    frozenset(['4h', '7h']): 0.14081632653061224,
-    frozenset(['3s', 'Kh']): 0.6991836734693877,
-    frozenset(['Qs', '7h']): 0.6110204081632653,
-    frozenset(['9c', '6c']): 0.2975510204081633,
-    frozenset(['2d', 'Ac']): 0.8297959183673469,
-    frozenset(['2h', '3d']): 0.003673469387755102,
-    frozenset(['7d', 'Jh']): 0.49673469387755104,
-    frozenset(['6h', '3d']): 0.08204081632653061,
-    frozenset(['8h', 'Kh']): 0.7481632653061224,
-    frozenset(['9s', '6s']): 0.2975510204081633,
-    frozenset(['6s', '7s']): 0.16040816326530613,
-    frozenset(['9h', '7s']): 0.3073469387755102,
-    frozenset(['8c', '6d']): 0.22244897959183674,
-    frozenset(['9s', '7s']): 0.3073469387755102,
-    frozenset(['3c', 'Ks']): 0.6991836734693877,
-    frozenset(['Kc', '8c']): 0.7481632653061224,
-    frozenset(['Ah', 'Jc']): 0.9179591836734694,
-    frozenset(['Kc', 'Td']): 0.7677551020408163,
-    frozenset(['2h', '2c']): 0.9408163265306122,
-    frozenset(['3s', '5d']): 0.046122448979591835,
-    frozenset(['6h', '2c']): 0.07224489795918368,
-    frozenset(['Qh', '4c']): 0.5816326530612245,
-    frozenset(['6s', 'Th']): 0.38571428571428573,
-    frozenset(['3s', 'Tc']): 0.3563265306122449,
-    frozenset(['5d', 'Kd']): 0.7187755102040816,
-    frozenset(['8h', '4s']): 0.20285714285714285,
-    frozenset(['4d', '9c']): 0.2779591836734694,
-    frozenset(['8h', 'Tc']): 0.40530612244897957,
-    frozenset(['Ad', '5s']): 0.8591836734693877,
-    frozenset(['Qh', 'Ah']): 0.9277551020408163,
-    frozenset(['6h', 'Ad']): 0.8689795918367347,
-    frozenset(['6s', 'Tc']): 0.38571428571428573,
-    frozenset(['Ah', '5c']): 0.8591836734693877,
-    frozenset(['6s', '9d']): 0.2975510204081633,
-    frozenset(['8c', 'Tc']): 0.40530612244897957,
-    frozenset(['8s', '2h']): 0.18326530612244898,
-    frozenset(['Ac', '6c']): 0.8689795918367347,
-    frozenset(['Ac', 'Jc']): 0.9179591836734694,
-    frozenset(['Ah', '6s']): 0.8689795918367347,
-    frozenset(['6h', '4d']): 0.09183673469387756,
-    frozenset(['Kh', 'Jh']): 0.7775510204081633,
-    frozenset(['8h', 'Td']): 0.40530612244897957,
-    frozenset(['6s', '6d']): 0.9604081632653061,
-    frozenset(['9c', '7s']): 0.3073469387755102,
-    frozenset(['9h', '8h']): 0.3171428571428571,
-    frozenset(['As', '4h']): 0.8493877551020408,
-    frozenset(['Td', 'Kd']): 0.7677551020408163,
-    frozenset(['Qc', '2s']): 0.5620408163265306,
-    frozenset(['5h', 'Js']): 0.47714285714285715,
-    frozenset(['3c', '6d']): 0.08204081632653061,
-    frozenset(['Ks', '4s']): 0.7089795918367346,
-    frozenset(['Kc', '9c']): 0.7579591836734694,
-    frozenset(['Kh', '7s']): 0.7383673469387755,
-    frozenset(['9s', 'Td']): 0.4151020408163265,
-    frozenset(['Jd', '4c']): 0.4673469387755102,
-    frozenset(['Td', '8d']): 0.40530612244897957,
-    frozenset(['8h', 'Qs']): 0.6208163265306123,
-    frozenset(['Ac', '7c']): 0.8787755102040816,
-    frozenset(['Tc', '7h']): 0.3955102040816327,
-    frozenset(['9c', 'Qc']): 0.6306122448979592,
-    frozenset(['7c', '2h']): 0.12122448979591836,
-    frozenset(['3h', '7s']): 0.1310204081632653,
-    frozenset(['Ts', 'Kd']): 0.7677551020408163,
-    frozenset(['Ah', 'Td']): 0.9081632653061225,
-    frozenset(['Ks', 'Ah']): 0.9375510204081633,
-    frozenset(['6h', 'Ac']): 0.8689795918367347,
-    frozenset(['2h', '2s']): 0.9408163265306122,
-    frozenset(['Td', '7d']): 0.3955102040816327,
-    frozenset(['3h', '5s']): 0.046122448979591835,
-    frozenset(['Qd', '2s']): 0.5620408163265306,
-    frozenset(['3c', '2c']): 0.003673469387755102,
-    frozenset(['6h', 'Jh']): 0.4869387755102041,
-    frozenset(['6d', 'Ad']): 0.8689795918367347,
-    frozenset(['Jh', '2h']): 0.4477551020408163,
-    frozenset(['6d', '4s']): 0.09183673469387756,
-    frozenset(['4c', '2s']): 0.013469387755102041,
-    frozenset(['Qh', '9c']): 0.6306122448979592,
-    frozenset(['Td', 'Js']): 0.5261224489795918,
-    frozenset(['Jd', 'Js']): 0.9848979591836735,
-    frozenset(['Js', '7h']): 0.49673469387755104,
-    frozenset(['8c', '3h']): 0.19306122448979593,
-    frozenset(['8s', 'Qc']): 0.6208163265306123,
-    frozenset(['6h', '5h']): 0.10163265306122449,
-    frozenset(['3s', '9s']): 0.26816326530612244,
-    frozenset(['9s', 'Tc']): 0.4151020408163265,
-    frozenset(['Kc', '9d']): 0.7579591836734694,
-    frozenset(['2h', '5h']): 0.036326530612244896,
-    frozenset(['As', 'Jc']): 0.9179591836734694,
-    frozenset(['2d', '2c']): 0.9408163265306122,
-    frozenset(['Ks', 'Qh']): 0.7873469387755102,
-    frozenset(['Qs', 'As']): 0.9277551020408163,
-    frozenset(['As', '4c']): 0.8493877551020408,
-    frozenset(['Qc', '6d']): 0.6012244897959184,
-    frozenset(['Qh', 'Ac']): 0.9277551020408163,
-    frozenset(['8d', 'Kd']): 0.7481632653061224,
-    frozenset(['9s', '4s']): 0.2779591836734694,
-    frozenset(['3d', '2s']): 0.003673469387755102,
-    frozenset(['9s', '2s']): 0.2583673469387755,
-    frozenset(['Kc', '8d']): 0.7481632653061224,
-    frozenset(['6c', 'Tc']): 0.38571428571428573,
-    frozenset(['Ac', '4h']): 0.8493877551020408,
-    frozenset(['8h', 'Jc']): 0.5065306122448979,
-    frozenset(['8h', '7c']): 0.23224489795918368,
-    frozenset(['Kc', '4h']): 0.7089795918367346,
-    frozenset(['9h', 'Tc']): 0.4151020408163265,
-    frozenset(['3s', 'Ts']): 0.3563265306122449,
-    frozenset(['6s', '4c']): 0.09183673469387756,
-    frozenset(['4d', 'Ac']): 0.8493877551020408,
-    frozenset(['6d', '2h']): 0.07224489795918368,
-    frozenset(['5h', '5c']): 0.9555102040816327,
-    frozenset(['9s', 'Kh']): 0.7579591836734694,
-    frozenset(['8s', '4c']): 0.20285714285714285,
-    frozenset(['6h', '4h']): 0.09183673469387756,
-    frozenset(['6s', 'Qd']): 0.6012244897959184,
-    frozenset(['Qd', 'Ad']): 0.9277551020408163,
-    frozenset(['Qh', 'Qs']): 0.9897959183673469,
-    frozenset(['5d', '5h']): 0.9555102040816327,
-    frozenset(['8h', '6c']): 0.22244897959183674,
-    frozenset(['6d', '2s']): 0.07224489795918368,
-    frozenset(['4s', '5h']): 0.05591836734693877,
-    frozenset(['Qd', '4h']): 0.5816326530612245,
-    frozenset(['Qh', '4d']): 0.5816326530612245,
-    frozenset(['Th', 'Js']): 0.5261224489795918,
-    frozenset(['7c', '5c']): 0.15061224489795919,
-    frozenset(['8d', '5s']): 0.2126530612244898,
-    frozenset(['2h', '4s']): 0.013469387755102041,
-    frozenset(['9s', '2h']): 0.2583673469387755,
-    frozenset(['8h', '6d']): 0.22244897959183674,
-    frozenset(['Qh', 'Ad']): 0.9277551020408163,
-    frozenset(['3s', 'Qd']): 0.5718367346938775,
-    frozenset(['Js', '2s']): 0.4477551020408163,
-    frozenset(['Td', '6d']): 0.38571428571428573,
-    frozenset(['Jd', 'Kc']): 0.7775510204081633,
-    frozenset(['8c', '9d']): 0.3171428571428571,
-    frozenset(['Jh', 'Tc']): 0.5261224489795918,
-    frozenset(['8c', '2c']): 0.18326530612244898,
-    frozenset(['Jc', '7h']): 0.49673469387755104,
-    frozenset(['As', 'Tc']): 0.9081632653061225,
-    frozenset(['Jd', '6d']): 0.4869387755102041,
-    frozenset(['Qd', '7h']): 0.6110204081632653,
-    frozenset(['Kh', 'Ad']): 0.9375510204081633,
-    frozenset(['4d', 'Kd']): 0.7089795918367346,
-    frozenset(['Jd', 'Th']): 0.5261224489795918,
-    frozenset(['Ks', '2s']): 0.6893877551020409,
-    frozenset(['Kc', 'Qd']): 0.7873469387755102,
-    frozenset(['6c', '4h']): 0.09183673469387756,
-    frozenset(['Qc', '4s']): 0.5816326530612245,
-    frozenset(['Jd', 'Ac']): 0.9179591836734694,
-    frozenset(['9s', '7h']): 0.3073469387755102,
-    frozenset(['5d', 'Qc']): 0.5914285714285714,
-    frozenset(['6h', 'Ts']): 0.38571428571428573,
-    frozenset(['8c', '3d']): 0.19306122448979593,
-    frozenset(['Td', 'Ac']): 0.9081632653061225,
-    frozenset(['5d', 'Qs']): 0.5914285714285714,
-    frozenset(['Kh', '9d']): 0.7579591836734694,
-    frozenset(['5d', 'Tc']): 0.3759183673469388,
-    frozenset(['2d', '5h']): 0.036326530612244896,
-    frozenset(['4s', 'Tc']): 0.36612244897959184,
-    frozenset(['9c', 'Js']): 0.5163265306122449,
-    frozenset(['8s', '6s']): 0.22244897959183674,
-    frozenset(['6h', 'Jd']): 0.4869387755102041,
-    frozenset(['3c', '3h']): 0.9457142857142857,
-    frozenset(['4d', 'Qc']): 0.5816326530612245,
-    frozenset(['9d', '2c']): 0.2583673469387755,
-    frozenset(['6h', '2h']): 0.07224489795918368,
-    frozenset(['4d', '7d']): 0.14081632653061224,
-    frozenset(['7s', '5s']): 0.15061224489795919,
-    frozenset(['Ts', 'Js']): 0.5261224489795918,
-    frozenset(['5d', 'Qh']): 0.5914285714285714,
-    frozenset(['8h', '2s']): 0.18326530612244898,
-    frozenset(['Qc', '7s']): 0.6110204081632653,
-    frozenset(['As', '5c']): 0.8591836734693877,
-    frozenset(['Jd', '4s']): 0.4673469387755102,
-    frozenset(['Td', 'Tc']): 0.98,
-    frozenset(['9c', 'As']): 0.8983673469387755,
-    frozenset(['9s', '7c']): 0.3073469387755102,
-    frozenset(['Ah', '4d']): 0.8493877551020408,
-    frozenset(['Qh', 'Tc']): 0.6404081632653061,
-    frozenset(['5c', '5s']): 0.9555102040816327,
-    frozenset(['6c', '8d']): 0.22244897959183674,
-    frozenset(['9c', '2h']): 0.2583673469387755,
-    frozenset(['Kc', 'Jc']): 0.7775510204081633,
-    frozenset(['8s', '5h']): 0.2126530612244898,
-    frozenset(['6h', '9c']): 0.2975510204081633,
-    frozenset(['8s', '9s']): 0.3171428571428571,
-    frozenset(['4s', '2c']): 0.013469387755102041,
-    frozenset(['8s', 'Td']): 0.40530612244897957,
-    frozenset(['3s', '2h']): 0.003673469387755102,
-    frozenset(['Jd', '5d']): 0.47714285714285715,
-    frozenset(['5d', '2c']): 0.036326530612244896,
-    frozenset(['9h', '5h']): 0.28775510204081634,
-    frozenset(['9h', '4h']): 0.2779591836734694,
-    frozenset(['Qh', '7d']): 0.6110204081632653,
-    frozenset(['Kh', '3d']): 0.6991836734693877,
-    frozenset(['Td', '6c']): 0.38571428571428573,
-    frozenset(['7c', 'Th']): 0.3955102040816327,
-    frozenset(['Tc', '2c']): 0.34653061224489795,
-    frozenset(['7c', 'Tc']): 0.3955102040816327,
-    frozenset(['As', '5h']): 0.8591836734693877,
-    frozenset(['8s', 'Qs']): 0.6208163265306123,
-    frozenset(['Td', 'Qd']): 0.6404081632653061,
-    frozenset(['Ts', '4h']): 0.36612244897959184,
-    frozenset(['Ks', '9d']): 0.7579591836734694,
-    frozenset(['Kc', 'Ah']): 0.9375510204081633,
-    frozenset(['Qs', 'Kd']): 0.7873469387755102,
-    frozenset(['2d', 'Qh']): 0.5620408163265306,
-    frozenset(['3s', '7h']): 0.1310204081632653,
-    frozenset(['9h', 'Qd']): 0.6306122448979592,
-    frozenset(['3c', 'Qs']): 0.5718367346938775,
-    frozenset(['5d', '4c']): 0.05591836734693877,
-    frozenset(['4d', '9s']): 0.2779591836734694,
-    frozenset(['Ks', '3d']): 0.6991836734693877,
-    frozenset(['Jh', 'Ts']): 0.5261224489795918,
-    frozenset(['3h', '4c']): 0.02326530612244898,
-    frozenset(['Ah', 'Jh']): 0.9179591836734694,
-    frozenset(['Kd', '7h']): 0.7383673469387755,
-    frozenset(['5d', '5s']): 0.9555102040816327,
-    frozenset(['5h', '3d']): 0.046122448979591835,
-    frozenset(['Qc', 'Th']): 0.6404081632653061,
-    frozenset(['Td', '3h']): 0.3563265306122449,
-    frozenset(['9h', '3d']): 0.26816326530612244,
-    frozenset(['8c', '9s']): 0.3171428571428571,
-    frozenset(['Qh', '6c']): 0.6012244897959184,
-    frozenset(['3c', 'Td']): 0.3563265306122449,
-    frozenset(['4s', '4c']): 0.9506122448979591,
-    frozenset(['5d', '9s']): 0.28775510204081634,
-    frozenset(['9c', '6d']): 0.2975510204081633,
-    frozenset(['Ks', 'Ac']): 0.9375510204081633,
-    frozenset(['7d', '7h']): 0.9653061224489796,
-    frozenset(['Ah', '4c']): 0.8493877551020408,
-    frozenset(['5h', '2c']): 0.036326530612244896,
-    frozenset(['9s', '4h']): 0.2779591836734694,
-    frozenset(['4h', '3d']): 0.02326530612244898,
-    frozenset(['Ad', 'Kd']): 0.9375510204081633,
-    frozenset(['Qs', 'Ts']): 0.6404081632653061,
-    frozenset(['Kc', '5d']): 0.7187755102040816,
-    frozenset(['6c', '5h']): 0.10163265306122449,
-    frozenset(['3c', 'Ts']): 0.3563265306122449,
-    frozenset(['5d', 'Qd']): 0.5914285714285714,
-    frozenset(['Kh', 'Jc']): 0.7775510204081633,
-    frozenset(['3s', '8c']): 0.19306122448979593,
-    frozenset(['Ad', '2c']): 0.8297959183673469,
-    frozenset(['Qs', '7d']): 0.6110204081632653,
-    frozenset(['2d', 'Qc']): 0.5620408163265306,
-    frozenset(['Jd', '3h']): 0.45755102040816326,
-    frozenset(['Ts', 'Qd']): 0.6404081632653061,
-    frozenset(['5d', '9c']): 0.28775510204081634,
-    frozenset(['7d', '2h']): 0.12122448979591836,
-    frozenset(['8s', '9d']): 0.3171428571428571,
-    frozenset(['8s', '2c']): 0.18326530612244898,
-    frozenset(['As', '4s']): 0.8493877551020408,
-    frozenset(['8c', 'Jh']): 0.5065306122448979,
-    frozenset(['3h', '6d']): 0.08204081632653061,
-    frozenset(['Jd', '7s']): 0.49673469387755104,
-    frozenset(['Ks', '8h']): 0.7481632653061224,
-    frozenset(['8h', 'Qd']): 0.6208163265306123,
-    frozenset(['Qc', 'Ac']): 0.9277551020408163,
-    frozenset(['6d', '8d']): 0.22244897959183674,
-    frozenset(['Jd', 'As']): 0.9179591836734694,
-    frozenset(['2h', 'Kd']): 0.6893877551020409,
-    frozenset(['Ks', 'Qs']): 0.7873469387755102,
-    frozenset(['3c', '8s']): 0.19306122448979593,
-    frozenset(['Kc', 'Th']): 0.7677551020408163,
-    frozenset(['8c', 'Qc']): 0.6208163265306123,
-    frozenset(['6c', 'Ad']): 0.8689795918367347,
-    frozenset(['8s', '3d']): 0.19306122448979593,
-    frozenset(['3c', '6s']): 0.08204081632653061,
-    frozenset(['8c', '9h']): 0.3171428571428571,
-    frozenset(['Ks', 'Ts']): 0.7677551020408163,
-    frozenset(['Kh', '5h']): 0.7187755102040816,
-    frozenset(['8c', '4c']): 0.20285714285714285,
-    frozenset(['6h', '7c']): 0.16040816326530613,
-    frozenset(['6h', 'Qh']): 0.6012244897959184,
-    frozenset(['Qh', 'As']): 0.9277551020408163,
-    frozenset(['8c', 'Qd']): 0.6208163265306123,
-    frozenset(['7d', '4s']): 0.14081632653061224,
-    frozenset(['9c', '4s']): 0.2779591836734694,
-    frozenset(['4d', '8h']): 0.20285714285714285,
-    frozenset(['9c', 'Kd']): 0.7579591836734694,
-    frozenset(['Qd', '3d']): 0.5718367346938775,
-    frozenset(['3s', 'As']): 0.8395918367346938,
-    frozenset(['3h', '5h']): 0.046122448979591835,
-    frozenset(['8h', 'Qc']): 0.6208163265306123,
-    frozenset(['Ac', 'Jh']): 0.9179591836734694,
-    frozenset(['8s', '6d']): 0.22244897959183674,
-    frozenset(['8s', 'Th']): 0.40530612244897957,
-    frozenset(['As', '2h']): 0.8297959183673469,
-    frozenset(['6c', '2h']): 0.07224489795918368,
-    frozenset(['7d', 'Js']): 0.49673469387755104,
-    frozenset(['3s', '4s']): 0.02326530612244898,
-    frozenset(['6h', 'As']): 0.8689795918367347,
-    frozenset(['Qd', '2c']): 0.5620408163265306,
-    frozenset(['3c', '2s']): 0.003673469387755102,
-    frozenset(['4d', 'Ad']): 0.8493877551020408,
-    frozenset(['As', '6c']): 0.8689795918367347,
-    frozenset(['2h', '5s']): 0.036326530612244896,
-    frozenset(['Qc', 'Jh']): 0.6502040816326531,
-    frozenset(['4c', '2c']): 0.013469387755102041,
-    frozenset(['6d', '5s']): 0.10163265306122449,
-    frozenset(['Qs', 'Kh']): 0.7873469387755102,
-    frozenset(['8d', '3d']): 0.19306122448979593,
-    frozenset(['Ks', '7d']): 0.7383673469387755,
-    frozenset(['3c', '8d']): 0.19306122448979593,
-    frozenset(['2d', 'Js']): 0.4477551020408163,
-    frozenset(['Ts', 'Jc']): 0.5261224489795918,
-    frozenset(['8c', 'Ac']): 0.8885714285714286,
-    frozenset(['8s', '5s']): 0.2126530612244898,
-    frozenset(['4d', 'As']): 0.8493877551020408,
-    frozenset(['Qc', '2h']): 0.5620408163265306,
-    frozenset(['Jd', '3d']): 0.45755102040816326,
-    frozenset(['2d', '6d']): 0.07224489795918368,
-    frozenset(['5s', '7h']): 0.15061224489795919,
-    frozenset(['6h', 'Qc']): 0.6012244897959184,
-    frozenset(['8h', 'Ts']): 0.40530612244897957,
-    frozenset(['3c', 'Jd']): 0.45755102040816326,
-    frozenset(['9h', '9c']): 0.9751020408163266,
-    frozenset(['4d', '2h']): 0.013469387755102041,
-    frozenset(['8s', 'As']): 0.8885714285714286,
-    frozenset(['8d', '2c']): 0.18326530612244898,
-    frozenset(['8h', '5h']): 0.2126530612244898,
-    frozenset(['7h', '2s']): 0.12122448979591836,
-    frozenset(['Kc', '5c']): 0.7187755102040816,
-    frozenset(['4c', '8d']): 0.20285714285714285,
-    frozenset(['5s', 'Jc']): 0.47714285714285715,
-    frozenset(['3s', 'Qs']): 0.5718367346938775,
-    frozenset(['As', 'Qd']): 0.9277551020408163,
-    frozenset(['8h', '7s']): 0.23224489795918368,
-    frozenset(['Jd', '2c']): 0.4477551020408163,
-    frozenset(['Ac', 'Js']): 0.9179591836734694,
-    frozenset(['8c', '9c']): 0.3171428571428571,
-    frozenset(['Td', '5h']): 0.3759183673469388,
-    frozenset(['4s', 'Ts']): 0.36612244897959184,
-    frozenset(['Qs', '2s']): 0.5620408163265306,
-    frozenset(['As', 'Jh']): 0.9179591836734694,
-    frozenset(['6c', 'Jh']): 0.4869387755102041,
-    frozenset(['8c', '5h']): 0.2126530612244898,
-    frozenset(['Qc', 'Tc']): 0.6404081632653061,
-    frozenset(['6s', '4h']): 0.09183673469387756,
-    frozenset(['Ac', '2h']): 0.8297959183673469,
-    frozenset(['Ks', 'Td']): 0.7677551020408163,
-    frozenset(['3c', '9d']): 0.26816326530612244,
-    frozenset(['3c', 'As']): 0.8395918367346938,
-    frozenset(['Qs', '5s']): 0.5914285714285714,
-    frozenset(['9s', '9c']): 0.9751020408163266,
-    frozenset(['9s', '7d']): 0.3073469387755102,
-    frozenset(['As', '3h']): 0.8395918367346938,
-    frozenset(['3h', '9d']): 0.26816326530612244,
-    frozenset(['Td', '2s']): 0.34653061224489795,
-    frozenset(['9h', 'Ah']): 0.8983673469387755,
-    frozenset(['3c', '8c']): 0.19306122448979593,
-    frozenset(['As', '7c']): 0.8787755102040816,
-    frozenset(['Ah', 'Qc']): 0.9277551020408163,
-    frozenset(['Ks', '4c']): 0.7089795918367346,
-    frozenset(['9c', 'Td']): 0.4151020408163265,
-    frozenset(['2h', 'Tc']): 0.34653061224489795,
-    frozenset(['6c', '7c']): 0.16040816326530613,
-    frozenset(['4d', '6d']): 0.09183673469387756,
-    frozenset(['Ah', 'Kd']): 0.9375510204081633,
-    frozenset(['Ah', '9d']): 0.8983673469387755,
-    frozenset(['5c', '7h']): 0.15061224489795919,
-    frozenset(['Qh', '2s']): 0.5620408163265306,
-    frozenset(['Kc', '3h']): 0.6991836734693877,
-    frozenset(['Qs', 'Tc']): 0.6404081632653061,
-    frozenset(['4s', 'Kd']): 0.7089795918367346,
-    frozenset(['3h', 'Kd']): 0.6991836734693877,
-    frozenset(['5c', '2c']): 0.036326530612244896,
-    frozenset(['8s', '7s']): 0.23224489795918368,
-    frozenset(['7h', '2c']): 0.12122448979591836,
-    frozenset(['9c', '2c']): 0.2583673469387755,
-    frozenset(['6h', 'Js']): 0.4869387755102041,
-    frozenset(['As', 'Kh']): 0.9375510204081633,
-    frozenset(['3c', '8h']): 0.19306122448979593,
-    frozenset(['7c', 'Jc']): 0.49673469387755104,
-    frozenset(['3s', 'Qh']): 0.5718367346938775,
-    frozenset(['Jd', '2s']): 0.4477551020408163,
-    frozenset(['6h', '6d']): 0.9604081632653061,
-    frozenset(['6c', 'Ts']): 0.38571428571428573,
-    frozenset(['5d', '4d']): 0.05591836734693877,
-    frozenset(['Kh', '5s']): 0.7187755102040816,
-    frozenset(['5h', 'Th']): 0.3759183673469388,
-    frozenset(['Jd', '2h']): 0.4477551020408163,
-    frozenset(['6h', 'Tc']): 0.38571428571428573,
-    frozenset(['5d', '7h']): 0.15061224489795919,
-    frozenset(['7h', '3d']): 0.1310204081632653,
-    frozenset(['8h', '2c']): 0.18326530612244898,
-    frozenset(['Ts', '8d']): 0.40530612244897957,
-    frozenset(['9d', 'Kd']): 0.7579591836734694,
-    frozenset(['Jd', 'Ah']): 0.9179591836734694,
-    frozenset(['Td', 'Kh']): 0.7677551020408163,
-    frozenset(['Kc', 'Kh']): 0.9946938775510205,
-    frozenset(['7c', 'Ts']): 0.3955102040816327,
-    frozenset(['6h', '9s']): 0.2975510204081633,
-    frozenset(['Ah', 'Tc']): 0.9081632653061225,
-    frozenset(['5d', '2h']): 0.036326530612244896,
-    frozenset(['7s', '8d']): 0.23224489795918368,
-    frozenset(['Jh', '7h']): 0.49673469387755104,
-    frozenset(['8s', 'Qh']): 0.6208163265306123,
-    frozenset(['Qc', '7h']): 0.6110204081632653,
-    frozenset(['3s', '4d']): 0.02326530612244898,
-    frozenset(['4d', 'Tc']): 0.36612244897959184,
-    frozenset(['5c', '4h']): 0.05591836734693877,
-    frozenset(['Qs', '3d']): 0.5718367346938775,
-    frozenset(['Jh', 'Kd']): 0.7775510204081633,
-    frozenset(['7s', '3d']): 0.1310204081632653,
-    frozenset(['6s', '8d']): 0.22244897959183674,
-    frozenset(['Tc', 'Js']): 0.5261224489795918,
-    frozenset(['Qh', 'Qd']): 0.9897959183673469,
-    frozenset(['3c', '5h']): 0.046122448979591835,
-    frozenset(['4d', '4s']): 0.9506122448979591,
-    frozenset(['8h', '9c']): 0.3171428571428571,
-    frozenset(['Kc', '2c']): 0.6893877551020409,
-    frozenset(['9s', 'Kd']): 0.7579591836734694,
-    frozenset(['Ah', '2s']): 0.8297959183673469,
-    frozenset(['Qs', '4c']): 0.5816326530612245,
-    frozenset(['7s', 'Qd']): 0.6110204081632653,
-    frozenset(['Ts', '7h']): 0.3955102040816327,
-    frozenset(['Ks', 'Kc']): 0.9946938775510205,
-    frozenset(['Qs', 'Qd']): 0.9897959183673469,
-    frozenset(['2d', 'Ah']): 0.8297959183673469,
-    frozenset(['3s', '4h']): 0.02326530612244898,
-    frozenset(['Ks', 'Th']): 0.7677551020408163,
-    frozenset(['6h', 'Qs']): 0.6012244897959184,
-    frozenset(['Kc', '3d']): 0.6991836734693877,
-    frozenset(['6c', '2c']): 0.07224489795918368,
-    frozenset(['8c', '7c']): 0.23224489795918368,
-    frozenset(['Kh', '7d']): 0.7383673469387755,
-    frozenset(['6d', '9d']): 0.2975510204081633,
-    frozenset(['5h', '7h']): 0.15061224489795919,
-    frozenset(['7d', 'Ts']): 0.3955102040816327,
-    frozenset(['Qh', '4s']): 0.5816326530612245,
-    frozenset(['7d', 'Qd']): 0.6110204081632653,
-    frozenset(['4d', '5h']): 0.05591836734693877,
-    frozenset(['6c', '7d']): 0.16040816326530613,
-    frozenset(['2h', 'Ts']): 0.34653061224489795,
-    frozenset(['2d', 'Th']): 0.34653061224489795,
-    frozenset(['3c', 'Kd']): 0.6991836734693877,
-    frozenset(['9c', 'Qs']): 0.6306122448979592,
-    frozenset(['9h', 'Ts']): 0.4151020408163265,
-    frozenset(['4d', 'Qs']): 0.5816326530612245,
-    frozenset(['8c', 'As']): 0.8885714285714286,
-    frozenset(['Qd', 'Th']): 0.6404081632653061,
-    frozenset(['9c', '5s']): 0.28775510204081634,
-    frozenset(['Th', '2c']): 0.34653061224489795,
-    frozenset(['2d', '7d']): 0.12122448979591836,
-    frozenset(['8s', 'Ah']): 0.8885714285714286,
-    frozenset(['8c', 'Ts']): 0.40530612244897957,
-    frozenset(['7d', '7c']): 0.9653061224489796,
-    frozenset(['Qc', '3h']): 0.5718367346938775,
-    frozenset(['8c', 'Js']): 0.5065306122448979,
-    frozenset(['8s', '9h']): 0.3171428571428571,
-    frozenset(['Tc', '8d']): 0.40530612244897957,
-    frozenset(['Qh', 'Kh']): 0.7873469387755102,
-    frozenset(['7d', 'Tc']): 0.3955102040816327,
-    frozenset(['Kc', '4d']): 0.7089795918367346,
-    frozenset(['Kc', '7c']): 0.7383673469387755,
-    frozenset(['4d', 'Td']): 0.36612244897959184,
-    frozenset(['8s', '8d']): 0.970204081632653,
-    frozenset(['9h', '4d']): 0.2779591836734694,
-    frozenset(['8h', '5s']): 0.2126530612244898,
-    frozenset(['Th', '3d']): 0.3563265306122449,
-    frozenset(['Ts', 'Th']): 0.98,
-    frozenset(['Td', 'As']): 0.9081632653061225,
-    frozenset(['Tc', 'Qd']): 0.6404081632653061,
-    frozenset(['Kc', '8s']): 0.7481632653061224,
-    frozenset(['Ts', '2s']): 0.34653061224489795,
-    frozenset(['Ks', '4h']): 0.7089795918367346,
-    frozenset(['8s', 'Kd']): 0.7481632653061224,
-    frozenset(['Jd', 'Kh']): 0.7775510204081633,
-    frozenset(['7c', '7s']): 0.9653061224489796,
-    frozenset(['Ac', '7s']): 0.8787755102040816,
-    frozenset(['5s', '2s']): 0.036326530612244896,
-    frozenset(['8h', 'Ad']): 0.8885714285714286,
-    frozenset(['Tc', '5c']): 0.3759183673469388,
-    frozenset(['Kc', 'Qc']): 0.7873469387755102,
-    frozenset(['8c', 'Td']): 0.40530612244897957,
-    frozenset(['3c', '4c']): 0.02326530612244898,
-    frozenset(['9s', '4c']): 0.2779591836734694,
-    frozenset(['4s', '7h']): 0.14081632653061224,
-    frozenset(['Ah', '6c']): 0.8689795918367347,
-    frozenset(['3h', '2c']): 0.003673469387755102,
-    frozenset(['4h', 'Jc']): 0.4673469387755102,
-    frozenset(['8s', '5c']): 0.2126530612244898,
-    frozenset(['6h', 'Ks']): 0.7285714285714285,
-    frozenset(['Ah', 'As']): 0.9995918367346939,
-    frozenset(['Ks', '5s']): 0.7187755102040816,
-    frozenset(['Qs', 'Jc']): 0.6502040816326531,
-    frozenset(['Qs', 'Ac']): 0.9277551020408163,
-    frozenset(['Kh', 'Th']): 0.7677551020408163,
-    frozenset(['9h', 'Jh']): 0.5163265306122449,
-    frozenset(['7d', '6d']): 0.16040816326530613,
-    frozenset(['Kh', '7h']): 0.7383673469387755,
-    frozenset(['Qh', '7c']): 0.6110204081632653,
-    frozenset(['Ah', 'Qs']): 0.9277551020408163,
-    frozenset(['Jh', 'Jc']): 0.9848979591836735,
-    frozenset(['Kh', '7c']): 0.7383673469387755,
-    frozenset(['Td', 'Jh']): 0.5261224489795918,
-    frozenset(['4s', '8d']): 0.20285714285714285,
-    frozenset(['3h', '3d']): 0.9457142857142857,
-    frozenset(['5d', 'As']): 0.8591836734693877,
-    frozenset(['2d', '6s']): 0.07224489795918368,
-    frozenset(['Kd', '2s']): 0.6893877551020409,
-    frozenset(['Qc', '2c']): 0.5620408163265306,
-    frozenset(['7s', 'Ad']): 0.8787755102040816,
-    frozenset(['Td', '6s']): 0.38571428571428573,
-    frozenset(['7c', '4h']): 0.14081632653061224,
-    frozenset(['5h', '9d']): 0.28775510204081634,
-    frozenset(['Th', '5s']): 0.3759183673469388,
-    frozenset(['4d', '2c']): 0.013469387755102041,
-    frozenset(['Ah', 'Kh']): 0.9375510204081633,
-    frozenset(['Ks', '9s']): 0.7579591836734694,
-    frozenset(['Qs', 'Js']): 0.6502040816326531,
-    frozenset(['Jc', '2c']): 0.4477551020408163,
-    frozenset(['7d', 'Kd']): 0.7383673469387755,
-    frozenset(['5h', 'Ts']): 0.3759183673469388,
-    frozenset(['Td', 'Ad']): 0.9081632653061225,
-    frozenset(['5c', 'Kd']): 0.7187755102040816,
-    frozenset(['Jh', '4h']): 0.4673469387755102,
-    frozenset(['6h', '7d']): 0.16040816326530613,
-    frozenset(['Qc', '3d']): 0.5718367346938775,
-    frozenset(['6d', '7h']): 0.16040816326530613,
-    frozenset(['7s', 'Js']): 0.49673469387755104,
-    frozenset(['6c', '7h']): 0.16040816326530613,
-    frozenset(['Ac', '5h']): 0.8591836734693877,
-    frozenset(['8c', '6s']): 0.22244897959183674,
-    frozenset(['8c', '7d']): 0.23224489795918368,
-    frozenset(['7d', '2s']): 0.12122448979591836,
-    frozenset(['5d', '7s']): 0.15061224489795919,
-    frozenset(['2h', '8d']): 0.18326530612244898,
-    frozenset(['Td', 'Qs']): 0.6404081632653061,
-    frozenset(['9s', 'Qs']): 0.6306122448979592,
-    frozenset(['7s', '4s']): 0.14081632653061224,
-    frozenset(['Qd', 'Jc']): 0.6502040816326531,
-    frozenset(['8c', '4d']): 0.20285714285714285,
-    frozenset(['3h', 'Js']): 0.45755102040816326,
-    frozenset(['Ac', 'Ts']): 0.9081632653061225,
-    frozenset(['Qc', 'Js']): 0.6502040816326531,
-    frozenset(['6s', '5s']): 0.10163265306122449,
-    frozenset(['4h', 'Js']): 0.4673469387755102,
-    frozenset(['3s', '9c']): 0.26816326530612244,
-    frozenset(['3s', '7d']): 0.1310204081632653,
-    frozenset(['Qc', '6s']): 0.6012244897959184,
-    frozenset(['Qs', 'Ad']): 0.9277551020408163,
-    frozenset(['2d', '2s']): 0.9408163265306122,
-    frozenset(['Qh', '2h']): 0.5620408163265306,
-    frozenset(['Ks', '3h']): 0.6991836734693877,
-    frozenset(['Qc', '8d']): 0.6208163265306123,
-    frozenset(['5d', '7d']): 0.15061224489795919,
-    frozenset(['6h', '7h']): 0.16040816326530613,
-    frozenset(['5c', 'Js']): 0.47714285714285715,
-    frozenset(['5d', '5c']): 0.9555102040816327,
-    frozenset(['Th', '7h']): 0.3955102040816327,
-    frozenset(['4s', '5c']): 0.05591836734693877,
-    frozenset(['Qh', 'Th']): 0.6404081632653061,
-    frozenset(['8d', 'Jc']): 0.5065306122448979,
-    frozenset(['9h', '7d']): 0.3073469387755102,
-    frozenset(['8c', 'Qh']): 0.6208163265306123,
-    frozenset(['Qs', '9d']): 0.6306122448979592,
-    frozenset(['Jd', '8d']): 0.5065306122448979,
-    frozenset(['3s', 'Kd']): 0.6991836734693877,
-    frozenset(['Kh', 'Js']): 0.7775510204081633,
-    frozenset(['6h', '6c']): 0.9604081632653061,
-    frozenset(['Kh', '5c']): 0.7187755102040816,
-    frozenset(['Jd', 'Jc']): 0.9848979591836735,
-    frozenset(['Qs', '2c']): 0.5620408163265306,
-    frozenset(['3c', 'Ac']): 0.8395918367346938,
-    frozenset(['Ac', 'Th']): 0.9081632653061225,
-    frozenset(['As', '2c']): 0.8297959183673469,
-    frozenset(['6h', '5s']): 0.10163265306122449,
-    frozenset(['Qc', '5c']): 0.5914285714285714,
-    frozenset(['8h', '3h']): 0.19306122448979593,
-    frozenset(['6d', '2c']): 0.07224489795918368,
-    frozenset(['6d', '4c']): 0.09183673469387756,
-    frozenset(['4c', 'Tc']): 0.36612244897959184,
-    frozenset(['7c', '8d']): 0.23224489795918368,
-    frozenset(['9c', '5h']): 0.28775510204081634,
-    frozenset(['6d', 'Qd']): 0.6012244897959184,
-    frozenset(['9c', '7h']): 0.3073469387755102,
-    frozenset(['Qc', '5s']): 0.5914285714285714,
-    frozenset(['6h', '8c']): 0.22244897959183674,
-    frozenset(['2h', '7h']): 0.12122448979591836,
-    frozenset(['3s', 'Kc']): 0.6991836734693877,
-    frozenset(['4d', '5s']): 0.05591836734693877,
-    frozenset(['9s', 'Js']): 0.5163265306122449,
-    frozenset(['Jh', '8d']): 0.5065306122448979,
-    frozenset(['6d', '3d']): 0.08204081632653061,
-    frozenset(['4s', '9d']): 0.2779591836734694,
-    frozenset(['3h', '5c']): 0.046122448979591835,
-    frozenset(['Ac', '6d']): 0.8689795918367347,
-    frozenset(['Ah', '8h']): 0.8885714285714286,
-    frozenset(['9h', 'Kd']): 0.7579591836734694,
-    frozenset(['8h', 'Ac']): 0.8885714285714286,
-    frozenset(['Ah', 'Ac']): 0.9995918367346939,
-    frozenset(['2h', 'Jc']): 0.4477551020408163,
-    frozenset(['9h', '6s']): 0.2975510204081633,
-    frozenset(['6h', 'Jc']): 0.4869387755102041,
-    frozenset(['2h', '4h']): 0.013469387755102041,
-    frozenset(['9h', '4c']): 0.2779591836734694,
-    frozenset(['9d', 'Tc']): 0.4151020408163265,
-    frozenset(['3s', 'Ah']): 0.8395918367346938,
-    frozenset(['6c', '7s']): 0.16040816326530613,
-    frozenset(['Jd', 'Qd']): 0.6502040816326531,
-    frozenset(['3h', 'Ts']): 0.3563265306122449,
-    frozenset(['4c', 'Ts']): 0.36612244897959184,
-    frozenset(['Ah', 'Th']): 0.9081632653061225,
-    frozenset(['Jd', '8h']): 0.5065306122448979,
-    frozenset(['5d', 'Ts']): 0.3759183673469388,
-    frozenset(['5c', 'Jc']): 0.47714285714285715,
-    frozenset(['6s', 'Ad']): 0.8689795918367347,
-    frozenset(['7s', '2s']): 0.12122448979591836,
-    frozenset(['2d', '3d']): 0.003673469387755102,
-    frozenset(['Ac', '5s']): 0.8591836734693877,
-    frozenset(['9h', '2h']): 0.2583673469387755,
-    frozenset(['7c', '2c']): 0.12122448979591836,
-    frozenset(['Qc', 'Qd']): 0.9897959183673469,
-    frozenset(['2d', '8c']): 0.18326530612244898,
-    frozenset(['3s', 'Th']): 0.3563265306122449,
-    frozenset(['6c', 'Qd']): 0.6012244897959184,
-    frozenset(['9s', '5c']): 0.28775510204081634,
-    frozenset(['6d', 'Tc']): 0.38571428571428573,
-    frozenset(['As', '8d']): 0.8885714285714286,
-    frozenset(['2c', '2s']): 0.9408163265306122,
-    frozenset(['6d', '5c']): 0.10163265306122449,
-    frozenset(['7c', '5h']): 0.15061224489795919,
-    frozenset(['Th', '5c']): 0.3759183673469388,
-    frozenset(['Jd', '4h']): 0.4673469387755102,
-    frozenset(['8s', '4d']): 0.20285714285714285,
-    frozenset(['Ac', '2s']): 0.8297959183673469,
-    frozenset(['Kh', 'Ts']): 0.7677551020408163,
-    frozenset(['7c', '3d']): 0.1310204081632653,
-    frozenset(['Qh', 'Jh']): 0.6502040816326531,
-    frozenset(['8s', 'Js']): 0.5065306122448979,
-    frozenset(['Ac', 'Qd']): 0.9277551020408163,
-    frozenset(['2d', '6h']): 0.07224489795918368,
-    frozenset(['2d', '5s']): 0.036326530612244896,
-    frozenset(['2d', 'Td']): 0.34653061224489795,
-    frozenset(['5d', '2s']): 0.036326530612244896,
-    frozenset(['Qh', '4h']): 0.5816326530612245,
-    frozenset(['3h', '8d']): 0.19306122448979593,
-    frozenset(['Ks', '5d']): 0.7187755102040816,
-    frozenset(['2d', 'Ts']): 0.34653061224489795,
-    frozenset(['Jd', 'Td']): 0.5261224489795918,
-    frozenset(['2h', 'Js']): 0.4477551020408163,
-    frozenset(['Ks', '8s']): 0.7481632653061224,
-    frozenset(['Tc', '2s']): 0.34653061224489795,
-    frozenset(['3c', 'Jc']): 0.45755102040816326,
-    frozenset(['8c', '5c']): 0.2126530612244898,
-    frozenset(['Ks', '6s']): 0.7285714285714285,
-    frozenset(['Jc', '3d']): 0.45755102040816326,
-    frozenset(['7d', '5s']): 0.15061224489795919,
-    frozenset(['Qs', '6d']): 0.6012244897959184,
-    frozenset(['7d', '7s']): 0.9653061224489796,
-    frozenset(['3c', '9c']): 0.26816326530612244,
-    frozenset(['9h', 'Th']): 0.4151020408163265,
-    frozenset(['Jh', '9d']): 0.5163265306122449,
-    frozenset(['Ah', '9s']): 0.8983673469387755,
-    frozenset(['Qd', 'Js']): 0.6502040816326531,
-    frozenset(['As', '7h']): 0.8787755102040816,
-    frozenset(['7c', '7h']): 0.9653061224489796,
-    frozenset(['3h', '7d']): 0.1310204081632653,
-    frozenset(['Qh', '6s']): 0.6012244897959184,
-    frozenset(['3s', 'Ad']): 0.8395918367346938,
-    frozenset(['Ac', 'Ad']): 0.9995918367346939,
-    frozenset(['Th', '2s']): 0.34653061224489795,
-    frozenset(['9h', 'Ad']): 0.8983673469387755,
-    frozenset(['Jh', '5h']): 0.47714285714285715,
-    frozenset(['4s', 'Js']): 0.4673469387755102,
-    frozenset(['6h', '8d']): 0.22244897959183674,
-    frozenset(['9s', 'Th']): 0.4151020408163265,
-    frozenset(['Qh', '7s']): 0.6110204081632653,
-    frozenset(['Tc', 'Ad']): 0.9081632653061225,
-    frozenset(['Jd', 'Ad']): 0.9179591836734694,
-    frozenset(['Ks', 'Jc']): 0.7775510204081633,
-    frozenset(['2d', 'Jh']): 0.4477551020408163,
-    frozenset(['8c', '2h']): 0.18326530612244898,
-    frozenset(['2d', '9h']): 0.2583673469387755,
-    frozenset(['5h', '2s']): 0.036326530612244896,
-    frozenset(['8h', '5c']): 0.2126530612244898,
-    frozenset(['Kc', '4c']): 0.7089795918367346,
-    frozenset(['Jd', '6s']): 0.4869387755102041,
-    frozenset(['6d', 'Ts']): 0.38571428571428573,
-    frozenset(['Qh', 'Td']): 0.6404081632653061,
-    frozenset(['Qh', 'Qc']): 0.9897959183673469,
-    frozenset(['2h', '9d']): 0.2583673469387755,
-    frozenset(['As', '7s']): 0.8787755102040816,
-    frozenset(['Tc', '4h']): 0.36612244897959184,
-    frozenset(['3c', 'Jh']): 0.45755102040816326,
-    frozenset(['Qc', '7d']): 0.6110204081632653,
-    frozenset(['3s', 'Ks']): 0.6991836734693877,
-    frozenset(['4c', 'Qd']): 0.5816326530612245,
-    frozenset(['Ks', 'Js']): 0.7775510204081633,
-    frozenset(['Qs', '2h']): 0.5620408163265306,
-    frozenset(['5d', '4h']): 0.05591836734693877,
-    frozenset(['4s', '3d']): 0.02326530612244898,
-    frozenset(['5d', 'Ac']): 0.8591836734693877,
-    frozenset(['As', '6s']): 0.8689795918367347,
-    frozenset(['5d', '3d']): 0.046122448979591835,
-    frozenset(['Qc', '5h']): 0.5914285714285714,
-    frozenset(['Kd', '3d']): 0.6991836734693877,
-    frozenset(['7c', '4s']): 0.14081632653061224,
-    frozenset(['Ts', '5s']): 0.3759183673469388,
-    frozenset(['Kh', '2c']): 0.6893877551020409,
-    frozenset(['6s', '5c']): 0.10163265306122449,
-    frozenset(['7s', '7h']): 0.9653061224489796,
-    frozenset(['Ks', '6d']): 0.7285714285714285,
-    frozenset(['Tc', '3d']): 0.3563265306122449,
-    frozenset(['8s', '7d']): 0.23224489795918368,
-    frozenset(['5d', 'Jh']): 0.47714285714285715,
-    frozenset(['2d', 'Kh']): 0.6893877551020409,
-    frozenset(['Jh', '4s']): 0.4673469387755102,
-    frozenset(['3h', '7h']): 0.1310204081632653,
-    frozenset(['6c', 'Th']): 0.38571428571428573,
-    frozenset(['3c', 'Kh']): 0.6991836734693877,
-    frozenset(['Kd', '2c']): 0.6893877551020409,
-    frozenset(['Th', 'Jc']): 0.5261224489795918,
-    frozenset(['Qd', 'Kd']): 0.7873469387755102,
-    frozenset(['9s', 'Jh']): 0.5163265306122449,
-    frozenset(['9d', '3d']): 0.26816326530612244,
-    frozenset(['Ac', '7d']): 0.8787755102040816,
-    frozenset(['Qs', 'Th']): 0.6404081632653061,
-    frozenset(['4s', 'Qd']): 0.5816326530612245,
-    frozenset(['2d', '5d']): 0.036326530612244896,
-    frozenset(['3c', 'Th']): 0.3563265306122449,
-    frozenset(['2d', 'Kd']): 0.6893877551020409,
-    frozenset(['3h', 'Ad']): 0.8395918367346938,
-    frozenset(['6c', 'Js']): 0.4869387755102041,
-    frozenset(['Td', '7h']): 0.3955102040816327,
-    frozenset(['9h', '7c']): 0.3073469387755102,
-    frozenset(['Ks', 'Tc']): 0.7677551020408163,
-    frozenset(['Qs', '3h']): 0.5718367346938775,
-    frozenset(['9h', '2c']): 0.2583673469387755,
-    frozenset(['Jd', '7d']): 0.49673469387755104,
-    frozenset(['Ad', '8d']): 0.8885714285714286,
-    frozenset(['8h', 'As']): 0.8885714285714286,
-    frozenset(['8c', 'Kd']): 0.7481632653061224,
-    frozenset(['7d', 'Jc']): 0.49673469387755104,
-    frozenset(['Qc', 'Ts']): 0.6404081632653061,
-    frozenset(['9c', 'Tc']): 0.4151020408163265,
-    frozenset(['2d', 'Kc']): 0.6893877551020409,
-    frozenset(['4d', 'Jc']): 0.4673469387755102,
-    frozenset(['Ad', 'Js']): 0.9179591836734694,
-    frozenset(['6c', '5s']): 0.10163265306122449,
-    frozenset(['3s', 'Jc']): 0.45755102040816326,
-    frozenset(['4c', '3d']): 0.02326530612244898,
-    frozenset(['Kc', '5h']): 0.7187755102040816,
-    frozenset(['9c', 'Ad']): 0.8983673469387755,
-    frozenset(['Qh', '8d']): 0.6208163265306123,
-    frozenset(['Kc', '9h']): 0.7579591836734694,
-    frozenset(['5d', '6c']): 0.10163265306122449,
-    frozenset(['Ks', '2h']): 0.6893877551020409,
-    frozenset(['2d', '4c']): 0.013469387755102041,
-    frozenset(['Ah', '5s']): 0.8591836734693877,
-    frozenset(['Ts', 'Ad']): 0.9081632653061225,
-    frozenset(['Td', '7c']): 0.3955102040816327,
-    frozenset(['8s', '9c']): 0.3171428571428571,
-    frozenset(['6s', 'Js']): 0.4869387755102041,
-    frozenset(['7d', '4h']): 0.14081632653061224,
-    frozenset(['Ks', '6c']): 0.7285714285714285,
-    frozenset(['9s', 'Jc']): 0.5163265306122449,
-    frozenset(['3c', 'Qh']): 0.5718367346938775,
-    frozenset(['Qh', '3h']): 0.5718367346938775,
-    frozenset(['Td', '7s']): 0.3955102040816327,
-    frozenset(['Ks', 'Kh']): 0.9946938775510205,
-    frozenset(['Jh', 'Js']): 0.9848979591836735,
-    frozenset(['Kc', 'Ac']): 0.9375510204081633,
-    frozenset(['5d', '8d']): 0.2126530612244898,
-    frozenset(['3s', 'Js']): 0.45755102040816326,
-    frozenset(['Jd', '7c']): 0.49673469387755104,
-    frozenset(['4c', '5c']): 0.05591836734693877,
-    frozenset(['2d', 'Ad']): 0.8297959183673469,
-    frozenset(['Kc', '9s']): 0.7579591836734694,
-    frozenset(['6s', 'Jc']): 0.4869387755102041,
-    frozenset(['4c', '7h']): 0.14081632653061224,
-    frozenset(['9s', 'Ts']): 0.4151020408163265,
-    frozenset(['8c', 'Kh']): 0.7481632653061224,
-    frozenset(['3h', 'Tc']): 0.3563265306122449,
-    frozenset(['9d', 'Ad']): 0.8983673469387755,
-    frozenset(['3s', '3d']): 0.9457142857142857,
-    frozenset(['As', 'Th']): 0.9081632653061225,
-    frozenset(['2d', '4d']): 0.013469387755102041,
-    frozenset(['3s', '3c']): 0.9457142857142857,
-    frozenset(['Kc', '6c']): 0.7285714285714285,
-    frozenset(['Jd', '5s']): 0.47714285714285715,
-    frozenset(['9d', '4h']): 0.2779591836734694,
-    frozenset(['Ac', '5c']): 0.8591836734693877,
-    frozenset(['3c', '4d']): 0.02326530612244898,
-    frozenset(['9s', 'As']): 0.8983673469387755,
-    frozenset(['Qh', 'Kd']): 0.7873469387755102,
-    frozenset(['Kc', 'Qs']): 0.7873469387755102,
-    frozenset(['Ks', 'Qd']): 0.7873469387755102,
-    frozenset(['2d', '4h']): 0.013469387755102041,
-    frozenset(['3s', '2c']): 0.003673469387755102,
-    frozenset(['3c', 'Ad']): 0.8395918367346938,
-    frozenset(['5d', '8h']): 0.2126530612244898,
-    frozenset(['3h', 'Th']): 0.3563265306122449,
-    frozenset(['6h', '8h']): 0.22244897959183674,
-    frozenset(['Jd', '9h']): 0.5163265306122449,
-    frozenset(['Kh', 'Tc']): 0.7677551020408163,
-    frozenset(['Ac', 'Tc']): 0.9081632653061225,
-    frozenset(['Kc', '6s']): 0.7285714285714285,
-    frozenset(['3s', '5c']): 0.046122448979591835,
-    frozenset(['Ks', '5c']): 0.7187755102040816,
-    frozenset(['Kc', '2h']): 0.6893877551020409,
-    frozenset(['6h', 'Qd']): 0.6012244897959184,
-    frozenset(['7s', 'Tc']): 0.3955102040816327,
-    frozenset(['Qh', '5s']): 0.5914285714285714,
-    frozenset(['6h', 'Kc']): 0.7285714285714285,
-    frozenset(['5d', 'Kh']): 0.7187755102040816,
-    frozenset(['6d', 'Th']): 0.38571428571428573,
-    frozenset(['Td', '5s']): 0.3759183673469388,
-    frozenset(['Kh', '4s']): 0.7089795918367346,
-    frozenset(['Ah', '3h']): 0.8395918367346938,
-    frozenset(['8c', 'Qs']): 0.6208163265306123,
-    frozenset(['6h', '7s']): 0.16040816326530613,
-    frozenset(['5s', 'Js']): 0.47714285714285715,
-    frozenset(['8s', '7h']): 0.23224489795918368,
-    frozenset(['Jh', '2s']): 0.4477551020408163,
-    frozenset(['2h', 'Qd']): 0.5620408163265306,
-    frozenset(['9h', '3h']): 0.26816326530612244,
-    frozenset(['6s', '7h']): 0.16040816326530613,
-    frozenset(['6h', '4c']): 0.09183673469387756,
-    frozenset(['3s', '8h']): 0.19306122448979593,
-    frozenset(['2h', '4c']): 0.013469387755102041,
-    frozenset(['Qs', '7s']): 0.6110204081632653,
-    frozenset(['4d', 'Js']): 0.4673469387755102,
-    frozenset(['7c', '2s']): 0.12122448979591836,
-    frozenset(['9d', 'Qd']): 0.6306122448979592,
-    frozenset(['9h', 'Ac']): 0.8983673469387755,
-    frozenset(['8h', '4h']): 0.20285714285714285,
-    frozenset(['Qc', 'As']): 0.9277551020408163,
-    frozenset(['9c', 'Ts']): 0.4151020408163265,
-    frozenset(['7d', 'Th']): 0.3955102040816327,
-    frozenset(['7c', 'Kd']): 0.7383673469387755,
-    frozenset(['Qs', '6s']): 0.6012244897959184,
-    frozenset(['3s', 'Td']): 0.3563265306122449,
-    frozenset(['Jd', 'Ks']): 0.7775510204081633,
-    frozenset(['3s', '9h']): 0.26816326530612244,
-    frozenset(['Kc', 'Qh']): 0.7873469387755102,
-    frozenset(['Qc', 'Jc']): 0.6502040816326531,
-    frozenset(['6s', '5h']): 0.10163265306122449,
-    frozenset(['Ac', 'Kh']): 0.9375510204081633,
-    frozenset(['Jd', 'Qh']): 0.6502040816326531,
-    frozenset(['4c', 'Js']): 0.4673469387755102,
-    frozenset(['9d', 'Th']): 0.4151020408163265,
-    frozenset(['Qs', '5c']): 0.5914285714285714,
-    frozenset(['Jh', '7c']): 0.49673469387755104,
-    frozenset(['Js', '2c']): 0.4477551020408163,
-    frozenset(['Jd', 'Kd']): 0.7775510204081633,
-    frozenset(['5d', '9d']): 0.28775510204081634,
-    frozenset(['8h', 'Th']): 0.40530612244897957,
-    frozenset(['7c', '6d']): 0.16040816326530613,
-    frozenset(['Jd', 'Qs']): 0.6502040816326531,
-    frozenset(['Qd', '8d']): 0.6208163265306123,
-    frozenset(['3s', '5h']): 0.046122448979591835,
-    frozenset(['Jd', '6c']): 0.4869387755102041,
-    frozenset(['5s', '4h']): 0.05591836734693877,
-    frozenset(['2d', '8d']): 0.18326530612244898,
-    frozenset(['3c', 'Js']): 0.45755102040816326,
-    frozenset(['Td', '5c']): 0.3759183673469388,
-    frozenset(['As', 'Js']): 0.9179591836734694,
-    frozenset(['8s', '2s']): 0.18326530612244898,
-    frozenset(['5d', 'Th']): 0.3759183673469388,
-    frozenset(['Js', '3d']): 0.45755102040816326,
-    frozenset(['3c', '5s']): 0.046122448979591835,
-    frozenset(['4s', 'Th']): 0.36612244897959184,
-    frozenset(['9h', '9d']): 0.9751020408163266,
-    frozenset(['Jd', '4d']): 0.4673469387755102,
-    frozenset(['Jh', '2c']): 0.4477551020408163,
-    frozenset(['9h', 'Kh']): 0.7579591836734694,
-    frozenset(['Ad', '4h']): 0.8493877551020408,
-    frozenset(['9c', 'Jc']): 0.5163265306122449,
-    frozenset(['Ah', '4s']): 0.8493877551020408,
-    frozenset(['3s', '8s']): 0.19306122448979593,
-    frozenset(['Qs', '7c']): 0.6110204081632653,
-    frozenset(['6d', 'Js']): 0.4869387755102041,
-    frozenset(['6d', '4h']): 0.09183673469387756,
-    frozenset(['3s', '6s']): 0.08204081632653061,
-    frozenset(['Td', 'Ts']): 0.98,
-    frozenset(['9h', 'Qs']): 0.6306122448979592,
-    frozenset(['Ks', '7s']): 0.7383673469387755,
-    frozenset(['4d', '6s']): 0.09183673469387756,
-    frozenset(['Jh', '3d']): 0.45755102040816326,
-    frozenset(['6s', '7d']): 0.16040816326530613,
-    frozenset(['8h', '9d']): 0.3171428571428571,
-    frozenset(['7c', 'Qd']): 0.6110204081632653,
-    frozenset(['9c', 'Th']): 0.4151020408163265,
-    frozenset(['2d', '9d']): 0.2583673469387755,
-    frozenset(['2d', 'As']): 0.8297959183673469,
-    frozenset(['5d', 'Ah']): 0.8591836734693877,
-    frozenset(['Ah', '7s']): 0.8787755102040816,
-    frozenset(['3c', '3d']): 0.9457142857142857,
-    frozenset(['4d', 'Kh']): 0.7089795918367346,
-    frozenset(['2d', 'Tc']): 0.34653061224489795,
-    frozenset(['5d', '4s']): 0.05591836734693877,
-    frozenset(['3c', '6c']): 0.08204081632653061,
-    frozenset(['9h', 'Td']): 0.4151020408163265,
-    frozenset(['2d', '2h']): 0.9408163265306122,
-    frozenset(['4h', 'Kd']): 0.7089795918367346,
-    frozenset(['8c', 'Jc']): 0.5065306122448979,
-    frozenset(['8c', 'Ah']): 0.8885714285714286,
-    frozenset(['8h', '3d']): 0.19306122448979593,
-    frozenset(['4s', '2s']): 0.013469387755102041,
-    frozenset(['9d', '5c']): 0.28775510204081634,
-    frozenset(['6h', '9h']): 0.2975510204081633,
-    frozenset(['2h', 'Th']): 0.34653061224489795,
-    frozenset(['2d', '7h']): 0.12122448979591836,
-    frozenset(['8s', 'Qd']): 0.6208163265306123,
-    frozenset(['7c', 'Js']): 0.49673469387755104,
-    frozenset(['4c', 'Ad']): 0.8493877551020408,
-    frozenset(['4c', '9d']): 0.2779591836734694,
-    frozenset(['Ts', '2c']): 0.34653061224489795,
-    frozenset(['5d', 'Td']): 0.3759183673469388,
-    frozenset(['Ks', 'Ad']): 0.9375510204081633,
-    frozenset(['2d', '9c']): 0.2583673469387755,
-    frozenset(['9s', '5h']): 0.28775510204081634,
-    frozenset(['8c', 'Th']): 0.40530612244897957,
-    frozenset(['4c', '4h']): 0.9506122448979591,
-    frozenset(['Td', 'Th']): 0.98,
-    frozenset(['8h', '4c']): 0.20285714285714285,
-    frozenset(['8s', 'Ts']): 0.40530612244897957,
-    frozenset(['Kh', '3h']): 0.6991836734693877,
-    frozenset(['3c', '7h']): 0.1310204081632653,
-    frozenset(['8c', '8d']): 0.970204081632653,
-    frozenset(['3s', '4c']): 0.02326530612244898,
-    frozenset(['Ac', '8d']): 0.8885714285714286,
-    frozenset(['6c', '6s']): 0.9604081632653061,
-    frozenset(['9h', '9s']): 0.9751020408163266,
-    frozenset(['Ts', '3d']): 0.3563265306122449,
-    frozenset(['4d', 'Jh']): 0.4673469387755102,
-    frozenset(['6s', 'Ts']): 0.38571428571428573,
-    frozenset(['8c', '7h']): 0.23224489795918368,
-    frozenset(['8d', '5c']): 0.2126530612244898,
-    frozenset(['8h', 'Js']): 0.5065306122448979,
-    frozenset(['Ks', '9c']): 0.7579591836734694,
-    frozenset(['7d', '9d']): 0.3073469387755102,
-    frozenset(['2d', '7c']): 0.12122448979591836,
-    frozenset(['As', '2s']): 0.8297959183673469,
-    frozenset(['2d', '3h']): 0.003673469387755102,
-    frozenset(['6h', '4s']): 0.09183673469387756,
-    frozenset(['6h', 'Td']): 0.38571428571428573,
-    frozenset(['8c', '5s']): 0.2126530612244898,
-    frozenset(['5d', 'Ad']): 0.8591836734693877,
-    frozenset(['9c', '9d']): 0.9751020408163266,
-    frozenset(['5h', 'Jc']): 0.47714285714285715,
-    frozenset(['6c', '3d']): 0.08204081632653061,
-    frozenset(['7s', 'Ts']): 0.3955102040816327,
-    frozenset(['Jd', 'Qc']): 0.6502040816326531,
-    frozenset(['Qc', 'Kd']): 0.7873469387755102,
-    frozenset(['3h', 'Jh']): 0.45755102040816326,
-    frozenset(['6c', '5c']): 0.10163265306122449,
-    frozenset(['Qs', '6c']): 0.6012244897959184,
-    frozenset(['9h', '2s']): 0.2583673469387755,
-    frozenset(['3c', '9h']): 0.26816326530612244,
-    frozenset(['9d', '5s']): 0.28775510204081634,
-    frozenset(['6h', '9d']): 0.2975510204081633,
-    frozenset(['3h', '7c']): 0.1310204081632653,
-    frozenset(['8s', 'Ad']): 0.8885714285714286,
-    frozenset(['Ac', '3h']): 0.8395918367346938,
-    frozenset(['6c', '9d']): 0.2975510204081633,
-    frozenset(['Kd', 'Jc']): 0.7775510204081633,
-    frozenset(['Kc', 'Js']): 0.7775510204081633,
-    frozenset(['Kc', 'Tc']): 0.7677551020408163,
-    frozenset(['7s', '5c']): 0.15061224489795919,
-    frozenset(['6h', 'Ah']): 0.8689795918367347,
-    frozenset(['9h', 'Jc']): 0.5163265306122449,
-    frozenset(['Ac', '4s']): 0.8493877551020408,
-    frozenset(['Qc', '6c']): 0.6012244897959184,
-    frozenset(['9s', '3d']): 0.26816326530612244,
-    frozenset(['7d', '2c']): 0.12122448979591836,
-    frozenset(['5d', '7c']): 0.15061224489795919,
-    frozenset(['3c', '9s']): 0.26816326530612244,
-    frozenset(['5h', 'Ad']): 0.8591836734693877,
-    frozenset(['Kh', '6c']): 0.7285714285714285,
-    frozenset(['Ah', '6d']): 0.8689795918367347,
-    frozenset(['5d', 'Js']): 0.47714285714285715,
-    frozenset(['5d', '6d']): 0.10163265306122449,
-    frozenset(['As', 'Ts']): 0.9081632653061225,
-    frozenset(['Td', '4c']): 0.36612244897959184,
-    frozenset(['9d', 'Js']): 0.5163265306122449,
-    frozenset(['4c', 'Th']): 0.36612244897959184,
-    frozenset(['Td', '4h']): 0.36612244897959184,
-    frozenset(['5c', '2s']): 0.036326530612244896,
-    frozenset(['6c', '4s']): 0.09183673469387756,
-    frozenset(['3c', '7d']): 0.1310204081632653,
-    frozenset(['9s', '2c']): 0.2583673469387755,
-    frozenset(['5h', '4h']): 0.05591836734693877,
-    frozenset(['7d', '3d']): 0.1310204081632653,
-    frozenset(['4d', '3h']): 0.02326530612244898,
-    frozenset(['Qc', 'Ad']): 0.9277551020408163,
-    frozenset(['7s', 'Jc']): 0.49673469387755104,
-    frozenset(['Tc', 'Kd']): 0.7677551020408163,
-    frozenset(['6s', '2s']): 0.07224489795918368,
-    frozenset(['2d', '4s']): 0.013469387755102041,
-    frozenset(['7s', '4h']): 0.14081632653061224,
-    frozenset(['9h', 'Qc']): 0.6306122448979592,
-    frozenset(['Qs', '4h']): 0.5816326530612245,
-    frozenset(['9h', '7h']): 0.3073469387755102,
-    frozenset(['Th', '4h']): 0.36612244897959184,
-    frozenset(['3c', '7s']): 0.1310204081632653,
-    frozenset(['8h', '6s']): 0.22244897959183674,
-    frozenset(['6h', '3h']): 0.08204081632653061,
-    frozenset(['4s', 'Ad']): 0.8493877551020408,
-    frozenset(['Ks', '8c']): 0.7481632653061224,
-    frozenset(['Ad', 'Jc']): 0.9179591836734694,
-    frozenset(['3h', '2h']): 0.003673469387755102,
-    frozenset(['8s', 'Tc']): 0.40530612244897957,
-    frozenset(['3h', 'Qd']): 0.5718367346938775,
-    frozenset(['Ah', 'Qd']): 0.9277551020408163,
-    frozenset(['7s', '6d']): 0.16040816326530613,
-    frozenset(['9s', 'Ad']): 0.8983673469387755,
-    frozenset(['Qs', 'Jh']): 0.6502040816326531,
-    frozenset(['4c', 'Kd']): 0.7089795918367346,
-    frozenset(['Qh', '5h']): 0.5914285714285714,
-    frozenset(['3c', 'Qd']): 0.5718367346938775,
-    frozenset(['Td', 'Jc']): 0.5261224489795918,
-    frozenset(['6d', 'Kd']): 0.7285714285714285,
-    frozenset(['9s', 'Qc']): 0.6306122448979592,
-    frozenset(['9d', '8d']): 0.3171428571428571,
-    frozenset(['Kc', 'Jh']): 0.7775510204081633,
-    frozenset(['9c', '6s']): 0.2975510204081633,
-    frozenset(['8c', '2s']): 0.18326530612244898,
-    frozenset(['8h', '9s']): 0.3171428571428571,
-    frozenset(['7s', '5h']): 0.15061224489795919,
-    frozenset(['3s', '8d']): 0.19306122448979593,
-    frozenset(['5h', '5s']): 0.9555102040816327,
-    frozenset(['4d', 'Th']): 0.36612244897959184,
-    frozenset(['9s', '6c']): 0.2975510204081633,
-    frozenset(['2d', 'Qs']): 0.5620408163265306,
-    frozenset(['8d', '4h']): 0.20285714285714285,
-    frozenset(['3c', 'Kc']): 0.6991836734693877,
-    frozenset(['Ks', '2c']): 0.6893877551020409,
-    frozenset(['2d', '7s']): 0.12122448979591836,
-    frozenset(['Qc', '4h']): 0.5816326530612245,
-    frozenset(['Ah', '2c']): 0.8297959183673469,
-    frozenset(['3s', 'Jd']): 0.45755102040816326,
-    frozenset(['9s', 'Qd']): 0.6306122448979592,
-    frozenset(['5d', '3h']): 0.046122448979591835,
-    frozenset(['Qh', '8h']): 0.6208163265306123,
-    frozenset(['8d', '2s']): 0.18326530612244898,
-    frozenset(['3h', '4s']): 0.02326530612244898,
-    frozenset(['2d', '8s']): 0.18326530612244898,
-    frozenset(['3c', '4h']): 0.02326530612244898,
-    frozenset(['9d', 'Ts']): 0.4151020408163265,
-    frozenset(['4d', '6c']): 0.09183673469387756,
-    frozenset(['7d', '5h']): 0.15061224489795919,
-    frozenset(['Ks', 'As']): 0.9375510204081633,
-    frozenset(['6s', '2c']): 0.07224489795918368,
-    frozenset(['As', 'Ac']): 0.9995918367346939,
-    frozenset(['Ac', 'Kd']): 0.9375510204081633,
-    frozenset(['8h', '7h']): 0.23224489795918368,
-    frozenset(['Ks', '4d']): 0.7089795918367346,
-    frozenset(['Kc', '6d']): 0.7285714285714285,
-    frozenset(['4h', '2c']): 0.013469387755102041,
-    frozenset(['8s', '8c']): 0.970204081632653,
-    frozenset(['Qc', '4c']): 0.5816326530612245,
-    frozenset(['Qc', '7c']): 0.6110204081632653,
-    frozenset(['6s', 'Jh']): 0.4869387755102041,
-    frozenset(['8c', 'Ad']): 0.8885714285714286,
-    frozenset(['9c', 'Ac']): 0.8983673469387755,
-    frozenset(['Ad', '3d']): 0.8395918367346938,
-    frozenset(['4s', '5s']): 0.05591836734693877,
-    frozenset(['6s', '3d']): 0.08204081632653061,
-    frozenset(['3s', '9d']): 0.26816326530612244,
-    frozenset(['Qh', '9d']): 0.6306122448979592,
-    frozenset(['9d', 'Jc']): 0.5163265306122449,
-    frozenset(['7c', 'Ad']): 0.8787755102040816,
-    frozenset(['4c', 'Jc']): 0.4673469387755102,
-    frozenset(['6s', '7c']): 0.16040816326530613,
-    frozenset(['Qs', '8d']): 0.6208163265306123,
-    frozenset(['Th', '8d']): 0.40530612244897957,
-    frozenset(['Ks', '7h']): 0.7383673469387755,
-    frozenset(['Ks', 'Jh']): 0.7775510204081633,
-    frozenset(['5s', '3d']): 0.046122448979591835,
-    frozenset(['9c', '7d']): 0.3073469387755102,
-    frozenset(['9c', '8d']): 0.3171428571428571,
-    frozenset(['Ks', '9h']): 0.7579591836734694,
-    frozenset(['8h', '2h']): 0.18326530612244898,
-    frozenset(['9c', '4h']): 0.2779591836734694,
-    frozenset(['8c', '7s']): 0.23224489795918368,
-    frozenset(['As', '3d']): 0.8395918367346938,
-    frozenset(['Ks', 'Qc']): 0.7873469387755102,
-    frozenset(['Ks', '7c']): 0.7383673469387755,
-    frozenset(['8d', '7h']): 0.23224489795918368,
-    frozenset(['Qh', '2c']): 0.5620408163265306,
-    frozenset(['2d', 'Ks']): 0.6893877551020409,
-    frozenset(['9c', '4c']): 0.2779591836734694
-}
\ No newline at end of file
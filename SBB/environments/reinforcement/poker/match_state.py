@@ -13,12 +13,15 @@ class MatchState():
     def __init__(self, point, player_key):
         self.point = point
         self.player_key = player_key
-        self.position = point.players[player_key]['position']
-        self.hand_strength = point.players[player_key]['hand_strength']
-        self.effective_potential = point.players[player_key]['effective_potential']
-        self.hole_cards = point.players[player_key]['hole_cards']
+        self.position = point.player_position(player_key)
+        self.hand_strength = point.hand_strength(player_key)
+        self.effective_potential = point.effective_potential(player_key)
         self.actions = []
 
+    @property
+    def hole_cards(self):
+        return self.point.hole_cards(self.player_key) # only used by the debug
+
     def inputs_for_team(self, pot, bet, chips, round_id):
         """
         inputs[0] = hand strength
@@ -1,3 +1,4 @@
+import os
 import json
 import operator
 import itertools
@@ -11,6 +12,7 @@ from poker_config import PokerConfig
 from match_state import MatchState
 from poker_match import PokerMatch
 from poker_metrics import PokerMetrics
+from hand_generator.poker_hands_converter import hands_filename, load_hands, hand_to_row, HANDS_DTYPE
 from poker_opponents import (PokerRandomOpponent, PokerAlwaysCallOpponent, PokerAlwaysRaiseOpponent, 
     PokerLooseAgressiveOpponent, PokerLoosePassiveOpponent, PokerTightAgressiveOpponent, 
     PokerTightPassiveOpponent, PokerBayesianOpponent)
@@ -50,19 +52,44 @@ class PokerEnvironment(ReinforcementEnvironment):
             v_opponents, point_class)
         PokerConfig.CONFIG['labels_per_subdivision']['opponent'] = self.opponent_names_for_validation_
         self.num_lines_per_file_ = []
+        self.hands_per_label_ = []
         self.backup_points_per_label = None
         self.metrics_ = PokerMetrics(self)
 
     def _initialize_random_population_of_points(self, population_size, ignore_cache = False):
         if len(self.num_lines_per_file_) == 0:
-            for label in range(self.total_labels_):
-                self.num_lines_per_file_.append(sum([1 for line in open(PokerConfig.CONFIG['hands_path']+"hands_type_"+str(label)+".json")]))
+            self._load_hands()
         population_size_per_label = population_size/self.total_labels_
         data = self._sample_point_per_label(population_size_per_label, ignore_cache)
         data = flatten(data)
         random.shuffle(data)
         return data
 
+    def _load_hands(self):
+        """
+        Use the .npy files created by poker_hands_converter.py when they exist (memory-mapped), 
+        or else the .json files.
+        """
+        for label in range(self.total_labels_):
+            if os.path.exists(hands_filename(label, ".npy")):
+                hands = load_hands(hands_filename(label, ".npy"))
+                self.hands_per_label_.append(hands)
+                self.num_lines_per_file_.append(len(hands))
+            else:
+                self.hands_per_label_.append(None)
+                self.num_lines_per_file_.append(sum([1 for line in open(hands_filename(label, ".json"))]))
+
+    def _read_hands(self, label, line_numbers):
+        """
+        Return a new array with the hands in the line numbers, so the points sampled together
+        share it (and not the whole file).
+        """
+        hands = self.hands_per_label_[label]
+        if hands is not None:
+            return hands[numpy.array(line_numbers)-1]
+        hands = [json.loads(linecache.getline(hands_filename(label, ".json"), i)) for i in line_numbers]
+        return numpy.array([hand_to_row(hand) for hand in hands], dtype = HANDS_DTYPE)
+
     def _points_to_add_per_label(self, total_points_to_add):
         total_points_to_add_per_label = total_points_to_add/self.total_labels_
         return self._sample_point_per_label(total_points_to_add_per_label, ignore_cache = False)
@@ -75,8 +102,7 @@ class PokerEnvironment(ReinforcementEnvironment):
             data = []
             for label in range(self.total_labels_):
                 idxs = random.sample(range(1, self.num_lines_per_file_[label]+1), size)
-                result = [linecache.getline(PokerConfig.CONFIG['hands_path']+"hands_type_"+str(label)+".json", i) for i in idxs]
-                data.append([PokerPoint(label, json.loads(r)) for r in result])
+                data.append([PokerPoint(label, hand) for hand in self._read_hands(label, idxs)])
             if ignore_cache:
                 return data
             self.backup_points_per_label = data
@@ -125,17 +151,17 @@ class PokerEnvironment(ReinforcementEnvironment):
 
     def _update_team_hand_metrics_for_poker(self, team, point, normalized_value, mode_label):
         team.extra_metrics_['total_hands'][mode_label] += 1
-        team.extra_metrics_['total_hands_per_point_type'][mode_label]['position'][point.players['team']['position']] += 1
+        team.extra_metrics_['total_hands_per_point_type'][mode_label]['position'][point.position_] += 1
         team.extra_metrics_['total_hands_per_point_type'][mode_label]['sbb_label'][point.label_] += 1
         team.extra_metrics_['total_hands_per_point_type'][mode_label]['sbb_sd'][point.sbb_sd_label_] += 1
         if team.extra_metrics_['played_last_hand']:
             team.extra_metrics_['hand_played'][mode_label] += 1
-            team.extra_metrics_['hand_played_per_point_type'][mode_label]['position'][point.players['team']['position']] += 1
+            team.extra_metrics_['hand_played_per_point_type'][mode_label]['position'][point.position_] += 1
             team.extra_metrics_['hand_played_per_point_type'][mode_label]['sbb_label'][point.label_] += 1
             team.extra_metrics_['hand_played_per_point_type'][mode_label]['sbb_sd'][point.sbb_sd_label_] += 1
         if normalized_value > 0.5:
             team.extra_metrics_['won_hands'][mode_label] += 1
-            team.extra_metrics_['won_hands_per_point_type'][mode_label]['position'][point.players['team']['position']] += 1
+            team.extra_metrics_['won_hands_per_point_type'][mode_label]['position'][point.position_] += 1
             team.extra_metrics_['won_hands_per_point_type'][mode_label]['sbb_label'][point.label_] += 1
             team.extra_metrics_['won_hands_per_point_type'][mode_label]['sbb_sd'][point.sbb_sd_label_] += 1
 
@@ -144,7 +170,48 @@ class PokerEnvironment(ReinforcementEnvironment):
         if Config.USER['reinforcement_parameters']['hall_of_fame']['enabled']:
             self._clear_hall_of_fame_memory()
         for point in self.point_population_:
-            point.teams_results_ = []
+            point.teams_results_ = None
+
+    def load_training_state(self, state):
+        super(PokerEnvironment, self).load_training_state(state)
+        for opponent in self.current_hall_of_fame_opponents_:
+            opponent.opponent_model = {}
+            opponent.chips = {}
+
+    def _point_from_dict(self, descriptor):
+        hand = numpy.array([hand_to_row(descriptor['info'])], dtype = HANDS_DTYPE)[0]
+        return PokerPoint(descriptor['label'], hand)
+
+    def evaluation_state(self, team):
+        """
+        The hall of fame opponents keep an opponent model and the chips for each team they played 
+        against, that are the only changes done by the evaluation of the team.
+        """
+        state = []
+        for opponent in self._unique_hall_of_fame_opponents():
+            if team.team_id_ in opponent.opponent_model or team.team_id_ in opponent.chips:
+                opponent_model = opponent.opponent_model.get(team.team_id_)
+                if opponent_model is not None:
+                    opponent_model = vars(opponent_model)
+                state.append([opponent.team_id_, opponent_model, opponent.chips.get(team.team_id_)])
+        return state
+
+    def merge_evaluation_state(self, team, state):
+        opponents = dict([(opponent.team_id_, opponent) for opponent in self._unique_hall_of_fame_opponents()])
+        for opponent_id, opponent_model, chips in state:
+            opponent = opponents[opponent_id]
+            if opponent_model is not None:
+                opponent.opponent_model[team.team_id_] = OpponentModel()
+                vars(opponent.opponent_model[team.team_id_]).update(opponent_model)
+            if chips is not None:
+                opponent.chips[team.team_id_] = chips
+
+    def _unique_hall_of_fame_opponents(self):
+        opponents = []
+        for opponent in self.current_hall_of_fame_opponents_:
+            if opponent not in opponents:
+                opponents.append(opponent)
+        return opponents
 
     def _clear_hall_of_fame_memory(self):
         for opponent in self.opponent_population_['hall_of_fame']:
@@ -235,7 +302,7 @@ class PokerEnvironment(ReinforcementEnvironment):
                             team.extra_metrics_[metric][key][subkey] = defaultdict(int)
 
         for point in self.validation_point_population_:
-            point.teams_results_ = []
+            point.teams_results_ = None
 
         best_team = super(PokerEnvironment, self).validate(current_generation, teams_population)
 
@@ -249,7 +316,7 @@ class PokerEnvironment(ReinforcementEnvironment):
         return extra_metrics_points
 
     def _update_extra_metrics_for_points(self, extra_metrics_points, point, result):
-        extra_metrics_points['position'][point.players['team']['position']].append(result)
+        extra_metrics_points['position'][point.position_].append(result)
         extra_metrics_points['sbb_label'][point.label_].append(result)
         extra_metrics_points['sbb_sd'][point.sbb_sd_label_].append(result)
         return extra_metrics_points
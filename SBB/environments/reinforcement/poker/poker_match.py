@@ -59,12 +59,12 @@ class PokerMatch():
             self.team.extra_metrics_['played_last_hand'] = True
 
         self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.seed_))
-        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.players['team']['position']))
+        self.team.encodings_['encoding_custom_info_per_match'].append(str(self.point.position_))
 
         self.opponent.initialize(self.point.seed_)
             
         ### Setup match
-        if self.point.players['team']['position'] == 0:
+        if self.point.position_ == 0:
             self.players_info[0]['player'] = self.team
             self.players_info[0]['match_state'] = MatchState(self.point, player_key = 'team')
             self.players_info[0]['id'] = self.team.__repr__()
@@ -243,7 +243,7 @@ class PokerMatch():
             self.debug_file.write("\nopponent_chips: "+str(opponent_chips))
             self.debug_file.write("\nnormalized_value: "+str(normalized_value))
 
-        self.point.teams_results_.append(normalized_value)
+        self.point.add_team_result(normalized_value)
 
         self._get_chips_for_team().append(normalized_value)
         if self.opponent.opponent_id == "hall_of_fame":
@@ -159,7 +159,7 @@ class PokerMetrics(ReinforcementMetrics):
 
     def _calculate_point_population_metrics_per_validation(self, run_info):
         self._calculate_point_population_metric_per_validation(run_info, 
-            lambda x: x.players['team']['position'], 'position', range(PokerConfig.CONFIG['positions']))
+            lambda x: x.position_, 'position', range(PokerConfig.CONFIG['positions']))
         self._calculate_point_population_metric_per_validation(run_info, 
             lambda x: x.label_, 'sbb_label', PokerConfig.CONFIG['labels_per_subdivision']['sbb_label'])
         self._calculate_point_population_metric_per_validation(run_info, 
@@ -174,7 +174,7 @@ class PokerMetrics(ReinforcementMetrics):
 
     def _calculate_validation_population_metrics_per_validation(self, run_info):
         self._calculate_validation_population_metric_per_validation(run_info, 
-            lambda x: x.players['team']['position'], 'position', range(PokerConfig.CONFIG['positions']))
+            lambda x: x.position_, 'position', range(PokerConfig.CONFIG['positions']))
         self._calculate_validation_population_metric_per_validation(run_info, 
             lambda x: x.label_, 'sbb_label', PokerConfig.CONFIG['labels_per_subdivision']['sbb_label'])
         self._calculate_validation_population_metric_per_validation(run_info, 
@@ -189,7 +189,8 @@ class PokerMetrics(ReinforcementMetrics):
             run_info.validation_population_distribution_per_validation_[key][label] = len(point_per_distribution[label])
 
         for label in labels:
-            temp = flatten([point.teams_results_ for point in point_per_distribution[label]])
+            temp = flatten([point.teams_results_ for point in point_per_distribution[label] 
+                if point.teams_results_ is not None])
             if len(temp) > 0:
                 means_per_position = round_value(numpy.mean(temp))
             else:
@@ -1,62 +1,124 @@
 from ..reinforcement_point import ReinforcementPoint
+from hand_generator.poker_hands_converter import code_to_card, row_to_hand
 
 class PokerPoint(ReinforcementPoint):
     """
     Encapsulates a poker opponent, seeded hand, and position as a point.
+
+    The hand is a row of an array with the HANDS_DTYPE of poker_hands_converter.py, shared by
+    all the points sampled together, so the cards, the players, the point id and the list of 
+    results are only created when they are used (usually only by the points that are played, 
+    and not by the points sampled in advance).
     """
 
-    def __init__(self, label, info):
+    __slots__ = ('hand_', 'position_', 'last_validation_opponent_id_', 'teams_results_', 'hand_id_')
+
+    def __init__(self, label, hand):
         super(PokerPoint, self).__init__()
 
         self.label_ = label
-        self.seed_ = info['id']
-        self.board_cards_ = [str(x) for x in info['bc']]
-        self.players = {}
-
-        self.players['team'] = {}
-        self.players['team']['position'] = info['pos']
-        self.players['team']['hand_strength'] = info['p']['str']
-        self.players['team']['effective_potential'] = info['p']['ep']
-        self.players['team']['hole_cards'] = [str(x) for x in info['p']['hc']]
-
-        self.players['opponent'] = {}
-        if self.players['team']['position'] == 0:
-            self.players['opponent']['position'] = 1
+        self.hand_ = hand
+        self.seed_ = int(hand['id'])
+        self.position_ = int(hand['pos']) # position of the team
+        self.hand_id_ = None
+        self.last_validation_opponent_id_ = None
+        self.teams_results_ = None # the normalized results of the matches, see add_team_result()
+
+    @property
+    def point_id_(self):
+        if self.hand_id_ is None:
+            self.hand_id_ = str(self.seed_)+"-"+str(self.position_)
+        return self.hand_id_
+
+    @point_id_.setter
+    def point_id_(self, point_id):
+        """
+        The id set by DefaultPoint is replaced by the id of the hand (ie. when the point is created 
+        again from a dict, both are the same).
+        """
+        if isinstance(point_id, str):
+            self.hand_id_ = point_id
         else:
-            self.players['opponent']['position'] = 0
-        self.players['opponent']['hand_strength'] = info['o']['str']
-        self.players['opponent']['effective_potential'] = info['o']['ep']
-        self.players['opponent']['hole_cards'] = [str(x) for x in info['o']['hc']]
-        
-        if self.players['team']['hand_strength'][3] > self.players['opponent']['hand_strength'][3]:
-            self.sbb_sd_label_ = 0
-        elif self.players['team']['hand_strength'][3] < self.players['opponent']['hand_strength'][3]:
-            self.sbb_sd_label_ = 2
+            self.hand_id_ = None
+
+    def add_team_result(self, result):
+        if self.teams_results_ is None:
+            self.teams_results_ = []
+        self.teams_results_.append(result)
+
+    @property
+    def board_cards_(self):
+        return [code_to_card(code) for code in self.hand_['bc']]
+
+    @property
+    def sbb_sd_label_(self):
+        if self.hand_['p_str'][3] > self.hand_['o_str'][3]:
+            return 0
+        elif self.hand_['p_str'][3] < self.hand_['o_str'][3]:
+            return 2
         else:
-            self.sbb_sd_label_ = 1
+            return 1
 
-        self.point_id_ = str(self.seed_)+"-"+str(self.players['team']['position'])
-        self.last_validation_opponent_id_ = None
-        self.teams_results_ = []
+    @property
+    def players(self):
+        players = {}
+        players['team'] = self.player('team')
+        players['opponent'] = self.player('opponent')
+        return players
+
+    def player(self, player_key):
+        player = {}
+        player['position'] = self.player_position(player_key)
+        player['hand_strength'] = self.hand_strength(player_key)
+        player['effective_potential'] = self.effective_potential(player_key)
+        player['hole_cards'] = self.hole_cards(player_key)
+        return player
+
+    def player_position(self, player_key):
+        if player_key == 'team':
+            return self.position_
+        return 1 if self.position_ == 0 else 0
+
+    def hand_strength(self, player_key):
+        return self.hand_[PokerPoint._row_key(player_key)+'_str'].tolist()
+
+    def effective_potential(self, player_key):
+        return self.hand_[PokerPoint._row_key(player_key)+'_ep'].tolist()
+
+    def hole_cards(self, player_key):
+        return [code_to_card(code) for code in self.hand_[PokerPoint._row_key(player_key)+'_hc']]
+
+    @staticmethod
+    def _row_key(player_key):
+        if player_key == 'team':
+            return 'p'
+        return 'o'
+
+    def dict(self):
+        """
+        Return the point in the same format of the hands files.
+        """
+        return {'label': self.label_, 'info': row_to_hand(self.hand_)}
 
     def __repr__(self):
         return "("+str(self.point_id_)+":"+str(self.label_)+")"
 
     def __str__(self):
+        players = self.players
         m = "\n---"
         m += "\npoint_id: "+str(self.point_id_)
         m += "\nlabel: "+str(self.label_)
         m += "\nboard_cards: "+str(self.board_cards_)
         m += "\nsbb_sd_label: "+str(self.sbb_sd_label_)
         m += "\n\nteam"
-        m += "\n- position: "+str(self.players['team']['position'])
-        m += "\n- hole_cards: "+str(self.players['team']['hole_cards'])
-        m += "\n- hand_strength: "+str(self.players['team']['hand_strength'])
-        m += "\n- effective_potential: "+str(self.players['team']['effective_potential'])
+        m += "\n- position: "+str(players['team']['position'])
+        m += "\n- hole_cards: "+str(players['team']['hole_cards'])
+        m += "\n- hand_strength: "+str(players['team']['hand_strength'])
+        m += "\n- effective_potential: "+str(players['team']['effective_potential'])
         m += "\n\nopponent"
-        m += "\n- position: "+str(self.players['opponent']['position'])
-        m += "\n- hole_cards: "+str(self.players['opponent']['hole_cards'])
-        m += "\n- hand_strength: "+str(self.players['opponent']['hand_strength'])
-        m += "\n- effective_potential: "+str(self.players['opponent']['effective_potential'])
+        m += "\n- position: "+str(players['opponent']['position'])
+        m += "\n- hole_cards: "+str(players['opponent']['hole_cards'])
+        m += "\n- hand_strength: "+str(players['opponent']['hand_strength'])
+        m += "\n- effective_potential: "+str(players['opponent']['effective_potential'])
         m += "\n---\n"
         return m
\ No newline at end of file
@@ -7,9 +7,11 @@ from reinforcement_metrics import ReinforcementMetrics
 from ..default_environment import DefaultEnvironment
 from ..default_point import  reset_points_ids
 from ...core.team import Team
+from ...core.team_evaluator import TeamEvaluator
 from ...core.diversity_maintenance import DiversityMaintenance
 from ...core.pareto_dominance_for_teams import ParetoDominanceForTeams
 from ...utils.helpers import round_value, flatten 
+from ...utils.team_reader import read_team_from_json
 from ...config import Config
 
 class ReinforcementEnvironment(DefaultEnvironment):
@@ -42,6 +44,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
         Config.RESTRICTIONS['total_inputs'] = self.total_inputs_
 
         Config.RESTRICTIONS['use_memmory_for_actions'] = False # since the task is reinforcement learning, there is a lot of actions per point, instead of just one
+        self.deterministic_matches_ = False # if the result of a match only depends on the team, the point and the opponent
         
         self.opponent_names_for_training_ = [c.OPPONENT_ID for c in self.coded_opponents_for_training_]
         if Config.USER['reinforcement_parameters']['hall_of_fame']['opponents'] > 0:
@@ -222,6 +225,8 @@ class ReinforcementEnvironment(DefaultEnvironment):
             for point in points_to_remove:
                 if point.point_id_ in team.results_per_points_:
                     team.results_per_points_.pop(point.point_id_)
+                if point.point_id_ in team.matches_per_points_:
+                    team.matches_per_points_.pop(point.point_id_)
 
     def evaluate_point_population(self, teams_population):
         """
@@ -247,7 +252,7 @@ class ReinforcementEnvironment(DefaultEnvironment):
         for subset, points_to_add in zip(current_subsets_per_class, points_to_add_per_label):
             subset.sort(key=lambda x: x.age_, reverse=True)
             remove_solutions = subset[:samples_per_class_to_remove]
-            keep_solutions = list(set(subset) - set(remove_solutions))
+            keep_solutions = [point for point in subset if point not in remove_solutions]
             kept_subsets_per_class.append(keep_solutions)
             removed_subsets_per_class.append(remove_solutions)
 
@@ -272,12 +277,56 @@ class ReinforcementEnvironment(DefaultEnvironment):
             subsets_per_class.append(values)
         return subsets_per_class
 
+    def training_state(self):
+        opponents = []
+        hall_of_fame = {}
+        for opponent in self.training_opponent_population():
+            if opponent.opponent_id == 'hall_of_fame':
+                hall_of_fame[opponent.team_id_] = opponent.dict()
+                opponents.append({'opponent_id': opponent.opponent_id, 'team_id': opponent.team_id_})
+            else:
+                opponents.append({'opponent_id': opponent.opponent_id})
+        state = {}
+        state['points'] = [point.dict() for point in self.point_population_]
+        state['opponents'] = opponents
+        state['hall_of_fame'] = hall_of_fame.values()
+        return state
+
+    def load_training_state(self, state):
+        """
+        The coded opponents are created again, so they start without the changes done by 
+        previous matches.
+        """
+        reset_points_ids() # the ids of the created points are replaced by the ones in the state
+        self.point_population_ = [self._point_from_dict(descriptor) for descriptor in state['points']]
+        coded_opponents = dict([(opponent_class.OPPONENT_ID, opponent_class) 
+            for opponent_class in self.coded_opponents_for_training_])
+        hall_of_fame = {}
+        for team_descriptor in state['hall_of_fame']:
+            team = read_team_from_json(team_descriptor, self, generation = team_descriptor['generation'])
+            team.opponent_id = 'hall_of_fame'
+            hall_of_fame[team.team_id_] = team
+        self.training_opponent_population_ = []
+        self.current_hall_of_fame_opponents_ = []
+        for opponent in state['opponents']:
+            if opponent['opponent_id'] == 'hall_of_fame':
+                self.current_hall_of_fame_opponents_.append(hall_of_fame[opponent['team_id']])
+            else:
+                self.training_opponent_population_.append(coded_opponents[opponent['opponent_id']]())
+
+    def _point_from_dict(self, descriptor):
+        point = self.point_class()
+        point.point_id_ = descriptor['point_id']
+        point.seed_ = descriptor['seed']
+        point.label_ = descriptor['label']
+        return point
+
     def evaluate_teams_population_for_training(self, teams_population):
         for team in teams_population:
             team.encodings_['encoding_for_pattern_of_actions_per_match'] = []
             team.encodings_['encoding_for_actions_per_match'] = []
             team.encodings_['encoding_custom_info_per_match'] = []
-            self.evaluate_team(team, Config.RESTRICTIONS['mode']['training'])
+        TeamEvaluator.evaluate(self, teams_population, Config.RESTRICTIONS['mode']['training'])
         
         if Config.USER['reinforcement_parameters']['hall_of_fame']['enabled']:
             sorted_teams = sorted(teams_population, key=lambda team: team.fitness_, reverse = True) # better ones first
@@ -314,10 +363,19 @@ class ReinforcementEnvironment(DefaultEnvironment):
             raise ValueError("Error: Nothing in opponent population. Probably the population size is too small.")
 
         if mode == Config.RESTRICTIONS['mode']['training']:
+            # the teams in the hall of fame and in the second layer keep their registers between matches
+            reuse_matches = (self.deterministic_matches_ 
+                and not Config.USER['reinforcement_parameters']['hall_of_fame']['enabled']
+                and not Config.USER['advanced_training_parameters']['second_layer']['enabled'])
+            if reuse_matches:
+                played_matches = team.played_matches()
             for point, opponent in zip(point_population, opponent_population):
                 match_id += 1
-                result = self._play_match(team, opponent, point, mode, match_id)
-                team.reset_registers()
+                if reuse_matches:
+                    result = self._play_or_reuse_match(team, opponent, point, mode, match_id, played_matches)
+                else:
+                    result = self._play_match(team, opponent, point, mode, match_id)
+                    team.reset_registers()
                 extra_metrics_opponents[opponent.opponent_id].append(result)
                 team.results_per_points_[point.point_id_] = result
                 results.append(result)
@@ -357,6 +415,26 @@ class ReinforcementEnvironment(DefaultEnvironment):
             extra_metrics_opponents[key] = round_value(numpy.mean(extra_metrics_opponents[key]))
         team.extra_metrics_[opponent_type] = extra_metrics_opponents
 
+    def _play_or_reuse_match(self, team, opponent, point, mode, match_id, played_matches):
+        """
+        Play the match only if the team didn't play it in a previous generation, since the points kept
+        in the point population would have the same results. The encodings of the match are stored
+        with the result, so the encodings of the team are the same as if all the matches were played.
+        """
+        matches = played_matches.setdefault(point.point_id_, {})
+        opponent_key = opponent.__repr__()
+        if opponent_key in matches:
+            result, encodings = matches[opponent_key]
+            for key, values in encodings.iteritems():
+                team.encodings_[key] += values
+            return result
+        encodings_sizes = dict([(key, len(values)) for key, values in team.encodings_.iteritems()])
+        result = self._play_match(team, opponent, point, mode, match_id)
+        team.reset_registers()
+        encodings = dict([(key, values[encodings_sizes[key]:]) for key, values in team.encodings_.iteritems()])
+        matches[opponent_key] = (result, encodings)
+        return result
+
     def _initialize_extra_metrics_for_points(self):
         return {}
 
@@ -3,8 +3,12 @@ from ..default_point import DefaultPoint
 from ...config import Config
 
 class ReinforcementPoint(DefaultPoint):
+    __slots__ = ('seed_', 'label_')
 
     def __init__(self):
         super(ReinforcementPoint, self).__init__()
         self.seed_ = random.randint(0, Config.RESTRICTIONS['max_seed'])
-        self.label_ = 0
\ No newline at end of file
+        self.label_ = 0
+
+    def dict(self):
+        return {'point_id': self.point_id_, 'seed': self.seed_, 'label': self.label_}
\ No newline at end of file
@@ -9,7 +9,7 @@ from reinforcement_with_sockets_point import ReinforcementWithSocketsPoint
 from ..opponent_factory import opponent_factory
 from ..reinforcement_environment import ReinforcementEnvironment
 from ....core.diversity_maintenance import DiversityMaintenance
-from ....utils.helpers import flatten
+from ....utils.helpers import flatten, derive_seed
 from ....config import Config
 
 class ReinforcementEnvironmentWithSockets(ReinforcementEnvironment):
@@ -86,6 +86,7 @@ class ReinforcementEnvironmentWithSockets(ReinforcementEnvironment):
 
         actions = []
         is_over = False
+        random_generator = random.Random(derive_seed(point.seed_, team.team_id_, 'match'))
         while not is_over:
             data = self._get_valid_client_message()
 
@@ -98,7 +99,7 @@ class ReinforcementEnvironmentWithSockets(ReinforcementEnvironment):
                     player = opponent
                 action = player.execute(point.point_id_, inputs, valid_actions, is_training)
                 if action is None:
-                    action = random.choice(valid_actions)
+                    action = random_generator.choice(valid_actions)
 
                 if data['params']['current_player'] == 'sbb' and is_training:
                     actions.append(action)
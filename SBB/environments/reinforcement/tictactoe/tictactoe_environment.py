@@ -5,6 +5,7 @@ from tictactoe_opponents import TictactoeRandomOpponent, TictactoeSmartOpponent
 from ..reinforcement_environment import ReinforcementEnvironment
 from ..reinforcement_point import ReinforcementPoint
 from ....core.diversity_maintenance import DiversityMaintenance
+from ....utils.helpers import derive_seed
 from ....config import Config
 
 class TictactoeEnvironment(ReinforcementEnvironment):
@@ -26,6 +27,7 @@ class TictactoeEnvironment(ReinforcementEnvironment):
                 v_opponents.append(opponent)
         point_class = ReinforcementPoint
         super(TictactoeEnvironment, self).__init__(total_actions, total_inputs, total_labels, t_opponents, v_opponents, point_class)
+        self.deterministic_matches_ = True # the matches and the opponents are seeded by the point
         self.total_positions_ = 2
         self.action_mapping_ = {
             '[0,0]': 0, '[0,1]': 1, '[0,2]': 2,
@@ -33,6 +35,7 @@ class TictactoeEnvironment(ReinforcementEnvironment):
             '[2,0]': 6, '[2,1]': 7, '[2,2]': 8,
         }
         self.actions_ = []
+        self.random_generator_ = None
 
     def _play_match(self, team, opponent, point, mode, match_id):
         """
@@ -43,6 +46,7 @@ class TictactoeEnvironment(ReinforcementEnvironment):
         else:
             is_training = False
         outputs = []
+        self.random_generator_ = random.Random(derive_seed(point.seed_, team.team_id_, 'match'))
         for position in range(1, self.total_positions_+1):
             if position == 1:
                 first_player = opponent
@@ -82,7 +86,7 @@ class TictactoeEnvironment(ReinforcementEnvironment):
         inputs = match.inputs_from_the_point_of_view_of(player_id)
         action = player.execute(point.point_id_, inputs, match.valid_actions(), is_training)
         if action is None:
-            action = random.choice(match.valid_actions())
+            action = self.random_generator_.choice(match.valid_actions())
         if is_training:
             self.actions_.append(action)
             player.encodings_['encoding_for_actions_per_match'].append(str(action))
@@ -9,16 +9,15 @@ import sys
 import numpy
 import json
 from core.program import Program, reset_programs_ids
+from core.program_kernels import reset_program_kernels
 from core.team import Team, reset_teams_ids
 from core.instruction import Instruction
-from environments.classification.classification_environment import ClassificationEnvironment
-from environments.reinforcement.tictactoe.tictactoe_environment import TictactoeEnvironment
-from environments.reinforcement.poker.poker_environment import PokerEnvironment
-from environments.reinforcement.sockets.reinforcement_with_sockets_environment import ReinforcementEnvironmentWithSockets
+from environments.environment_registry import get_environment_class
 from core.selection import Selection
+from core.team_evaluator import TeamEvaluator
 from utils.run_info import RunInfo
 from utils.team_reader import initialize_actions_for_second_layer
-from utils.helpers import round_value
+from utils.helpers import round_value, derive_seed
 from config import Config
 
 class SBB:
@@ -82,6 +81,7 @@ class SBB:
 
             while not self._stop_criterion():
                 self.current_generation_ += 1
+                self._set_seed(derive_seed(run_info.seed, self.current_generation_)) # so each generation has its own random stream
                 
                 validation = False
                 if self._is_validation():
@@ -116,6 +116,8 @@ class SBB:
             print("\nFinished run "+str(run_info.run_id)+", elapsed time: "+str(run_info.elapsed_time_)+" mins")
             self.run_infos_.append(run_info)
             sys.stdout.flush()
+
+        TeamEvaluator.close()
         
         # finalize execution (get final metrics, print to output, print to file)
         msg = self.environment_.metrics_.generate_overall_metrics_output(self.run_infos_)
@@ -132,19 +134,14 @@ class SBB:
             self._write_output_files(initial_info)
     
     def _initialize_environment(self):
-        environment = None
+        """
+        Only the module of the environment used by the CONFIG is imported (see environment_registry.py).
+        """
         if Config.USER['task'] == 'classification':
-            environment = ClassificationEnvironment()
+            return get_environment_class('classification')()
         if Config.USER['task'] == 'reinforcement':
-            if Config.USER['reinforcement_parameters']['environment'] == 'tictactoe':
-                environment = TictactoeEnvironment()
-            if Config.USER['reinforcement_parameters']['environment'] == 'poker':
-                environment = PokerEnvironment()
-            if Config.USER['reinforcement_parameters']['environment'] == 'sockets':
-                environment = ReinforcementEnvironmentWithSockets()
-        if environment is None:
-            raise ValueError("No environment exists for "+str(Config.USER['task']))
-        return environment
+            return get_environment_class(Config.USER['reinforcement_parameters']['environment'])()
+        raise ValueError("No environment exists for "+str(Config.USER['task']))
 
     def _generate_initial_message_output(self):
         initial_info = ""
@@ -179,6 +176,7 @@ class SBB:
         
         reset_teams_ids()
         reset_programs_ids()
+        reset_program_kernels()
         teams_population = []
         programs_population = []
         for t in range(Config.USER['training_parameters']['populations']['teams']):
@@ -1,8 +1,10 @@
 import unittest
 import shutil
+import multiprocessing
 from collections import deque
 from ...config import Config
 from ...sbb import SBB
+from ...core.distributed_worker import DistributedWorker
 
 TEST_CONFIG = {
     'task': 'classification',
@@ -50,16 +52,41 @@ TEST_CONFIG = {
         'seed': 1,
         'use_operations': ['+', '-', '*', '/', 'if_lesser_than', 'if_equal_or_higher_than'],
         'extra_registers': 1,
+        'registers_precision': 'float64',
         'diversity': {
             'metrics': [],
             'k': 8,
+            'ncd': {
+                'compressor': 'bz2',
+                'level': 9,
+                'symmetric': False,
+            },
         },
         "novelty": {
             "enabled": False,
             "use_fitness": True,
         },
         'use_weighted_probability_selection': False,
+        'selection': {
+            'method': 'pareto',
+            'cost': None,
+        },
         'use_agressive_mutations': False,
+        'bloat_control': {
+            'parsimony_tie_breaking': False,
+            'size_penalty': 0.0,
+            'max_team_instructions': None,
+        },
+        'parallelism': {
+            'mode': 'serial',
+            'workers': 2,
+            'distributed': {
+                'host': 'localhost',
+                'port': 7801,
+                'heartbeat_interval': 1,
+                'heartbeat_timeout': 10,
+            },
+        },
         'second_layer': {
             'enabled': False,
             'path': None,
@@ -86,6 +113,8 @@ class ClassificationTests(unittest.TestCase):
         config['advanced_training_parameters']['diversity']['only_show'] = []
         config['classification_parameters']['dataset'] = 'iris'
         config['training_parameters']['runs_total'] = 1
+        config['advanced_training_parameters']['parallelism']['mode'] = 'serial'
+        config['advanced_training_parameters']['registers_precision'] = 'float64'
         Config.USER = config
 
     def test_classification_for_iris(self):
@@ -113,6 +142,15 @@ class ClassificationTests(unittest.TestCase):
         expected = 1
         self.assertEqual(expected, result)
 
+    def test_classification_for_iris_with_float32_registers(self):
+        Config.USER['advanced_training_parameters']['registers_precision'] = 'float32'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
     def test_classification_for_iris_with_output(self):
         Config.RESTRICTIONS['write_output_files'] = True
         Config.RESTRICTIONS['output_folder'] = "SBB/tests/temp_files4/"
@@ -124,6 +162,32 @@ class ClassificationTests(unittest.TestCase):
         shutil.rmtree("SBB/tests/temp_files4/")
         self.assertEqual(expected, result)
 
+    def test_classification_for_iris_with_fork_parallelism(self):
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'fork'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
+    def test_classification_for_iris_with_same_results_for_serial_and_distributed_evaluations(self):
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = sbb.best_scores_per_runs_
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'distributed'
+        Config.check_parameters()
+        workers = [multiprocessing.Process(target = DistributedWorker('localhost', 7801).run) for index in range(2)]
+        for worker in workers:
+            worker.start()
+        sbb = SBB()
+        sbb.run()
+        for worker in workers:
+            worker.join()
+        result = sbb.best_scores_per_runs_
+        self.assertEqual(expected, result)
+
     def test_classification_for_thyroid(self):
         Config.USER['classification_parameters']['dataset'] = 'thyroid'
         Config.check_parameters()
@@ -67,16 +67,41 @@ TEST_CONFIG = {
         'seed': 1, 
         'use_operations': ['+', '-', '*', '/', 'if_lesser_than', 'if_equal_or_higher_than'],
         'extra_registers': 4,
+        'registers_precision': 'float64',
         'diversity': {
             'metrics': [],
             'k': 10,
+            'ncd': {
+                'compressor': 'bz2',
+                'level': 9,
+                'symmetric': False,
+            },
         },
         "novelty": {
             "enabled": False,
             "use_fitness": True,
         },
         'use_weighted_probability_selection': False, 
+        'selection': {
+            'method': 'pareto',
+            'cost': None,
+        },
         'use_agressive_mutations': True,
+        'bloat_control': {
+            'parsimony_tie_breaking': False,
+            'size_penalty': 0.0,
+            'max_team_instructions': None,
+        },
+        'parallelism': {
+            'mode': 'serial',
+            'workers': 2,
+            'distributed': {
+                'host': 'localhost',
+                'port': 7801,
+                'heartbeat_interval': 1,
+                'heartbeat_timeout': 10,
+            },
+        },
         'second_layer': {
             'enabled': False,
             'path': 'actions_reference/baseline3_without_bayes/run[run_id]/second_layer_files/top10_overall/actions.json',
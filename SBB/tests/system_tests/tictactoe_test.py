@@ -1,7 +1,12 @@
+import time
+import socket
 import unittest
+import multiprocessing
 from collections import deque
 from ...config import Config
 from ...sbb import SBB
+from ...core.distributed_worker import DistributedWorker
+from ...core.distributed_coordinator import receive_message
 
 TEST_CONFIG = {
     'task': 'reinforcement',
@@ -64,16 +69,41 @@ TEST_CONFIG = {
         'seed': 1,
         'use_operations': ['+', '-', '*', '/', 'if_lesser_than', 'if_equal_or_higher_than'],
         'extra_registers': 4,
+        'registers_precision': 'float64',
         'diversity': {
             'metrics': [],
             'k': 8,
+            'ncd': {
+                'compressor': 'bz2',
+                'level': 9,
+                'symmetric': False,
+            },
         },
         "novelty": {
             "enabled": False,
             "use_fitness": True,
         },
         'use_weighted_probability_selection': False,
+        'selection': {
+            'method': 'pareto',
+            'cost': None,
+        },
         'use_agressive_mutations': False,
+        'bloat_control': {
+            'parsimony_tie_breaking': False,
+            'size_penalty': 0.0,
+            'max_team_instructions': None,
+        },
+        'parallelism': {
+            'mode': 'serial',
+            'workers': 2,
+            'distributed': {
+                'host': 'localhost',
+                'port': 7801,
+                'heartbeat_interval': 1,
+                'heartbeat_timeout': 10,
+            },
+        },
         'second_layer': {
             'enabled': False,
             'path': 'SBB/tests/system_tests/actions_reference/run[run_id]/second_layer_files/hall_of_fame/actions.json',
@@ -90,6 +120,33 @@ TEST_CONFIG = {
     },
 }
 
+def start_workers(total, target):
+    workers = []
+    for index in range(total):
+        worker = multiprocessing.Process(target = target)
+        worker.start()
+        workers.append(worker)
+    return workers
+
+def run_faulty_worker(address, hang):
+    """
+    Connect to the coordinator and stop answering it when it sends a team to evaluate, by 
+    closing the connection or by hanging without sending heartbeats.
+    """
+    connection = None
+    while connection is None:
+        try:
+            connection = socket.create_connection(address)
+        except socket.error:
+            time.sleep(0.2)
+    while True:
+        message = receive_message(connection)
+        if message is None or message['type'] == 'evaluate':
+            break
+    if hang:
+        time.sleep(60)
+    connection.close()
+
 class TictactoeTests(unittest.TestCase):
     def setUp(self):
         Config.RESTRICTIONS['write_output_files'] = False
@@ -105,7 +162,15 @@ class TictactoeTests(unittest.TestCase):
         config['advanced_training_parameters']['use_operations'] = ['+', '-', '*', '/', 'if_lesser_than', 'if_equal_or_higher_than']
         config['advanced_training_parameters']['use_weighted_probability_selection'] = False
         config['advanced_training_parameters']['use_agressive_mutations'] = False
+        config['advanced_training_parameters']['selection']['method'] = 'pareto'
+        config['advanced_training_parameters']['selection']['cost'] = None
+        config['advanced_training_parameters']['bloat_control']['parsimony_tie_breaking'] = False
+        config['advanced_training_parameters']['bloat_control']['size_penalty'] = 0.0
+        config['advanced_training_parameters']['bloat_control']['max_team_instructions'] = None
         config['advanced_training_parameters']['second_layer']['enabled'] = False
+        config['advanced_training_parameters']['parallelism']['mode'] = 'serial'
+        config['advanced_training_parameters']['parallelism']['workers'] = 2
+        config['advanced_training_parameters']['parallelism']['distributed']['heartbeat_timeout'] = 10
         Config.USER = config
 
     def test_reinforcement_for_ttt_without_pareto_and_without_diversity_maintenance_for_only_coded_opponents_for_two_runs(self):
@@ -143,6 +208,90 @@ class TictactoeTests(unittest.TestCase):
         expected = 1
         self.assertEqual(expected, result)
 
+    def test_reinforcement_for_ttt_with_pool_parallelism(self):
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'pool'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_fork_parallelism(self):
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'fork'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_same_results_for_serial_and_parallel_evaluations(self):
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = sbb.best_scores_per_runs_
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'fork'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = sbb.best_scores_per_runs_
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_same_results_with_and_without_reused_matches(self):
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.environment_.deterministic_matches_ = False
+        sbb.run()
+        result = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_same_results_for_serial_and_distributed_evaluations(self):
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = sbb.best_scores_per_runs_
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'distributed'
+        Config.check_parameters()
+        workers = start_workers(2, DistributedWorker('localhost', 7801).run)
+        sbb = SBB()
+        sbb.run()
+        for worker in workers:
+            worker.join()
+        result = sbb.best_scores_per_runs_
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_distributed_evaluations_with_lost_workers(self):
+        """ Ensures the teams of the lost workers are evaluated by the other workers """
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = sbb.best_scores_per_runs_
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'distributed'
+        Config.USER['advanced_training_parameters']['parallelism']['workers'] = 4
+        Config.USER['advanced_training_parameters']['parallelism']['distributed']['heartbeat_timeout'] = 3
+        Config.check_parameters()
+        address = ('localhost', 7801)
+        workers = start_workers(2, DistributedWorker(*address).run)
+        faulty_workers = start_workers(1, lambda: run_faulty_worker(address, hang = False))
+        faulty_workers += start_workers(1, lambda: run_faulty_worker(address, hang = True))
+        sbb = SBB()
+        sbb.run()
+        for worker in workers:
+            worker.join()
+        for worker in faulty_workers:
+            worker.terminate()
+            worker.join()
+        result = sbb.best_scores_per_runs_
+        self.assertEqual(expected, result)
+
     def test_reinforcement_for_ttt_with_second_layer(self):
         Config.USER['advanced_training_parameters']['second_layer']['enabled'] = True
         Config.check_parameters()
@@ -215,6 +364,64 @@ class TictactoeTests(unittest.TestCase):
         expected = 1
         self.assertEqual(expected, result)
 
+    def test_reinforcement_for_ttt_with_nsga2_selection(self):
+        Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['genotype', 'fitness_sharing']
+        Config.USER['advanced_training_parameters']['selection']['method'] = 'nsga2'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_nsga2_selection_with_cost(self):
+        Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['genotype']
+        Config.USER['advanced_training_parameters']['selection']['method'] = 'nsga2'
+        Config.USER['advanced_training_parameters']['selection']['cost'] = 'effective_instructions'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_nsga2_selection_with_cost_with_same_results_for_serial_and_parallel_evaluations(self):
+        Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['genotype']
+        Config.USER['advanced_training_parameters']['selection']['method'] = 'nsga2'
+        Config.USER['advanced_training_parameters']['selection']['cost'] = 'effective_instructions'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        expected = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'fork'
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = [sbb.best_scores_per_runs_, sbb.run_infos_[0].global_mean_fitness_per_generation_]
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_bloat_control(self):
+        Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['genotype']
+        Config.USER['advanced_training_parameters']['bloat_control']['parsimony_tie_breaking'] = True
+        Config.USER['advanced_training_parameters']['bloat_control']['size_penalty'] = 0.001
+        Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions'] = 30
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
+    def test_reinforcement_for_ttt_with_bloat_control_with_tight_budget(self):
+        Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['genotype']
+        Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions'] = 1
+        Config.check_parameters()
+        sbb = SBB()
+        sbb.run()
+        result = len(sbb.best_scores_per_runs_)
+        expected = 1
+        self.assertEqual(expected, result)
+
     def test_reinforcement_for_ttt_with_complex_instructions(self):
         Config.USER['advanced_training_parameters']['diversity']['metrics'] = ['ncd']
         Config.USER['advanced_training_parameters']['use_operations'] = ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'if_lesser_than_for_signal', 'if_equal_or_higher_than_for_signal', 'if_lesser_than', 'if_equal_or_higher_than']
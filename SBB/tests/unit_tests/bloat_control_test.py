@@ -0,0 +1,164 @@
+import copy
+import random
+import unittest
+from ...core.team import Team, reset_teams_ids
+from ...core.program import Program, reset_programs_ids
+from ...core.instruction import Instruction
+from ...core.selection import Selection
+from ...core.program_kernels import reset_program_kernels
+from ...config import Config
+
+TEST_CONFIG = {
+    'task': 'reinforcement',
+    'training_parameters': {
+        'team_size': {'min': 2, 'max': 9},
+        'program_size': {'min': 2, 'max': 20},
+        'mutation': {
+            'team': {'remove_program': 0.7, 'add_program': 0.8, 'mutate_program': 0.2},
+            'program': {'remove_instruction': 0.7, 'add_instruction': 0.8, 'change_instruction': 1.0,
+                'swap_instructions': 1.0, 'change_action': 0.1},
+        },
+        'replacement_rate': {'teams': 0.5},
+    },
+    'advanced_training_parameters': {
+        'use_operations': ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'if_lesser_than', 'if_equal_or_higher_than'],
+        'use_agressive_mutations': True,
+        'bloat_control': {'parsimony_tie_breaking': False, 'size_penalty': 0.0, 'max_team_instructions': None},
+        'diversity': {'metrics': []},
+        'selection': {'method': 'pareto', 'cost': None},
+        'second_layer': {'enabled': False},
+    },
+}
+
+class BloatControlTests(unittest.TestCase):
+    def setUp(self):
+        self.user = Config.USER
+        self.restrictions = dict(Config.RESTRICTIONS)
+        self.genotype_options = dict(Config.RESTRICTIONS['genotype_options'])
+        Config.USER = copy.deepcopy(TEST_CONFIG)
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = 4
+        Config.RESTRICTIONS['total_inputs'] = 4
+        Config.RESTRICTIONS['total_actions'] = 3
+        reset_program_kernels()
+        reset_programs_ids()
+        reset_teams_ids()
+        random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user
+        Config.RESTRICTIONS.clear()
+        Config.RESTRICTIONS.update(self.restrictions)
+        Config.RESTRICTIONS['genotype_options'].clear()
+        Config.RESTRICTIONS['genotype_options'].update(self.genotype_options)
+
+    def _random_program(self, action = None):
+        if action is None:
+            action = random.randrange(Config.RESTRICTIONS['total_actions'])
+        instructions = [Instruction() for _ in range(random.randint(2, 10))]
+        return Program(0, instructions, action)
+
+    def _team_with_fitness(self, fitness, total_programs):
+        programs = [self._random_program(action) for action in range(total_programs)]
+        team = Team(0, programs, None)
+        team.fitness_ = fitness
+        return team
+
+    def test_team_mutation_keeps_the_instructions_budget(self):
+        """ Ensures the team is never above ['bloat_control']['max_team_instructions'] after it is mutated """
+        programs_population = [self._random_program() for _ in range(60)]
+        for _ in range(300):
+            max_instructions = random.randint(10, 40)
+            Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions'] = max_instructions
+            while True:
+                programs = random.sample(programs_population, random.randint(2, 6))
+                team = Team(0, programs, None)
+                if (len(set([program.action for program in programs])) >= 2
+                        and team.total_effective_instructions() <= max_instructions):
+                    break
+            programs_population = team.mutate(programs_population)
+            self.assertTrue(team.total_effective_instructions() <= max_instructions)
+
+    def test_team_above_the_instructions_budget_removes_the_biggest_programs(self):
+        """ Ensures the biggest programs are removed from a team above the budget, while the min distinct actions are kept """
+        programs = [self._random_program(action) for action in [0, 1, 1, 1]]
+        team = Team(0, programs, None)
+        Config.USER['advanced_training_parameters']['bloat_control']['max_team_instructions'] = 0
+        team._remove_programs_above_instructions_budget()
+        self.assertEqual(2, len(team.programs))
+        self.assertEqual(set([0, 1]), set([program.action for program in team.programs]))
+        removable = [program for program in programs if program.action == 1]
+        smallest = min(removable, key = lambda program: program.total_effective_instructions())
+        self.assertEqual(smallest.total_effective_instructions(),
+            [program for program in team.programs if program.action == 1][0].total_effective_instructions())
+
+    def test_program_mutation_adds_no_instructions_at_the_max(self):
+        """ Ensures the mutation doesn't add instructions to a program at the max, but adds them without a max """
+        mutation = Config.USER['training_parameters']['mutation']['program']
+        for key in mutation:
+            mutation[key] = 0.0
+        mutation['add_instruction'] = 1.0
+        for _ in range(200):
+            program = self._random_program()
+            total_instructions = len(program.instructions)
+            effective_instructions = program.total_effective_instructions()
+            program.mutate(max_effective_instructions = effective_instructions)
+            self.assertEqual(total_instructions, len(program.instructions))
+            self.assertEqual(effective_instructions, program.total_effective_instructions())
+            program.mutate()
+            self.assertEqual(total_instructions+1, len(program.instructions))
+
+    def test_program_mutation_removes_instructions_above_the_max(self):
+        """ Ensures the mutated program isn't above the max, unless it has the min program size """
+        for _ in range(200):
+            program = self._random_program()
+            max_instructions = random.randint(0, 4)
+            program.mutate(max_effective_instructions = max_instructions)
+            self.assertTrue(program.total_effective_instructions() <= max_instructions
+                or len(program.instructions) == Config.USER['training_parameters']['program_size']['min'])
+
+    def test_parsimony_tie_breaking_keeps_the_smaller_team(self):
+        """ Ensures the smaller of two teams with the same fitness is kept, only if parsimony_tie_breaking is enabled """
+        bigger = self._team_with_fitness(0.5, 3)
+        smaller = Team(0, [bigger.programs[0], bigger.programs[1]], None)
+        smaller.fitness_ = 0.5
+        self.assertTrue(smaller.total_effective_instructions() < bigger.total_effective_instructions())
+        selection = Selection(None)
+
+        keep_teams, remove_teams, _ = selection._select_teams_to_keep_and_remove([bigger, smaller])
+        self.assertEqual([bigger], keep_teams) # without tie-breaking, the order of the population is kept
+
+        Config.USER['advanced_training_parameters']['bloat_control']['parsimony_tie_breaking'] = True
+        keep_teams, remove_teams, _ = selection._select_teams_to_keep_and_remove([bigger, smaller])
+        self.assertEqual([smaller], keep_teams)
+        self.assertEqual([bigger], remove_teams)
+
+    def test_parsimony_tie_breaking_doesnt_change_the_fitness_order(self):
+        """ Ensures a bigger team with a higher fitness is kept even with parsimony_tie_breaking """
+        Config.USER['advanced_training_parameters']['bloat_control']['parsimony_tie_breaking'] = True
+        bigger = self._team_with_fitness(0.6, 3)
+        smaller = Team(0, [bigger.programs[0], bigger.programs[1]], None)
+        smaller.fitness_ = 0.5
+        keep_teams, _, _ = Selection(None)._select_teams_to_keep_and_remove([smaller, bigger])
+        self.assertEqual([bigger], keep_teams)
+
+    def test_size_penalty(self):
+        """ Ensures the selection fitness is the fitness minus size_penalty per effective instruction """
+        bigger = self._team_with_fitness(0.6, 3)
+        smaller = Team(0, [bigger.programs[0], bigger.programs[1]], None)
+        smaller.fitness_ = 0.5
+        difference = bigger.total_effective_instructions() - smaller.total_effective_instructions()
+        self.assertTrue(difference > 0)
+        self.assertEqual(0.6, bigger.selection_fitness())
+        keep_teams, _, _ = Selection(None)._select_teams_to_keep_and_remove([smaller, bigger])
+        self.assertEqual([bigger], keep_teams)
+
+        size_penalty = 0.2/difference # the penalty of the bigger team is 0.2 above the smaller one
+        Config.USER['advanced_training_parameters']['bloat_control']['size_penalty'] = size_penalty
+        self.assertAlmostEqual(0.6-size_penalty*bigger.total_effective_instructions(), bigger.selection_fitness())
+        self.assertAlmostEqual(0.5-size_penalty*smaller.total_effective_instructions(), smaller.selection_fitness())
+        self.assertEqual(0.6, bigger.fitness_)
+        keep_teams, _, _ = Selection(None)._select_teams_to_keep_and_remove([smaller, bigger])
+        self.assertEqual([smaller], keep_teams)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import random
+import unittest
+import numpy
+from ...core.compiled_program import CompiledProgram
+from ...core.instruction import Instruction
+from ...core.operations import Operation
+from ...config import Config
+
+def interpret(instructions, registers, inputs):
+    """
+    Reference implementation: the instruction-by-instruction interpreter previously used by Program.execute
+    """
+    if_instruction = None
+    skip_next = False
+    for instruction in instructions:
+        if if_instruction and not Operation.execute_if(if_instruction.op, if_instruction.target,
+                if_instruction.source):
+            if_instruction = None
+            if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                skip_next = True
+        elif skip_next:
+            if instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                skip_next = True
+            else:
+                skip_next = False
+        elif instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+            if_instruction = instruction
+        elif instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+            registers[instruction.target] = Operation.execute(instruction.op, registers[instruction.target])
+        else:
+            if instruction.mode == 'read-register':
+                source = registers[instruction.source]
+            else:
+                source = inputs[instruction.source]
+            registers[instruction.target] = Operation.execute(instruction.op, registers[instruction.target], source)
+    return registers[0]
+
+class CompiledProgramTests(unittest.TestCase):
+    def setUp(self):
+        self.total_registers = 5
+        self.operators = CompiledProgram.OPERATORS
+
+    def _random_instruction(self, total_inputs):
+        mode = random.choice(['read-register', 'read-input'])
+        if mode == 'read-register':
+            source = random.randrange(self.total_registers)
+        else:
+            source = random.randrange(total_inputs)
+        return Instruction(mode = mode, target = random.randrange(self.total_registers),
+            op = random.choice(self.operators), source = source)
+
+    def test_same_output_as_interpreter_for_random_programs(self):
+        """ Ensures the compiled code computes the same registers as the instruction interpreter """
+        random.seed(1)
+        total_inputs = 5
+        for _ in range(500):
+            instructions = [self._random_instruction(total_inputs) for _ in range(random.randint(1, 20))]
+            compiled = CompiledProgram(instructions)
+            for _ in range(5):
+                inputs = [random.uniform(-10.0, 10.0) for _ in range(total_inputs)]
+                expected_registers = [0] * self.total_registers
+                registers = [0] * self.total_registers
+                expected = interpret(instructions, expected_registers, inputs)
+                result = compiled.execute(registers, inputs)
+                self.assertEqual(repr(expected), repr(result))
+                self.assertEqual(repr(expected_registers), repr(registers))
+
+    def test_same_output_as_interpreter_for_integer_inputs(self):
+        """ Ensures the compiled code keeps the integer arithmetic of the interpreter """
+        random.seed(2)
+        total_inputs = 3
+        for _ in range(200):
+            instructions = [self._random_instruction(total_inputs) for _ in range(random.randint(1, 10))]
+            compiled = CompiledProgram(instructions)
+            inputs = [random.randint(-5, 5) for _ in range(total_inputs)]
+            expected = interpret(instructions, [0] * self.total_registers, inputs)
+            result = compiled.execute([0] * self.total_registers, inputs)
+            self.assertEqual(repr(expected), repr(result))
+
+    def test_batch_same_output_as_interpreter_for_random_programs(self):
+        """ Ensures the batch execution computes the same bids as the interpreter for each point """
+        random.seed(3)
+        numpy.random.seed(3)
+        total_inputs = 5
+        for _ in range(500):
+            instructions = [self._random_instruction(total_inputs) for _ in range(random.randint(1, 20))]
+            compiled = CompiledProgram(instructions)
+            inputs_matrix = numpy.random.uniform(-10.0, 10.0, size = (20, total_inputs))
+            with numpy.errstate(all = 'ignore'): # the inputs are numpy scalars
+                expected = [interpret(instructions, [0] * self.total_registers, inputs) for inputs in inputs_matrix]
+            result = compiled.execute_batch(inputs_matrix)
+            self.assertEqual(len(expected), len(result))
+            numpy.testing.assert_allclose(result, expected, rtol = 1e-12)
+
+    def test_same_output_for_infinity_and_nan_inputs(self):
+        """ Ensures the interpreter, the compiled code and the batch execution agree when the inputs have Infinity or NaN """
+        random.seed(4)
+        total_inputs = 4
+        special_values = [float('inf'), float('-inf'), float('NaN'), 0.0, 1.0, -2.5]
+        inputs_matrix = [[random.choice(special_values) for _ in range(total_inputs)] for _ in range(20)]
+        for _ in range(300):
+            instructions = [self._random_instruction(total_inputs) for _ in range(random.randint(1, 10))]
+            compiled = CompiledProgram(instructions)
+            expected = [interpret(instructions, [0.0] * self.total_registers, inputs) for inputs in inputs_matrix]
+            result = [compiled.execute([0.0] * self.total_registers, inputs) for inputs in inputs_matrix]
+            self.assertEqual(repr(expected), repr(result))
+            numpy.testing.assert_array_equal(compiled.execute_batch(inputs_matrix), expected)
+
+    def test_batch_protected_operations(self):
+        """ Ensures the batch execution ignores instructions that result in NaN or Infinity only for the affected points """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '/', source = 1))
+        instructions.append(Instruction(mode = 'read-register', target = 0, op = 'ln', source = 0))
+        compiled = CompiledProgram(instructions)
+        result = compiled.execute_batch([[4.0, 0.0], [-4.0, 2.0], [numpy.e, 1.0]])
+        numpy.testing.assert_allclose(result, [numpy.log(4.0), -2.0, 1.0])
+
+    def test_batch_float32_registers(self):
+        """ Ensures float32 inputs are executed with float32 registers, with the protection applied in float32 """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        instructions.append(Instruction(mode = 'read-register', target = 0, op = 'exp', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '*', source = 1))
+        compiled = CompiledProgram(instructions)
+        inputs = [[100.0, 0.5], [1.0, 0.5]]
+        result = compiled.execute_batch(numpy.array(inputs, dtype = numpy.float32))
+        self.assertEqual(numpy.float32, result.dtype)
+        numpy.testing.assert_allclose(result, [50.0, numpy.e*0.5], rtol = 1e-6) # exp(100.0) overflows float32
+        result = compiled.execute_batch(numpy.array(inputs, dtype = numpy.float64))
+        self.assertEqual(numpy.float64, result.dtype)
+        numpy.testing.assert_allclose(result, [numpy.exp(100.0)*0.5, numpy.e*0.5], rtol = 1e-12)
+
+    def test_true_if_keeps_next_instruction(self):
+        """ Ensures the instruction after a true 'if' is compiled """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-register', target = 0, op = 'if_lesser_than', source = 1))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        compiled = CompiledProgram(instructions)
+        self.assertEqual(1, len(compiled))
+        self.assertEqual(3.0, compiled.execute([0] * self.total_registers, [3.0]))
+
+    def test_false_if_skips_next_instruction(self):
+        """ Ensures the instruction after a false 'if' is not compiled """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-register', target = 1, op = 'if_lesser_than', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '-', source = 1))
+        compiled = CompiledProgram(instructions)
+        self.assertEqual(1, len(compiled))
+        self.assertEqual(-2.0, compiled.execute([0] * self.total_registers, [3.0, 2.0]))
+
+    def test_false_if_skips_nested_ifs(self):
+        """ Ensures a false 'if' also skips the nested 'if' and the instruction it guards """
+        instructions = []
+        instructions.append(Instruction(mode = 'read-register', target = 1, op = 'if_lesser_than', source = 0))
+        instructions.append(Instruction(mode = 'read-register', target = 0, op = 'if_lesser_than', source = 1))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '+', source = 0))
+        instructions.append(Instruction(mode = 'read-input', target = 0, op = '-', source = 1))
+        compiled = CompiledProgram(instructions)
+        self.assertEqual(1, len(compiled))
+        self.assertEqual(-2.0, compiled.execute([0] * self.total_registers, [3.0, 2.0]))
+
+if __name__ == '__main__':
+    unittest.main()
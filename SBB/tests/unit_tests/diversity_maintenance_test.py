@@ -0,0 +1,136 @@
+import random
+import unittest
+import numpy
+from ...core.diversity_maintenance import DiversityMaintenance
+from ...utils.helpers import round_value
+from ...config import Config
+
+class DummyPoint():
+    def __init__(self, point_id):
+        self.point_id_ = point_id
+
+class DummyTeam():
+    def __init__(self, active_programs, pattern_of_actions, actions = None):
+        self.active_programs_ = active_programs
+        self.results_per_points_ = dict([(point_id, random.choice([0.0, 0.5, 1.0])) for point_id in range(10)])
+        self.encodings_ = {'encoding_for_pattern_of_actions_per_match': pattern_of_actions,
+            'encoding_for_actions_per_match': actions, 'encoding_custom_info_per_match': actions}
+        self.diversity_ = {}
+
+def diversities_for_each_pair(population, k, distance):
+    """
+    Reference implementation: the kNN over the distances calculated for each pair of teams, previously used 
+    by DiversityMaintenance.calculate_diversities_based_on_distances
+    """
+    diversities = []
+    for team in population:
+        results = []
+        for other_team in population:
+            if team != other_team:
+                results.append(getattr(DiversityMaintenance, "_"+distance)(team, other_team))
+        diversities.append(round_value(numpy.mean(sorted(results)[:k])))
+    return diversities
+
+def fitness_sharing_for_each_point(population, point_population):
+    """
+    Reference implementation: the loops over the teams and points previously used by
+    DiversityMaintenance._fitness_sharing
+    """
+    denominators = [1.0] * len(point_population)
+    for index, point in enumerate(point_population):
+        for team in population:
+            denominators[index] += float(team.results_per_points_[point.point_id_])
+    diversities = []
+    for team in population:
+        score = 0.0
+        for index, point in enumerate(point_population):
+            score += float(team.results_per_points_[point.point_id_]) / denominators[index]
+        diversities.append(round_value(score/float(len(point_population))))
+    return diversities
+
+class DiversityMaintenanceTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.max_euclidean = Config.RESTRICTIONS['diversity'].get('max_euclidean')
+        Config.RESTRICTIONS['diversity']['max_euclidean'] = 12.0
+        self.user = Config.USER
+        Config.USER = {'advanced_training_parameters': {
+            'diversity': {'ncd': {'compressor': 'bz2', 'level': 9, 'symmetric': False}},
+            'parallelism': {'mode': 'serial', 'workers': 2},
+        }}
+        programs = range(15)
+        self.population = [DummyTeam(random.sample(programs, random.randint(1, 5)), 
+            [random.randrange(3) for _ in range(8)], [str(random.randrange(9)) for _ in range(60)]) 
+            for _ in range(20)]
+        self.population[5].encodings_ = dict(self.population[4].encodings_) # teams with the same actions
+        self.population += self.population[:3] # ie. teams in the population and in the novelty archive
+
+    def tearDown(self):
+        Config.USER = self.user
+        if self.max_euclidean is None:
+            Config.RESTRICTIONS['diversity'].pop('max_euclidean')
+        else:
+            Config.RESTRICTIONS['diversity']['max_euclidean'] = self.max_euclidean
+
+    def _assert_same_diversities(self, distance, k):
+        expected = diversities_for_each_pair(self.population, k, distance)
+        DiversityMaintenance.calculate_diversities_based_on_distances(self.population, k, [distance])
+        self.assertEqual(expected, [team.diversity_[distance] for team in self.population])
+
+    def test_genotype(self):
+        """ Ensures the genotype diversities are the same as the ones calculated for each pair of teams """
+        self._assert_same_diversities('genotype', 3)
+
+    def test_hamming(self):
+        """ Ensures the hamming diversities are the same as the ones calculated for each pair of teams """
+        self._assert_same_diversities('hamming', 3)
+
+    def test_euclidean(self):
+        """ Ensures the euclidean diversities are the same as the ones calculated for each pair of teams """
+        self._assert_same_diversities('euclidean', 3)
+
+    def test_ncd(self):
+        """ Ensures the ncd diversities are the same as the ones calculated for each pair of teams """
+        self._assert_same_diversities('ncd', 3)
+
+    def test_ncd_with_zlib(self):
+        """ Ensures the ncd diversities are the same as the ones calculated for each pair of teams, with zlib """
+        Config.USER['advanced_training_parameters']['diversity']['ncd']['compressor'] = 'zlib'
+        Config.USER['advanced_training_parameters']['diversity']['ncd']['level'] = 1
+        self._assert_same_diversities('ncd_custom', 3)
+
+    def test_ncd_with_pool(self):
+        """ Ensures the ncd diversities are the same when the sequences are compressed by a multiprocessing pool """
+        Config.USER['advanced_training_parameters']['parallelism']['mode'] = 'pool'
+        self._assert_same_diversities('ncd', 3)
+
+    def test_symmetric_ncd(self):
+        """ Ensures each pair of teams is compressed only once for the symmetric ncd """
+        Config.USER['advanced_training_parameters']['diversity']['ncd']['symmetric'] = True
+        teams = self.population[:20]
+        matrix = DiversityMaintenance.distance_matrix(teams, 'ncd')
+        self.assertTrue(numpy.array_equal(matrix, matrix.T))
+        self.assertEqual(0.0, matrix[4, 5])
+        for index, team in enumerate(teams):
+            for other_index, other_team in enumerate(teams[index+1:], index+1):
+                self.assertEqual(DiversityMaintenance._ncd(team, other_team), matrix[index, other_index])
+
+    def test_fitness_sharing(self):
+        """ Ensures the fitness sharing is the same as the one calculated for each team and point """
+        point_population = [DummyPoint(point_id) for point_id in [3, 1, 4, 5, 9, 2, 6]]
+        expected = fitness_sharing_for_each_point(self.population, point_population)
+        DiversityMaintenance._fitness_sharing(self.population, point_population)
+        self.assertEqual(expected, [team.diversity_['fitness_sharing'] for team in self.population])
+
+    def test_k_higher_than_the_population(self):
+        """ Ensures all the other teams are used when k is higher than the population size """
+        self._assert_same_diversities('genotype', 50)
+
+    def test_symmetric_distance_matrix(self):
+        """ Ensures the distance matrix is symmetric and the distance of a team to itself is zero """
+        matrix = DiversityMaintenance.distance_matrix(self.population[:20], 'genotype')
+        self.assertTrue(numpy.array_equal(matrix, matrix.T))
+        self.assertTrue(numpy.all(numpy.diag(matrix) == 0.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+from ...environments.environment_registry import register_environment, get_environment_class, _environments
+from ...environments.reinforcement.tictactoe.tictactoe_environment import TictactoeEnvironment
+from ...config import Config
+
+class EnvironmentRegistryTests(unittest.TestCase):
+    def tearDown(self):
+        if 'custom_tictactoe' in _environments:
+            del _environments['custom_tictactoe']
+            Config.RESTRICTIONS['environment_types'].remove('custom_tictactoe')
+
+    def test_registered_environment(self):
+        """ Ensures an environment registered by another package can be selected in the CONFIG """
+        register_environment('custom_tictactoe', 'SBB.environments.reinforcement.tictactoe.tictactoe_environment', 
+            'TictactoeEnvironment')
+        self.assertEqual(TictactoeEnvironment, get_environment_class('custom_tictactoe'))
+        self.assertTrue('custom_tictactoe' in Config.RESTRICTIONS['environment_types'])
+
+    def test_unknown_environment(self):
+        """ Ensures an environment that wasn't registered raises an error """
+        self.assertRaises(ValueError, get_environment_class, 'custom_tictactoe')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import numpy
+from ...utils.helpers import results_matrix, accumulative_performances
+
+class DummyTeam():
+    def __init__(self, team_id, score, results_per_points):
+        self.team_id_ = team_id
+        self.score_ = score
+        self.results_per_points_ = results_per_points
+
+    def __repr__(self):
+        return str(self.team_id_)
+
+class HelpersTests(unittest.TestCase):
+    def setUp(self):
+        self.teams = [
+            DummyTeam(1, 0.2, {10: 1.0, 11: 0.0, 12: 0.5}),
+            DummyTeam(2, 0.9, {10: 0.0, 11: 1.0, 13: 1.0}),
+            DummyTeam(3, 0.5, {10: 0.5, 11: 0.5, 12: 1.0}),
+        ]
+
+    def test_results_matrix(self):
+        """ Ensures the matrix has one row per team and one column per point, with 0.0 for missing results """
+        expected = numpy.array([[1.0, 0.0, 0.5], [0.0, 1.0, 0.0], [0.5, 0.5, 1.0]])
+        self.assertTrue(numpy.array_equal(expected, results_matrix(self.teams, [10, 11, 12])))
+
+    def test_accumulative_performances(self):
+        """ Ensures the accumulative performance is the total of the best results of the teams so far """
+        individual, accumulative, teams_ids = accumulative_performances(self.teams, [10, 11, 12], 
+            lambda team: team.score_, lambda team: team.results_per_points_)
+        self.assertEqual(['2', '3', '1'], teams_ids)
+        self.assertEqual([1.0, 2.0, 1.5], individual)
+        self.assertEqual([1.0, 2.5, 3.0], accumulative)
+
+if __name__ == '__main__':
+    unittest.main()
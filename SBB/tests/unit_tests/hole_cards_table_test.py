@@ -0,0 +1,22 @@
+import itertools
+import unittest
+from ...environments.reinforcement.poker.hand_generator.tables.hole_cards_table import (hole_cards_index,
+    NORMALIZED_HAND_EQUITY, STRENGTH_TABLE_FOR_2_CARDS, TOTAL_HOLE_CARDS)
+from ...environments.reinforcement.poker.hand_generator.poker_hands_converter import card_to_code
+
+class HoleCardsTableTests(unittest.TestCase):
+    def test_distinct_index_for_each_hole_cards(self):
+        """ Ensures each pair of cards has a distinct index in the table, in any order """
+        indices = [hole_cards_index(code1, code2) for code1, code2 in itertools.combinations(range(52), 2)]
+        self.assertEqual(range(TOTAL_HOLE_CARDS), sorted(indices))
+        self.assertEqual(hole_cards_index(3, 40), hole_cards_index(40, 3))
+
+    def test_values_for_hole_cards(self):
+        """ Ensures the values are the same for a frozenset, a list in any order, and arrays of codes """
+        self.assertEqual(1.0, NORMALIZED_HAND_EQUITY[frozenset(['As', 'Ad'])])
+        self.assertEqual(STRENGTH_TABLE_FOR_2_CARDS[['As', 'Kd']], STRENGTH_TABLE_FOR_2_CARDS[['Kd', 'As']])
+        values = STRENGTH_TABLE_FOR_2_CARDS.values([card_to_code('As'), card_to_code('2c')], [card_to_code('Kd'), card_to_code('7h')])
+        self.assertEqual([STRENGTH_TABLE_FOR_2_CARDS[['As', 'Kd']], STRENGTH_TABLE_FOR_2_CARDS[['2c', '7h']]], values.tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import math
+import random
+import warnings
+import unittest
+import numpy
+from ...core.operations import Operation, PROTECTED_OPERATIONS
+
+INFINITY = float('inf')
+NAN = float('NaN')
+
+def execute(operator, target, source=float('NaN')):
+    """
+    Reference implementation: the string comparisons inside a warnings context previously used by
+    Operation.execute
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        error = False
+        try:
+            if operator == '+':
+                result = target + source
+            elif operator == '-':
+                result = target - source
+            elif operator == '*':
+                result = target * source
+            elif operator == '/':
+                result = target / source
+            elif operator == 'ln':
+                result = numpy.log(target)
+            elif operator == 'exp':
+                result = math.exp(target)
+            elif operator == 'cos':
+                result = numpy.cos(target)
+            elif operator == 'sin':
+                result = numpy.sin(target)
+            elif operator == 'if_lesser_than_for_signal':
+                if (target < source):
+                    return -target
+                else:
+                    return target
+            elif operator == 'if_equal_or_higher_than_for_signal':
+                if (target >= source):
+                    return -target
+                else:
+                    return target
+        except ArithmeticError:
+            error = True
+        if error or math.isnan(result) or math.isinf(result):
+            return target
+        return result
+
+class OperationsTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def _random_value(self):
+        option = random.random()
+        if option < 0.2:
+            return random.randint(-5, 5)
+        if option < 0.3:
+            return numpy.float64(random.uniform(-100.0, 100.0))
+        if option < 0.4:
+            return random.choice([0.0, -0.0, 1e308, -1e308, 1e-320, 709.7, 710.0, INFINITY, -INFINITY, NAN])
+        return random.uniform(-1000.0, 1000.0)*random.choice([1.0, 1e-5, 1e5, 1e150])
+
+    def test_same_results_as_reference(self):
+        """ Ensures the protected operations have the same results of the previous implementation, including the errors """
+        with numpy.errstate(all = 'ignore'):
+            for _ in range(20000):
+                operator = random.choice(sorted(PROTECTED_OPERATIONS.keys()))
+                target = self._random_value()
+                source = self._random_value()
+                expected = execute(operator, target, source)
+                result = Operation.execute(operator, target, source)
+                self.assertEqual(repr(expected), repr(result))
+                self.assertEqual(isinstance(expected, int), isinstance(result, int))
+
+    def test_no_warnings_for_python_numbers(self):
+        """ Ensures the protected operations don't warn, so there is no need to change the warning filters """
+        with warnings.catch_warnings(record = True) as caught:
+            warnings.simplefilter("always")
+            for operator in PROTECTED_OPERATIONS:
+                for target, source in [(1e308, 1e308), (0.0, 0.0), (-1.0, 0.0), (1000.0, 1.0), (0, 0),
+                        (INFINITY, 1.0), (-INFINITY, INFINITY), (NAN, 1.0), (1.0, NAN)]:
+                    Operation.execute(operator, target, source)
+        self.assertEqual([], caught)
+
+    def test_batch_same_results_as_scalar(self):
+        """ Ensures the column version of the operations has the same results of the scalar version """
+        targets = numpy.array([0.0, -1.0, 2.5, 1e308, 710.0, -3.0, INFINITY, -INFINITY, NAN, 1.0, INFINITY])
+        sources = numpy.array([0.0, 0.0, -1.5, 1e308, 2.0, 7.0, 1.0, 2.0, 1.0, NAN, -INFINITY])
+        for operator in PROTECTED_OPERATIONS:
+            result = Operation.execute_batch(operator, targets, sources)
+            with numpy.errstate(all = 'ignore'): # the values are numpy scalars
+                expected = [Operation.execute(operator, target, source) for target, source in zip(targets, sources)]
+            self.assertEqual(repr(expected), repr(list(result)))
+
+if __name__ == '__main__':
+    unittest.main()
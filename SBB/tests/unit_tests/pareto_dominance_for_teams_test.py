@@ -0,0 +1,97 @@
+import random
+import unittest
+import numpy
+from ...core.pareto_dominance_for_teams import ParetoDominanceForTeams
+
+class DummyTeam():
+    def __init__(self, fitness, diversity):
+        self.fitness_ = fitness
+        self.diversity_ = {'genotype': diversity}
+
+    def selection_fitness(self):
+        return self.fitness_
+
+def pareto_front_for_each_pair(teams_population, novelty):
+    """
+    Reference implementation: the loops over each pair of teams previously used by
+    ParetoDominanceForTeams._pareto_front
+    """
+    for team in teams_population:
+        team.dom_by_ = 0
+        team.dom_of_ = 0
+    front = []
+    dominateds = []
+    for teamA in teams_population:
+        for teamB in teams_population:
+            if ParetoDominanceForTeams._is_dominated(teamA, teamB, novelty):
+                teamA.dom_by_ += 1
+                teamB.dom_of_ += 1
+                if teamA not in dominateds:
+                    dominateds.append(teamA)
+        if teamA.dom_by_ == 0:
+            front.append(teamA)
+    return front, dominateds
+
+class ParetoDominanceForTeamsTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def _population(self, size):
+        # few distinct values and values closer than the nearly equal threshold, to have ties
+        values = [0.0, 0.25, 0.25+0.00005, 0.5, 0.5-0.00005, 0.5+0.0001, 0.75, 1.0]
+        return [DummyTeam(random.choice(values), random.choice(values)) for _ in range(size)]
+
+    def test_pareto_front_is_the_same_of_the_comparisons_for_each_pair(self):
+        """ Ensures the front, the dominateds and the dominance counters are the same of comparing each pair of teams """
+        for size in [1, 2, 10, 50]:
+            population = self._population(size)
+            front, dominateds = ParetoDominanceForTeams._pareto_front(population, 'genotype')
+            counters = [(team.dom_by_, team.dom_of_) for team in population]
+            scores = [(team.submission_score_, team.dominance_score_) for team in population]
+            expected_front, expected_dominateds = pareto_front_for_each_pair(population, 'genotype')
+            self.assertEqual(expected_front, front)
+            self.assertEqual(expected_dominateds, dominateds)
+            self.assertEqual([(team.dom_by_, team.dom_of_) for team in population], counters)
+            self.assertEqual([(team.dom_by_/float(size), team.dom_of_/float(size)) for team in population], scores)
+
+    def test_fronts_are_the_pareto_fronts_of_the_remaining_teams(self):
+        """ Ensures each front is the pareto front of the teams that aren't in the previous fronts """
+        population = self._population(50)
+        fronts = ParetoDominanceForTeams.fronts(population, 'genotype')
+        self.assertEqual(sorted(map(id, population)), sorted([id(team) for front in fronts for team in front]))
+        remaining = list(population)
+        for front in fronts:
+            expected_front, _ = pareto_front_for_each_pair(remaining, 'genotype')
+            self.assertEqual(expected_front, front)
+            remaining = [team for team in remaining if team not in front]
+
+    def test_crowding_distances(self):
+        """ Ensures the extremes have infinite distances and the others the normalized distances between their neighbors """
+        objectives = numpy.array([[0.0, 1.0], [0.25, 0.5], [0.5, 0.4], [1.0, 0.0]])
+        result = ParetoDominanceForTeams.crowding_distances(objectives)
+        expected = [numpy.inf, 0.5+0.6, 0.75+0.5, numpy.inf]
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_nsga2_keeps_the_best_fronts_and_the_less_crowded_teams(self):
+        """ Ensures the teams are kept by front, and from the last front by crowding distance """
+        objectives = numpy.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.5, 0.5, 0.0], [0.45, 0.45, -1.0], 
+            [0.1, 0.1, 0.0], [0.05, 0.05, 0.0]])
+        population = [DummyTeam(fitness, diversity) for fitness, diversity, _ in objectives]
+        keep, remove, pareto_front = ParetoDominanceForTeams.run_nsga2(population, objectives, 4)
+        self.assertEqual(population[0:3], pareto_front)
+        self.assertEqual(population[0:4], keep)
+        self.assertEqual(population[4:], remove)
+
+        keep, remove, pareto_front = ParetoDominanceForTeams.run_nsga2(population, objectives, 2)
+        self.assertEqual([population[0], population[1]], keep)
+        self.assertEqual([population[2], population[3], population[4], population[5]], remove)
+
+    def test_nsga2_with_two_objectives_has_the_same_front_of_pareto(self):
+        """ Ensures the fronts over the objectives matrix are the same of the fronts over fitness and novelty """
+        population = self._population(50)
+        objectives = numpy.array([[team.fitness_, team.diversity_['genotype']] for team in population])
+        _, _, pareto_front = ParetoDominanceForTeams.run_nsga2(population, objectives, 50)
+        self.assertEqual(ParetoDominanceForTeams.fronts(population, 'genotype')[0], pareto_front)
+
+if __name__ == '__main__':
+    unittest.main()
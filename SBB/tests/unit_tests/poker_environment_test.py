@@ -0,0 +1,56 @@
+import json
+import unittest
+from ...environments.reinforcement.poker.poker_environment import PokerEnvironment
+from ...environments.reinforcement.poker.opponent_model import OpponentModel
+from ...core.distributed_coordinator import _to_str
+
+class DummyTeam():
+    def __init__(self, team_id):
+        self.team_id_ = team_id
+        self.opponent_model = {}
+        self.chips = {}
+
+class PokerEnvironmentTests(unittest.TestCase):
+    def setUp(self):
+        self.environment = PokerEnvironment.__new__(PokerEnvironment) # only the hall of fame is used
+        self.hall_of_fame = [DummyTeam(10), DummyTeam(11)]
+        self.environment.current_hall_of_fame_opponents_ = [self.hall_of_fame[0], self.hall_of_fame[1],
+            self.hall_of_fame[0]]
+
+    def _play(self, opponent, team, value):
+        opponent_model = OpponentModel()
+        opponent_model.update_overall_agressiveness(3, ['c', 'r'], ['r'], 7, True)
+        opponent.opponent_model[team.team_id_] = opponent_model
+        opponent.chips[team.team_id_] = [value]
+
+    def test_merge_evaluation_state_for_hall_of_fame(self):
+        """ Ensures the opponent models and chips of the hall of fame changed in another process are merged for each team """
+        teams = [DummyTeam(1), DummyTeam(2)]
+        self._play(self.hall_of_fame[0], teams[0], 0.25)
+        self._play(self.hall_of_fame[1], teams[0], 0.5)
+        self._play(self.hall_of_fame[0], teams[1], 0.75)
+        expected_models = dict([((opponent.team_id_, team_id), vars(opponent_model))
+            for opponent in self.hall_of_fame for team_id, opponent_model in opponent.opponent_model.items()])
+        expected_chips = [dict(opponent.chips) for opponent in self.hall_of_fame]
+        states = [_to_str(json.loads(json.dumps(self.environment.evaluation_state(team)))) for team in teams]
+        self.assertEqual(2, len(states[0]))
+        self.assertEqual(1, len(states[1]))
+
+        for opponent in self.hall_of_fame: # as in the current process, before the merge
+            opponent.opponent_model = {}
+            opponent.chips = {}
+        for team, state in zip(teams, states):
+            self.environment.merge_evaluation_state(team, state)
+        result_models = dict([((opponent.team_id_, team_id), vars(opponent_model))
+            for opponent in self.hall_of_fame for team_id, opponent_model in opponent.opponent_model.items()])
+        self.assertEqual(expected_models, result_models)
+        self.assertEqual(expected_chips, [opponent.chips for opponent in self.hall_of_fame])
+        self.assertTrue(isinstance(self.hall_of_fame[0].opponent_model[1], OpponentModel))
+
+    def test_no_evaluation_state_without_hall_of_fame(self):
+        """ Ensures there is nothing to merge for the teams that didn't play against the hall of fame """
+        self.environment.current_hall_of_fame_opponents_ = []
+        self.assertEqual([], self.environment.evaluation_state(DummyTeam(1)))
+
+if __name__ == '__main__':
+    unittest.main()
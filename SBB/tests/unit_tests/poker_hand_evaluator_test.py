@@ -0,0 +1,129 @@
+import random
+import itertools
+import unittest
+from ...environments.reinforcement.poker.hand_generator.poker_hand_evaluator import PokerHandEvaluator
+from ...environments.reinforcement.poker.hand_generator.poker_hand_generator import cross_check_hands
+from ...environments.reinforcement.poker.poker_config import PokerConfig
+
+RANKS = PokerConfig.CONFIG['ranks']
+
+def evaluate_five_cards(cards):
+    ranks = sorted([RANKS.index(card[0]) for card in cards], reverse = True)
+    groups = sorted([(ranks.count(rank), rank) for rank in set(ranks)], reverse = True)
+    ordered_ranks = [rank for count, rank in groups] # by the number of cards, then by the rank
+    counts = [count for count, rank in groups]
+    is_flush = len(set([card[1] for card in cards])) == 1
+    is_straight = len(set(ranks)) == 5 and ranks[0]-ranks[4] == 4
+    if ranks == [12, 3, 2, 1, 0]: # A-2-3-4-5, the ace is the lowest card
+        is_straight = True
+        ordered_ranks = [3, 2, 1, 0, -1]
+    if is_straight and is_flush:
+        category = 8
+    elif counts == [4, 1]:
+        category = 7
+    elif counts == [3, 2]:
+        category = 6
+    elif is_flush:
+        category = 5
+    elif is_straight:
+        category = 4
+    elif counts == [3, 1, 1]:
+        category = 3
+    elif counts == [2, 2, 1]:
+        category = 2
+    elif counts == [2, 1, 1, 1]:
+        category = 1
+    else:
+        category = 0
+    return tuple([category]+ordered_ranks)
+
+def evaluate_best_five_cards(cards):
+    return max([evaluate_five_cards(five_cards) for five_cards in itertools.combinations(cards, 5)])
+
+def order_of_values(values):
+    unique_values = sorted(set(values))
+    return [unique_values.index(value) for value in values]
+
+class PokerHandEvaluatorTests(unittest.TestCase):
+    def test_order_of_hands(self):
+        """ Ensures the hands are ordered from the best to the worst, including the tie-breakers """
+        hands = [
+            "As Ks Qs Js Ts 2d 3c", # straight flush
+            "5s 4s 3s 2s As Kd Kc", # straight flush, ace as the lowest card
+            "Ad Ac Ah As Kd 2c 3c", # four of a kind
+            "Ad Ac Ah As Qd Qc Qh", # four of a kind, lower kicker
+            "Kd Kc Kh Qs Qd 2c 2h", # full house
+            "Kd Kc Kh 2s 2d 2c Qh", # full house, lower pair
+            "As 9s 7s 4s 2s Kd Kc", # flush
+            "Td 9c 8h 7s 6d 2c 2h", # straight
+            "Ad 2c 3h 4s 5d Kc Kh", # straight, ace as the lowest card
+            "7d 7c 7h As Kd 2c 3h", # three of a kind
+            "7d 7c 5h 5s Kd Kc Ah", # two pair
+            "7d 7c 5h 5s Kd Kc 3h", # two pair, lower kicker
+            "7d 7c Ah Ks 9d 3c 2h", # one pair
+            "Ad Kc 9h 7s 5d 3c 2h", # high card
+            "Ad Kc 9h 7s 4d 3c 2h", # high card, lower fifth card
+        ]
+        values = [PokerHandEvaluator.evaluate(hand.split()) for hand in hands]
+        self.assertEqual(sorted(values, reverse = True), values)
+        self.assertEqual(len(values), len(set(values)))
+
+    def test_ties(self):
+        """ Ensures the hands that differ only by the suits or by the unused cards are tied """
+        self.assertEqual(PokerHandEvaluator.evaluate("As Ks Qs Js Ts".split()),
+            PokerHandEvaluator.evaluate("Ah Kh Qh Jh Th 2d 3c".split()))
+        self.assertEqual(PokerHandEvaluator.evaluate("Ad Kc 9h 7s 5d 3c 2h".split()),
+            PokerHandEvaluator.evaluate("Ac Kd 9s 7h 5c 4d 3h".split()))
+
+    def test_same_order_as_reference_for_all_categories(self):
+        """ Ensures the order of the hands of each category and its corner cases is the same of the brute-force evaluator """
+        hands = [
+            "As Ks Qs Js Ts 9s 8s", # straight flush inside a longer flush
+            "9h 8h 7h 6h 5h Ah Kh", # straight flush, not the highest flush
+            "5s 4s 3s 2s As Ad Ac", # straight flush, ace as the lowest card, with trips
+            "5c 4c 3c 2c Ac 6d", # straight flush, ace as the lowest card, with a higher straight
+            "Ad Ac Ah As Kd Kc Kh", # four of a kind, kicker from the trips
+            "2d 2c 2h 2s 3d 3c 3h", # four of a kind, lowest
+            "Kd Kc Kh Qs Qd Qc 2h", # full house from two trips
+            "Kd Kc Kh 2s 2d Qc Qh", # full house with two pairs, the higher one is used
+            "3d 3c 3h As Ad", # full house, lower trips with higher pair
+            "As 9s 7s 4s 2s 3s Kd", # flush with six cards
+            "Ah 9h 7h 4h 3h Kd Kc", # flush, lower fifth card
+            "Td 9c 8h 7s 6d 5c 4h", # straight with seven cards in a row
+            "Ad 2c 3h 4s 5d 5c 5h", # straight, ace as the lowest card, over trips
+            "Ad Kc Qh Js Td", # straight, ace as the highest card
+            "7d 7c 7h As Kd 2c 3h", # three of a kind
+            "7d 7c 7h As Qd Jc 3h", # three of a kind, lower second kicker
+            "7d 7c 5h 5s 3d 3c Ah", # three pairs, the lowest one is not used
+            "7d 7c 5h 5s 3d 3c 2h", # three pairs, the lowest pair is the kicker
+            "7d 7c 5h 5s Kd", # two pair
+            "7d 7c 5h 5s Qd Jc 9h", # two pair, lower kicker
+            "7d 7c Ah Ks 9d 3c 2h", # one pair
+            "7d 7c Ah Ks 9d 4c 2h", # one pair, the sixth card does not matter
+            "7d 7c Ah Ks 8d 6c 2h", # one pair, lower third kicker
+            "Ad Kc 9h 7s 5d 3c 2h", # high card
+            "Ad Kc 9h 7s 5d", # high card with five cards
+            "Ad Kc 9h 7s 4d 3c 2h", # high card, lower fifth card
+            "7d 5c 4h 3s 2d", # worst high card
+        ]
+        hands = [hand.split() for hand in hands]
+        expected = order_of_values([evaluate_best_five_cards(hand) for hand in hands])
+        result = order_of_values([PokerHandEvaluator.evaluate(hand) for hand in hands])
+        self.assertEqual(expected, result)
+
+    def test_same_order_as_reference_for_random_hands(self):
+        """ Ensures the order of random hands with 5 to 7 cards is the same of the brute-force evaluator """
+        deck = [rank+suit for rank in RANKS for suit in PokerConfig.CONFIG['suits']]
+        generator = random.Random(1)
+        hands = [generator.sample(deck, generator.randint(5, 7)) for _ in range(500)]
+        expected = order_of_values([evaluate_best_five_cards(hand) for hand in hands])
+        result = order_of_values([PokerHandEvaluator.evaluate(hand) for hand in hands])
+        self.assertEqual(expected, result)
+
+    def test_same_metrics_as_hands_file(self):
+        """ Ensures the metrics are the same of the hands generated with pokereval """
+        json_path = PokerConfig.CONFIG['hands_path']+"hands_type_0.json"
+        self.assertEqual(0, cross_check_hands(json_path, total_hands = 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from ...environments.reinforcement.poker.hand_generator.poker_hand_generator import (generate_poker_hands,
+    generate_hands_for_seeds)
+from ...environments.reinforcement.poker.hand_generator.poker_metrics_calculator import PokerMetricsCalculator
+
+class PokerHandGeneratorTests(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def _hands_per_label(self):
+        hands = {}
+        for label in range(9):
+            with open(self.path+'/hands_type_'+str(label)+'.json') as hands_file:
+                hands[label] = [json.loads(line) for line in hands_file]
+        return hands
+
+    def test_same_hands_as_serial_generation(self):
+        """ Ensures the hands generated by the shards are merged in the order of the seeds """
+        generate_poker_hands(0, 3, path = self.path, workers = 2, shard_size = 2)
+        expected = dict([(label, []) for label in range(9)])
+        for label, hand in generate_hands_for_seeds(0, 3, PokerMetricsCalculator.initialize_deck()):
+            expected[label].append(hand)
+        self.assertEqual(expected, self._hands_per_label())
+
+    def test_resume_generation(self):
+        """ Ensures only the shards that weren't finished are generated again """
+        generate_poker_hands(0, 2, path = self.path, workers = 1, shard_size = 1)
+        expected = self._hands_per_label()
+        with open(self.path+'/manifest.json') as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual([[0, 1], [1, 2]], sorted(manifest['finished_shards']))
+        os.remove(self.path+'/shards/shard_1_2.json')
+        finished_shard_time = os.path.getmtime(self.path+'/shards/shard_0_1.json')
+        generate_poker_hands(0, 2, path = self.path, workers = 1, shard_size = 1)
+        self.assertEqual(finished_shard_time, os.path.getmtime(self.path+'/shards/shard_0_1.json'))
+        self.assertEqual(expected, self._hands_per_label())
+
+    def test_resume_with_other_parameters(self):
+        """ Ensures a generation isn't resumed with different shards """
+        generate_poker_hands(0, 1, path = self.path, workers = 1, shard_size = 1)
+        self.assertRaises(ValueError, generate_poker_hands, 0, 1, path = self.path, workers = 1, shard_size = 2)
+
+if __name__ == '__main__':
+    unittest.main()
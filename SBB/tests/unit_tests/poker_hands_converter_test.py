@@ -0,0 +1,51 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import numpy
+from ...environments.reinforcement.poker.hand_generator.poker_hands_converter import (convert_hands_file,
+    load_hands, row_to_hand, hand_to_row, card_to_code, code_to_card, HANDS_DTYPE)
+from ...environments.reinforcement.poker.poker_config import PokerConfig
+
+class PokerHandsConverterTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.json_path = PokerConfig.CONFIG['hands_path']+"hands_type_0.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_card_codes(self):
+        """ Ensures each card has a distinct code that is converted back to the same card """
+        cards = [rank+suit for rank in PokerConfig.CONFIG['ranks'] for suit in PokerConfig.CONFIG['suits']]
+        codes = [card_to_code(card) for card in cards]
+        self.assertEqual(range(len(cards)), sorted(codes))
+        self.assertEqual(cards, [code_to_card(code) for code in codes])
+
+    def test_same_hands_as_json_file(self):
+        """ Ensures the rows of the .npy file are converted back to the same hands of the .json file """
+        npy_path = os.path.join(self.folder, "hands_type_0.npy")
+        total = convert_hands_file(self.json_path, npy_path)
+        hands = load_hands(npy_path)
+        with open(self.json_path) as json_file:
+            expected = [json.loads(line) for line in json_file]
+        self.assertEqual(len(expected), total)
+        self.assertEqual(HANDS_DTYPE, hands.dtype)
+        self.assertEqual(expected, [row_to_hand(row) for row in hands])
+
+    def test_row_for_hand(self):
+        """ Ensures a hand is stored with the expected fields """
+        hand = {"id": 132, "pos": 1, "bc": ["5h", "Jc", "As", "Jd", "2d"],
+            "p": {"hc": ["Ks", "Ad"], "ep": [6.325, 8.656, 8.493, 8.858], "str": [9.375, 9.713, 9.072, 8.858]},
+            "o": {"hc": ["7d", "7s"], "ep": [6.551, 5.361, 5.942, 7.348], "str": [9.653, 7.275, 7.599, 7.348]}}
+        npy_path = os.path.join(self.folder, "hands.npy")
+        numpy.save(npy_path, numpy.array([hand_to_row(hand)], dtype = HANDS_DTYPE))
+        row = load_hands(npy_path)[0]
+        self.assertEqual(132, row['id'])
+        self.assertEqual(1, row['pos'])
+        self.assertEqual(card_to_code("Ks"), row['p_hc'][0])
+        self.assertEqual(hand, row_to_hand(row))
+
+if __name__ == '__main__':
+    unittest.main()
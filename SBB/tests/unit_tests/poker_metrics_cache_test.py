@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ...environments.reinforcement.poker.hand_generator.poker_metrics_cache import PokerMetricsCache, canonical_cards
+from ...environments.reinforcement.poker.hand_generator.poker_metrics_calculator import PokerMetricsCalculator
+
+class PokerMetricsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "metrics_cache.json")
+        self.full_deck = PokerMetricsCalculator.initialize_deck()
+
+    def tearDown(self):
+        PokerMetricsCalculator.cache_ = None
+        shutil.rmtree(self.folder)
+
+    def test_canonical_cards_for_same_hands(self):
+        """ Ensures the hands that are the same except for the suits and order have the same canonical cards """
+        expected = canonical_cards(['As', 'Ks'], ['2d', '5d', '9h'])
+        self.assertEqual(expected, canonical_cards(['Ah', 'Kh'], ['9s', '2c', '5c']))
+        self.assertEqual(expected, canonical_cards(['Kc', 'Ac'], ['5h', '2h', '9d']))
+
+    def test_canonical_cards_for_different_hands(self):
+        """ Ensures the hands that aren't the same have different canonical cards """
+        suited = canonical_cards(['As', 'Ks'], ['2d', '5d', '9h'])
+        self.assertNotEqual(suited, canonical_cards(['As', 'Kd'], ['2d', '5d', '9h']))
+        self.assertNotEqual(suited, canonical_cards(['As', 'Ks'], ['2d', '5d', '9s']))
+
+    def test_same_metrics_with_cache(self):
+        """ Ensures the metrics read from the cache are the ones calculated for the same hands """
+        expected_strength = PokerMetricsCalculator.calculate_hand_strength(['As', 'Ks'], ['2d', '5d', '9h', 'Js'], self.full_deck)
+        expected_potential = PokerMetricsCalculator.calculate_hand_potential_without_heuristics(['As', 'Ks'], ['2d', '5d', '9h', 'Js'], 2, self.full_deck)
+        PokerMetricsCalculator.cache_ = PokerMetricsCache(self.path)
+        for hole_cards, board_cards in [(['As', 'Ks'], ['2d', '5d', '9h', 'Js']), (['Kh', 'Ah'], ['Jh', '2c', '9s', '5c'])]:
+            self.assertEqual(expected_strength, PokerMetricsCalculator.calculate_hand_strength(hole_cards, board_cards, self.full_deck))
+            self.assertEqual(expected_potential, PokerMetricsCalculator.calculate_hand_potential_without_heuristics(hole_cards, board_cards, 2, self.full_deck))
+        statistics = PokerMetricsCalculator.cache_.statistics()
+        self.assertEqual(2, statistics['hits'])
+        self.assertEqual(2, statistics['misses'])
+
+    def test_persistent_cache(self):
+        """ Ensures the saved entries are read by a new cache """
+        cache = PokerMetricsCache(self.path)
+        key = PokerMetricsCache.key('strength', ['As', 'Ks'], ['2d', '5d', '9h'])
+        cache.get(key, lambda: 0.123456789)
+        cache.save()
+        new_cache = PokerMetricsCache(self.path)
+        self.assertEqual(0.123456789, new_cache.get(key, lambda: None))
+        self.assertEqual(1, new_cache.statistics()['hits'])
+
+    def test_merged_cache(self):
+        """ Ensures the entries saved by caches that use the same file are all merged to the file """
+        caches = [PokerMetricsCache(self.path), PokerMetricsCache(self.path)]
+        keys = [PokerMetricsCache.key('strength', ['As', 'Ks'], ['2d', '5d', '9h']),
+            PokerMetricsCache.key('strength', ['As', 'Kd'], ['2d', '5d', '9h']),
+            PokerMetricsCache.key('potential', ['As', 'Kd'], ['2d', '5d', '9h'])]
+        caches[0].get(keys[0], lambda: 0.1)
+        caches[0].save()
+        caches[1].get(keys[1], lambda: 0.2)
+        caches[1].save()
+        caches[0].get(keys[2], lambda: 0.3)
+        self.assertEqual(2, len(os.listdir(self.path+'.parts')))
+        self.assertEqual(2, PokerMetricsCache(self.path).statistics()['entries'])
+
+        caches[0].merge()
+        self.assertEqual([], os.listdir(self.path+'.parts'))
+        self.assertEqual(3, caches[0].statistics()['entries'])
+        caches[1].merge()
+        new_cache = PokerMetricsCache(self.path)
+        self.assertEqual([0.1, 0.2, 0.3], [new_cache.get(key, lambda: None) for key in keys])
+        self.assertEqual(3, new_cache.statistics()['hits'])
+
+if __name__ == '__main__':
+    unittest.main()
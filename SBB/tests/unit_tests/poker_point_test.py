@@ -0,0 +1,97 @@
+import unittest
+import numpy
+from ...environments.default_point import reset_points_ids
+from ...environments.reinforcement.poker.poker_point import PokerPoint
+from ...environments.reinforcement.poker.match_state import MatchState
+from ...environments.reinforcement.poker.hand_generator.poker_hands_converter import hand_to_row, HANDS_DTYPE
+
+def old_point_attributes(info):
+    """
+    Reference implementation: the attributes previously created by PokerPoint from a hand of the hands files
+    """
+    players = {}
+    players['team'] = {}
+    players['team']['position'] = info['pos']
+    players['team']['hand_strength'] = info['p']['str']
+    players['team']['effective_potential'] = info['p']['ep']
+    players['team']['hole_cards'] = [str(x) for x in info['p']['hc']]
+    players['opponent'] = {}
+    if players['team']['position'] == 0:
+        players['opponent']['position'] = 1
+    else:
+        players['opponent']['position'] = 0
+    players['opponent']['hand_strength'] = info['o']['str']
+    players['opponent']['effective_potential'] = info['o']['ep']
+    players['opponent']['hole_cards'] = [str(x) for x in info['o']['hc']]
+    if players['team']['hand_strength'][3] > players['opponent']['hand_strength'][3]:
+        sbb_sd_label = 0
+    elif players['team']['hand_strength'][3] < players['opponent']['hand_strength'][3]:
+        sbb_sd_label = 2
+    else:
+        sbb_sd_label = 1
+    attributes = {}
+    attributes['seed'] = info['id']
+    attributes['board_cards'] = [str(x) for x in info['bc']]
+    attributes['players'] = players
+    attributes['sbb_sd_label'] = sbb_sd_label
+    attributes['point_id'] = str(info['id'])+"-"+str(players['team']['position'])
+    return attributes
+
+class PokerPointTests(unittest.TestCase):
+    def setUp(self):
+        reset_points_ids()
+        self.hands = [
+            {"id": 132, "pos": 1, "bc": ["5h", "Jc", "As", "Jd", "2d"],
+                "p": {"hc": ["Ks", "Ad"], "ep": [6.325, 8.656, 8.493, 8.858], "str": [9.375, 9.713, 9.072, 8.858]},
+                "o": {"hc": ["7d", "7s"], "ep": [6.551, 5.361, 5.942, 7.348], "str": [9.653, 7.275, 7.599, 7.348]}},
+            {"id": 20015, "pos": 0, "bc": ["Tc", "9c", "2h", "3s", "Qd"],
+                "p": {"hc": ["4h", "6d"], "ep": [3.12, 2.5, 1.0, 0.5], "str": [3.12, 2.5, 1.0, 0.5]},
+                "o": {"hc": ["Qs", "Ts"], "ep": [7.0, 9.1, 9.5, 9.9], "str": [7.0, 9.1, 9.5, 9.9]}},
+            {"id": 7, "pos": 0, "bc": ["Ac", "Kc", "Qc", "Jc", "Tc"],
+                "p": {"hc": ["2h", "3d"], "ep": [1.0, 10.0, 10.0, 10.0], "str": [1.0, 10.0, 10.0, 10.0]},
+                "o": {"hc": ["4s", "5s"], "ep": [1.5, 10.0, 10.0, 10.0], "str": [1.5, 10.0, 10.0, 10.0]}},
+        ]
+        rows = numpy.array([hand_to_row(hand) for hand in self.hands], dtype = HANDS_DTYPE)
+        self.points = [PokerPoint(label, row) for label, row in enumerate(rows)]
+
+    def test_same_attributes_as_reference(self):
+        """ Ensures the point created from a row of the hands array has the same attributes of the previous point """
+        for hand, point in zip(self.hands, self.points):
+            expected = old_point_attributes(hand)
+            self.assertEqual(expected['seed'], point.seed_)
+            self.assertEqual(expected['board_cards'], point.board_cards_)
+            self.assertEqual(expected['players'], point.players)
+            self.assertEqual(expected['sbb_sd_label'], point.sbb_sd_label_)
+            self.assertEqual(expected['point_id'], point.point_id_)
+            self.assertEqual(expected['players']['team']['position'], point.position_)
+        self.assertEqual([0, 2, 1], [point.sbb_sd_label_ for point in self.points]) # all the labels are tested
+
+    def test_dict_for_hands_file(self):
+        """ Ensures the point is saved in the same format of the hands files """
+        for label, (hand, point) in enumerate(zip(self.hands, self.points)):
+            self.assertEqual({'label': label, 'info': hand}, point.dict())
+
+    def test_match_state(self):
+        """ Ensures the match state reads the attributes of the player from the point """
+        for hand, point in zip(self.hands, self.points):
+            players = old_point_attributes(hand)['players']
+            for player_key in ['team', 'opponent']:
+                match_state = MatchState(point, player_key)
+                self.assertEqual(players[player_key]['position'], match_state.position)
+                self.assertEqual(players[player_key]['hand_strength'], match_state.hand_strength)
+                self.assertEqual(players[player_key]['effective_potential'], match_state.effective_potential)
+                self.assertEqual(players[player_key]['hole_cards'], match_state.hole_cards)
+                self.assertTrue(all([isinstance(value, float) for value in match_state.hand_strength]))
+
+    def test_lazy_attributes(self):
+        """ Ensures the point id and the results are only created when used, and the point id is kept """
+        point = self.points[0]
+        self.assertEqual(None, point.hand_id_)
+        self.assertEqual(None, point.teams_results_)
+        self.assertIs(point.point_id_, point.point_id_)
+        point.add_team_result(0.5)
+        point.add_team_result(1.0)
+        self.assertEqual([0.5, 1.0], point.teams_results_)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+from ...core.program_analysis import ProgramAnalysis
+from ...core.instruction import Instruction
+from ...config import Config
+
+def remove_introns(instructions):
+    """
+    Reference implementation: the list-based intron removal previously used by Program.remove_introns
+    """
+    instructions_without_introns = []
+    relevant_registers = [0]
+    ignore_previous_if = True
+    for instruction in reversed(instructions):
+        if (instruction.target in relevant_registers 
+            or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']):
+            if ignore_previous_if and instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions']:
+                continue
+            else:
+                ignore_previous_if = False
+                instructions_without_introns.insert(0, instruction)
+                if not instruction.op in Config.RESTRICTIONS['genotype_options']['one-operand-instructions']:
+                    if instruction.mode == 'read-register' and instruction.source not in relevant_registers:
+                        relevant_registers.append(instruction.source)
+                if (instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions'] 
+                    or instruction.op in Config.RESTRICTIONS['genotype_options']['if-instructions-for-signal']):
+                    if instruction.target not in relevant_registers:
+                        relevant_registers.append(instruction.target)
+        else:
+            ignore_previous_if = True
+    return instructions_without_introns
+
+OPERATORS = ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'sin', 'if_lesser_than', 'if_equal_or_higher_than',
+    'if_lesser_than_for_signal', 'if_equal_or_higher_than_for_signal']
+
+def random_instruction(total_registers = 4, total_inputs = 4):
+    mode = random.choice(['read-register', 'read-input'])
+    if mode == 'read-register':
+        source = random.randrange(total_registers)
+    else:
+        source = random.randrange(total_inputs)
+    return Instruction(mode = mode, target = random.randrange(total_registers), op = random.choice(OPERATORS),
+        source = source)
+
+class ProgramAnalysisTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+
+    def _assert_same_analysis(self, analysis, instructions):
+        self.assertEqual(remove_introns(instructions), analysis.effective_instructions())
+        fresh_analysis = ProgramAnalysis(instructions)
+        self.assertEqual(fresh_analysis.states_, analysis.states_)
+        self.assertEqual(fresh_analysis.inputs_list(), analysis.inputs_list())
+
+    def test_same_introns_as_reference(self):
+        """ Ensures the bitset analysis removes the same introns of the list-based algorithm """
+        for _ in range(500):
+            instructions = [random_instruction() for _ in range(random.randint(0, 20))]
+            self.assertEqual(remove_introns(instructions), ProgramAnalysis(instructions).effective_instructions())
+
+    def test_inputs_list(self):
+        """ Ensures the inputs are the ones read by the effective instructions, without repetitions """
+        a = Instruction(mode = 'read-input', target = 1, op = '+', source = 3) # intron
+        b = Instruction(mode = 'read-input', target = 0, op = '+', source = 2)
+        c = Instruction(mode = 'read-input', target = 0, op = 'cos', source = 1) # one operand
+        d = Instruction(mode = 'read-input', target = 0, op = '*', source = 0)
+        e = Instruction(mode = 'read-input', target = 0, op = '-', source = 2)
+        self.assertEqual([2, 0], ProgramAnalysis([a, b, c, d, e]).inputs_list())
+
+    def test_incremental_updates_after_mutations(self):
+        """ Ensures the analysis updated after each mutation is the same as a new analysis """
+        for _ in range(200):
+            instructions = [random_instruction() for _ in range(random.randint(2, 20))]
+            analysis = ProgramAnalysis(instructions)
+            for _ in range(10):
+                mutation = random.choice(['remove', 'change', 'add', 'swap'])
+                if mutation == 'remove' and len(instructions) > 2:
+                    index = random.randrange(len(instructions))
+                    del instructions[index]
+                    analysis.instruction_removed(index)
+                elif mutation == 'change':
+                    index = random.randrange(len(instructions))
+                    instructions[index] = random_instruction()
+                    analysis.instruction_changed(index)
+                elif mutation == 'add':
+                    index = random.randrange(len(instructions))
+                    instructions.insert(index, random_instruction())
+                    analysis.instruction_inserted(index)
+                elif mutation == 'swap':
+                    index1, index2 = random.sample(range(len(instructions)), 2)
+                    instructions[index1], instructions[index2] = instructions[index2], instructions[index1]
+                    analysis.instructions_swapped(index1, index2)
+                self._assert_same_analysis(analysis, instructions)
+
+    def test_copy_for_cloned_instructions(self):
+        """ Ensures the copy of the analysis is updated independently from the original """
+        instructions = [random_instruction() for _ in range(10)]
+        analysis = ProgramAnalysis(instructions)
+        cloned_instructions = list(instructions)
+        cloned_analysis = analysis.copy(cloned_instructions)
+        cloned_instructions.insert(0, random_instruction())
+        cloned_analysis.instruction_inserted(0)
+        self._assert_same_analysis(analysis, instructions)
+        self._assert_same_analysis(cloned_analysis, cloned_instructions)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import numpy
+from ...core.program import Program
+from ...core.team import Team
+from ...core.selection import Selection
+from ...core import program_kernels
+from ...core.program_kernels import program_fingerprint, get_program_kernel, reset_program_kernels
+from ...core.instruction import Instruction
+from ...environments.classification.classification_environment import ClassificationEnvironment
+from ...config import Config
+
+class DummyPoint():
+    def __init__(self, point_id):
+        self.point_id_ = point_id
+
+class ProgramKernelsTests(unittest.TestCase):
+    def setUp(self):
+        self.total_registers = Config.RESTRICTIONS['genotype_options']['total_registers']
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = 3
+        reset_program_kernels()
+        self.effective = [
+            Instruction(mode = 'read-input', target = 1, op = '+', source = 0),
+            Instruction(mode = 'read-register', target = 0, op = '*', source = 1),
+            Instruction(mode = 'read-input', target = 0, op = '-', source = 2),
+        ]
+        self.intron = Instruction(mode = 'read-input', target = 2, op = '+', source = 1)
+        self.inputs = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def tearDown(self):
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers
+
+    def test_same_fingerprint_without_introns(self):
+        """ Ensures programs that only differ in the introns have the same fingerprint and share the kernel """
+        program1 = Program(0, list(self.effective), 0, program_id = 1)
+        program2 = Program(0, [self.intron]+list(self.effective), 1, program_id = 2)
+        self.assertEqual(program1.fingerprint(), program2.fingerprint())
+        self.assertIs(program1.kernel_, program2.kernel_)
+        self.assertIs(program1.compiled_program_, program2.compiled_program_)
+
+    def test_different_fingerprint(self):
+        """ Ensures programs with different behaviors have different fingerprints """
+        changed = list(self.effective)
+        changed[2] = Instruction(mode = 'read-input', target = 0, op = '-', source = 1)
+        self.assertNotEqual(program_fingerprint(self.effective), program_fingerprint(changed))
+
+    def test_one_operand_source_is_ignored(self):
+        """ Ensures the sources of the one operand instructions are not part of the fingerprint """
+        cos1 = Instruction(mode = 'read-input', target = 0, op = 'cos', source = 0)
+        cos2 = Instruction(mode = 'read-register', target = 0, op = 'cos', source = 3)
+        self.assertEqual(program_fingerprint(self.effective+[cos1]), program_fingerprint(self.effective+[cos2]))
+
+    def test_shared_outputs_per_points(self):
+        """ Ensures the outputs cached by a program are reused by its duplicates """
+        program1 = Program(0, list(self.effective), 0, program_id = 1)
+        outputs = program1.execute_batch(self.inputs, point_ids = [1, 2])
+        program2 = Program(0, [self.intron]+list(self.effective), 1, program_id = 2)
+        program2.compile()
+        self.assertEqual([1, 2], sorted(program2.outputs_per_points_.keys()))
+        self.assertTrue(numpy.array_equal(outputs, program2.execute_batch(self.inputs[::-1], point_ids = [1, 2])))
+
+    def test_kernels_are_released(self):
+        """ Ensures the kernels are removed from the index when no program uses them """
+        program = Program(0, list(self.effective), 0, program_id = 1)
+        program.compile()
+        self.assertEqual(1, len(program_kernels.program_kernels))
+        self.assertIs(program.kernel_, get_program_kernel(self.effective))
+        del program
+        self.assertEqual(0, len(program_kernels.program_kernels))
+
+    def test_removed_points_are_removed_from_outputs_per_points(self):
+        """ Ensures the removed points are removed from the outputs shared by the programs, and the new points are executed """
+        program1 = Program(0, list(self.effective), 0, program_id = 1)
+        program2 = Program(0, [self.intron]+list(self.effective), 1, program_id = 2) # same kernel of program1
+        program3 = Program(0, list(self.effective[:2]), 1, program_id = 3)
+        teams = [Team(0, [program1, program3], None, team_id = 1), Team(0, [program2], None, team_id = 2)]
+        inputs = numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [-1.0, 0.5, 2.0]])
+        program1.execute_batch(inputs, point_ids = [1, 2, 3])
+        program2.compile()
+        program3.execute_batch(inputs, point_ids = [1, 2, 3])
+        environment = ClassificationEnvironment.__new__(ClassificationEnvironment) # only the teams are used
+        environment._remove_points([DummyPoint(2)], teams)
+        for program in [program1, program2, program3]:
+            self.assertEqual([1, 3], sorted(program.outputs_per_points_.keys()))
+        self.assertIs(program1.outputs_per_points_, program2.outputs_per_points_)
+
+        new_inputs = numpy.array([inputs[0], inputs[2], [7.0, -8.0, 9.0]])
+        for program in [program1, program2, program3]:
+            expected = program.compiled_program_.execute_batch(new_inputs)
+            result = program.execute_batch(new_inputs, point_ids = [1, 3, 4])
+            self.assertTrue(numpy.array_equal(expected, result))
+            self.assertEqual([1, 3, 4], sorted(program.outputs_per_points_.keys()))
+
+    def test_removed_programs_release_outputs_per_points(self):
+        """ Ensures the programs removed by the selection release their kernel and its outputs, unless another program shares it """
+        program1 = Program(0, list(self.effective), 0, program_id = 1)
+        program2 = Program(0, [self.intron]+list(self.effective), 1, program_id = 2) # same kernel of program1
+        program3 = Program(0, list(self.effective[:2]), 1, program_id = 3)
+        team = Team(0, [program1, program2, program3], None, team_id = 1)
+        program1.execute_batch(self.inputs, point_ids = [1, 2])
+        program2.compile()
+        program3.execute_batch(self.inputs, point_ids = [1, 2])
+        self.assertEqual(2, len(program_kernels.program_kernels))
+
+        team.remove_program(program1)
+        team.remove_program(program3)
+        programs_population = Selection(None)._remove_programs_with_no_teams([program1, program2, program3])
+        self.assertEqual([program2], programs_population)
+        del program1
+        del program3
+        self.assertEqual(1, len(program_kernels.program_kernels))
+        self.assertEqual([1, 2], sorted(program2.outputs_per_points_.keys()))
+        program4 = Program(0, list(self.effective[:2]), 0, program_id = 4) # same instructions of program3
+        program4.compile()
+        self.assertEqual({}, program4.outputs_per_points_)
+
+if __name__ == '__main__':
+    unittest.main()
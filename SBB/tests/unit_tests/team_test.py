@@ -0,0 +1,107 @@
+import random
+import unittest
+import numpy
+from ...core.team import Team, reset_teams_ids
+from ...core.program import Program, reset_programs_ids
+from ...core.instruction import Instruction
+from ...core.program_kernels import reset_program_kernels
+from ...config import Config
+
+class TeamTests(unittest.TestCase):
+    def setUp(self):
+        self.user = Config.USER
+        self.use_memmory_for_actions = Config.RESTRICTIONS['use_memmory_for_actions']
+        Config.USER = {'task': 'classification', 'advanced_training_parameters': {'second_layer': {'enabled': False}}}
+        self.original_total_registers = Config.RESTRICTIONS['genotype_options']['total_registers']
+        self.total_registers = 4
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.total_registers
+        self.total_inputs = 4
+        self.operators = (Config.RESTRICTIONS['genotype_options']['simple_operations']
+            + Config.RESTRICTIONS['genotype_options']['complex_operations'])
+        reset_program_kernels()
+        reset_programs_ids()
+        reset_teams_ids()
+        random.seed(1)
+        numpy.random.seed(1)
+
+    def tearDown(self):
+        Config.USER = self.user
+        Config.RESTRICTIONS['use_memmory_for_actions'] = self.use_memmory_for_actions
+        Config.RESTRICTIONS['genotype_options']['total_registers'] = self.original_total_registers
+
+    def _random_instruction(self):
+        mode = random.choice(['read-register', 'read-input'])
+        if mode == 'read-register':
+            source = random.randrange(self.total_registers)
+        else:
+            source = random.randrange(self.total_inputs)
+        return Instruction(mode = mode, target = random.randrange(self.total_registers),
+            op = random.choice(self.operators), source = source)
+
+    def _random_programs(self):
+        """
+        Programs with 3 actions (so some programs don't have a valid action), including programs
+        without effective instructions and duplicated programs, so the teams have tied bids.
+        """
+        programs = []
+        for _ in range(random.randint(2, 6)):
+            instructions = [self._random_instruction() for _ in range(random.randint(1, 8))]
+            programs.append(Program(0, instructions, random.randrange(3)))
+        programs.append(Program(0, [Instruction(mode = 'read-input', target = 1, op = '+', source = 0)],
+            random.randrange(3)))
+        duplicated = random.choice(programs)
+        programs.append(Program(0, list(duplicated.instructions), random.randrange(3)))
+        random.shuffle(programs)
+        return programs
+
+    def _random_inputs(self, total_points):
+        inputs = numpy.random.uniform(-5.0, 5.0, size = (total_points, self.total_inputs))
+        inputs[numpy.random.random(inputs.shape) < 0.2] = 0.0
+        return inputs
+
+    def _compare_with_execute(self, is_training):
+        valid_actions = [0, 1]
+        for trial in range(200):
+            programs = self._random_programs()
+            expected_team = Team(0, programs, None)
+            team = Team(0, programs, None)
+            # the bids are cached per point id, so each point always has the same inputs
+            inputs_per_point = dict(zip(range(trial*100, trial*100+15), self._random_inputs(15)))
+            for point_ids in [range(trial*100, trial*100+10), range(trial*100+5, trial*100+15)]:
+                inputs_matrix = numpy.array([inputs_per_point[point_id] for point_id in point_ids])
+                with numpy.errstate(all = 'ignore'): # the inputs are numpy scalars
+                    expected = [expected_team.execute(point_id, list(inputs), valid_actions, is_training)
+                        for point_id, inputs in zip(point_ids, inputs_matrix)]
+                result = team.execute_batch(point_ids, inputs_matrix, valid_actions, is_training)
+                self.assertEqual(expected, result)
+                self.assertEqual(expected_team.memory_actions_per_points_, team.memory_actions_per_points_)
+                self.assertEqual([program.program_id_ for program in expected_team.active_programs_],
+                    [program.program_id_ for program in team.active_programs_])
+                self.assertEqual(expected_team.last_selected_program_, team.last_selected_program_)
+                self.assertEqual([program.program_id_ for program in expected_team.validation_active_programs_],
+                    [program.program_id_ for program in team.validation_active_programs_])
+
+    def test_execute_batch_same_as_execute_for_training(self):
+        """ Ensures the batch execution selects the same programs of the execution per point for training """
+        Config.RESTRICTIONS['use_memmory_for_actions'] = False
+        self._compare_with_execute(is_training = True)
+
+    def test_execute_batch_same_as_execute_for_training_with_memory(self):
+        """ Ensures the batch execution uses and updates the memory of actions as the execution per point """
+        Config.RESTRICTIONS['use_memmory_for_actions'] = True
+        self._compare_with_execute(is_training = True)
+
+    def test_execute_batch_same_as_execute_for_validation(self):
+        """ Ensures the batch execution selects the same programs of the execution per point for validation """
+        Config.RESTRICTIONS['use_memmory_for_actions'] = True
+        self._compare_with_execute(is_training = False)
+
+    def test_execute_batch_without_valid_actions(self):
+        """ Ensures the batch execution returns no action for all points if no program has a valid action """
+        programs = [Program(0, [self._random_instruction()], 2) for _ in range(3)]
+        team = Team(0, programs, None)
+        self.assertEqual([None, None], team.execute_batch([1, 2], self._random_inputs(2), [0, 1], True))
+        self.assertEqual([], team.active_programs_)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import operator
-from collections import defaultdict
+import hashlib
+import numpy
 from ..config import Config
 
 """
@@ -19,25 +20,40 @@ def round_array(array, round_decimals_to = Config.RESTRICTIONS['round_to_decimal
 def flatten(list_of_lists):
     return sum(list_of_lists, [])
 
+def derive_seed(*keys):
+    """
+    Return a seed derived from the keys (eg. the seed of the run, the generation, the team id and 
+    the purpose), so a step can use its own random stream, that doesn't depend on how many random 
+    values were used by the steps executed before it.
+    """
+    return int(hashlib.md5(repr(keys)).hexdigest(), 16) % Config.RESTRICTIONS['max_seed']
+
 def is_nearly_equal_to(value1, value2, threshold = Config.RESTRICTIONS['is_nearly_equal_threshold']):
     if abs(value1 - value2) < threshold:
         return True
     return False
 
+def results_matrix(teams, point_ids, get_results_per_points = lambda team: team.results_per_points_):
+    """
+    Return the (teams x points) matrix with the results of each team for each point, built from the
+    results per point of the teams (0.0 for the points without results).
+    """
+    matrix = numpy.zeros((len(teams), len(point_ids)))
+    for row, team in enumerate(teams):
+        results = get_results_per_points(team)
+        matrix[row] = [results.get(point_id, 0.0) for point_id in point_ids]
+    return matrix
+
 def accumulative_performances(teams_population, point_ids, sorting_criteria, get_results_per_points):
+    """
+    For the teams sorted from the best to the worst, return the total result of each team and the total of
+    the best results per point obtained by the team and all the teams before it.
+    """
     sorted_teams = sorted(teams_population, key=lambda team: sorting_criteria(team), reverse = True) # better ones first
-    individual_performance = []
-    accumulative_performance = []
-    best_results_per_point = defaultdict(int)
-    for team in sorted_teams:
-        total = 0.0
-        for key, item in get_results_per_points(team).iteritems():
-            if key in point_ids:
-                total += item
-                if item > best_results_per_point[key]:
-                    best_results_per_point[key] = item
-        individual_performance.append(round_value(total))
-        accumulative_performance.append(round_value(sum(best_results_per_point.values())))
+    matrix = results_matrix(sorted_teams, point_ids, get_results_per_points)
+    best_results_per_point = numpy.maximum.accumulate(numpy.maximum(matrix, 0.0), axis = 0)
+    individual_performance = [round_value(total) for total in matrix.sum(axis = 1)]
+    accumulative_performance = [round_value(total) for total in best_results_per_point.sum(axis = 1)]
     teams_ids = [t.__repr__() for t in sorted_teams]
     return individual_performance, accumulative_performance, teams_ids
 
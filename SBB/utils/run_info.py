@@ -30,6 +30,8 @@ class RunInfo:
         self.global_fitness_per_diversity_per_generation_ = defaultdict(list)
         self.global_diversity_per_generation_ = defaultdict(list)
         self.novelty_type_per_generation_ = []
+        self.duplicated_programs_rate_per_generation_ = []
+        self.mean_evaluation_cost_per_generation_ = [] # instructions without introns per team
         self.actions_distribution_per_validation_ = []
         self.inputs_distribution_per_instruction_per_validation_ = []
         self.inputs_distribution_per_team_per_validation_ = []
@@ -75,6 +77,10 @@ class RunInfo:
             if len(Config.USER['advanced_training_parameters']['diversity']['metrics']) > 1:
                 msg += "\n\nDiversity Type per Training: "+str(self.novelty_type_per_generation_)
 
+        msg += "\n\nDuplicated Programs Rate per Training: "+str(self.duplicated_programs_rate_per_generation_)
+        msg += "\n\nMean Evaluation Cost (instructions without introns per team) per Training: "
+        msg += str(self.mean_evaluation_cost_per_generation_)
+
 
         msg += "\n\n\n##### DISTRIBUTION METRICS PER VALIDATION"
 
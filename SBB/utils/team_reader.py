@@ -4,7 +4,11 @@ from ..core.team import Team
 from ..core.instruction import Instruction
 from ..config import Config
 
-def read_team_from_json(team_descriptor, environment):
+def read_team_from_json(team_descriptor, environment, generation = -1):
+    """
+    By default the programs are read as atomic actions. If a generation is given, it is used for
+    the team and for its meta programs.
+    """
     programs = []
     for program_descriptor in team_descriptor['programs']:
         instructions = []
@@ -13,10 +17,13 @@ def read_team_from_json(team_descriptor, environment):
                 target = instruction_descriptor['target'], op = instruction_descriptor['op'], 
                 source = instruction_descriptor['source'])
             instructions.append(instruction)
-        program = Program(-1, instructions, program_descriptor['action'], 
+        program_generation = -1
+        if generation != -1 and program_descriptor['action_type'] == 'meta':
+            program_generation = generation
+        program = Program(program_generation, instructions, program_descriptor['action'], 
             program_id = program_descriptor['program_id'])
         programs.append(program)
-    return Team(-1, programs, environment, team_id = team_descriptor['team_id'])
+    return Team(generation, programs, environment, team_id = team_descriptor['team_id'])
 
 def initialize_actions_for_second_layer(path, environment):
         Config.RESTRICTIONS['second_layer']['short_action_mapping'] = {}
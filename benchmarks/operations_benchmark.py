@@ -0,0 +1,107 @@
+"""
+Measures the time to execute each operation of the programs, for the previous implementation of
+Operation.execute (string comparisons inside a warnings context, for every instruction) and for the
+protected operations used by the compiled programs (see PROTECTED_OPERATIONS), and the time to run
+a whole compiled program with each one.
+
+Run from the root folder with: python benchmarks/operations_benchmark.py [repetitions]
+"""
+import sys
+import math
+import random
+import timeit
+import warnings
+import numpy
+sys.path.insert(0, '.')
+from SBB.core.operations import Operation, PROTECTED_OPERATIONS
+
+def previous_execute(operator, target, source=float('NaN')):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        error = False
+        try:
+            if operator == '+':
+                result = target + source
+            elif operator == '-':
+                result = target - source
+            elif operator == '*':
+                result = target * source
+            elif operator == '/':
+                result = target / source
+            elif operator == 'ln':
+                result = numpy.log(target)
+            elif operator == 'exp':
+                result = math.exp(target)
+            elif operator == 'cos':
+                result = numpy.cos(target)
+            elif operator == 'sin':
+                result = numpy.sin(target)
+            elif operator == 'if_lesser_than_for_signal':
+                if (target < source):
+                    return -target
+                else:
+                    return target
+            elif operator == 'if_equal_or_higher_than_for_signal':
+                if (target >= source):
+                    return -target
+                else:
+                    return target
+        except ArithmeticError:
+            error = True
+        if error or math.isnan(result) or math.isinf(result):
+            return target
+        return result
+
+OPERATORS = ['+', '-', '*', '/', 'ln', 'exp', 'cos', 'sin', 'if_lesser_than_for_signal', 
+    'if_equal_or_higher_than_for_signal']
+
+def values(total):
+    random.seed(1)
+    return [(random.uniform(-10.0, 10.0), random.choice([0.0, random.uniform(-10.0, 10.0)])) for _ in range(total)]
+
+def measure(function, repetitions):
+    return min(timeit.repeat(function, number = 1, repeat = repetitions))
+
+def measure_operator(operator, pairs, repetitions):
+    protected_operation = PROTECTED_OPERATIONS[operator]
+    def run_previous():
+        for target, source in pairs:
+            previous_execute(operator, target, source)
+    def run_protected():
+        for target, source in pairs:
+            protected_operation(target, source)
+    def run_execute():
+        for target, source in pairs:
+            Operation.execute(operator, target, source)
+    return [measure(run, repetitions)/len(pairs)*1e6 for run in [run_previous, run_execute, run_protected]]
+
+def measure_program(pairs, repetitions):
+    """
+    A program with all the operations, executed for each pair of inputs as CompiledProgram.execute() does.
+    """
+    code = [(operator, index%2, (index+1)%2) for index, operator in enumerate(OPERATORS*2)]
+    protected_code = [(PROTECTED_OPERATIONS[operator], target, source) for operator, target, source in code]
+    def run_previous():
+        for inputs in pairs:
+            registers = list(inputs)
+            for operator, target, source in code:
+                registers[target] = previous_execute(operator, registers[target], registers[source])
+    def run_protected():
+        with numpy.errstate(all = 'ignore'): # once for all the points, as Team._select_program() does per point
+            for inputs in pairs:
+                registers = list(inputs)
+                for operation, target, source in protected_code:
+                    registers[target] = operation(registers[target], registers[source])
+    return [measure(run, repetitions)/len(pairs)*1e6 for run in [run_previous, run_protected]]
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    pairs = values(10000)
+    print "operator\tprevious (us)\tOperation.execute (us)\tprotected (us)\tspeedup"
+    for operator in OPERATORS:
+        previous, execute, protected = measure_operator(operator, pairs, repetitions)
+        print (operator+"\t"+str(round(previous, 3))+"\t"+str(round(execute, 3))+"\t"+str(round(protected, 3))
+            +"\t"+str(round(previous/protected, 1))+"x")
+    previous, protected = measure_program(pairs, repetitions)
+    print ("program with "+str(len(OPERATORS)*2)+" instructions\t"+str(round(previous, 3))+"\t-\t"+str(round(protected, 3))
+        +"\t"+str(round(previous/protected, 1))+"x")
@@ -0,0 +1,96 @@
+"""
+Compares the batch execution of the programs with float32 registers against float64 registers, for
+the datasets of the shipped classification configs. For each config, random programs (generated with
+the operations and program sizes of the config) are executed over all the train and test points with
+both precisions, and it reports:
+- the rate of bids that are the same within the tolerance (numpy.isclose with rtol and atol),
+- the rate of points where random teams select the same action (ie. the argmax of the bids),
+- the time to execute all the programs, and the memory used by the inputs.
+
+Run from the root folder with: python benchmarks/registers_precision_report.py [programs] [rtol] [atol]
+"""
+import os
+import sys
+import glob
+import time
+import random
+import StringIO
+import numpy
+sys.path.insert(0, '.')
+from SBB.config import Config
+from SBB.core.instruction import Instruction
+from SBB.core.compiled_program import CompiledProgram
+from SBB.environments.classification.classification_environment import ClassificationEnvironment
+
+CONFIGS = sorted(glob.glob('SBB/configs/classification/*.json'))
+
+def load_environment(config_file):
+    Config.load_config(config_file)
+    Config.RESTRICTIONS['genotype_options']['total_registers'] = (
+        Config.RESTRICTIONS['genotype_options']['output_registers'] 
+        + Config.USER['advanced_training_parameters']['extra_registers'])
+    Config.USER['advanced_training_parameters']['registers_precision'] = 'float64'
+    stdout = sys.stdout
+    sys.stdout = StringIO.StringIO() # ignore the output about reading the dataset
+    try:
+        environment = ClassificationEnvironment()
+    finally:
+        sys.stdout = stdout
+    return environment
+
+def random_programs(total):
+    random.seed(1)
+    program_size = Config.USER['training_parameters']['program_size']
+    programs = []
+    while len(programs) < total:
+        instructions = [Instruction() for _ in range(random.randint(program_size['min'], program_size['max']))]
+        compiled_program = CompiledProgram(instructions)
+        if len(compiled_program) > 0: # programs without effective instructions always bid 0
+            programs.append(compiled_program)
+    return programs
+
+def execute(programs, inputs):
+    start = time.time()
+    bids = numpy.array([program.execute_batch(inputs) for program in programs])
+    return bids, time.time()-start
+
+def teams_agreement(bids64, bids32, team_size):
+    """
+    Rate of the (teams x points) decisions that are the same, for random teams with 'team_size' programs.
+    """
+    numpy.random.seed(1)
+    agreements = []
+    for _ in range(100):
+        members = numpy.random.choice(len(bids64), size = min(team_size, len(bids64)), replace = False)
+        agreements.append(numpy.mean(numpy.argmax(bids64[members], axis = 0) == numpy.argmax(bids32[members], axis = 0)))
+    return numpy.mean(agreements)
+
+def report(config_file, total_programs, rtol, atol):
+    environment = load_environment(config_file)
+    inputs64 = numpy.vstack([[point.inputs for point in environment.train_population_], 
+        environment.test_population_inputs_]).astype(numpy.float64)
+    inputs32 = inputs64.astype(numpy.float32)
+    programs = random_programs(total_programs)
+    bids64, time64 = execute(programs, inputs64)
+    bids32, time32 = execute(programs, inputs32)
+    close = numpy.isclose(bids32, bids64, rtol = rtol, atol = atol)
+    worst_program_rate = numpy.min(numpy.mean(close, axis = 1))
+    team_size = Config.USER['training_parameters']['team_size']['max']
+    return [os.path.basename(config_file), Config.USER['classification_parameters']['dataset'], 
+        str(inputs64.shape[0]), str(round(numpy.mean(close)*100.0, 3))+"%", 
+        str(round(worst_program_rate*100.0, 3))+"%", str(round(teams_agreement(bids64, bids32, team_size)*100.0, 3))+"%", 
+        str(round(time64, 3)), str(round(time32, 3)), 
+        str(inputs64.nbytes/1024)+"/"+str(inputs32.nbytes/1024)]
+
+if __name__ == "__main__":
+    total_programs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rtol = float(sys.argv[2]) if len(sys.argv) > 2 else 1e-4
+    atol = float(sys.argv[3]) if len(sys.argv) > 3 else 1e-5
+    print "programs: "+str(total_programs)+", rtol: "+str(rtol)+", atol: "+str(atol)
+    print ("config\tdataset\tpoints\tclose bids\tclose bids (worst program)\tsame team actions"
+        "\tfloat64 (s)\tfloat32 (s)\tinputs float64/float32 (KB)")
+    for config_file in CONFIGS:
+        try:
+            print "\t".join(report(config_file, total_programs, rtol, atol))
+        except ValueError as error:
+            print os.path.basename(config_file)+"\tcould not be loaded: "+str(error)
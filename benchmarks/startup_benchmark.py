@@ -0,0 +1,48 @@
+"""
+Measures the time to start SBB for each type of environment: the import of SBB.sbb plus the
+import of the environment class, in a new Python process each time (so no module is already
+imported), and reports which of the heavier dependencies were imported.
+
+Run from the root folder with: python benchmarks/startup_benchmark.py [repetitions]
+"""
+import sys
+import json
+import subprocess
+import numpy
+
+ENVIRONMENTS = ['classification', 'tictactoe', 'poker', 'sockets']
+
+MODULES = ['sklearn', 'scipy', 'socket', 'SBB.environments.reinforcement.poker.poker_environment',
+    'SBB.environments.classification.classification_environment']
+
+STARTUP_CODE = """
+import sys
+import time
+import json
+start = time.time()
+import SBB.sbb
+try:
+    from SBB.environments.environment_registry import get_environment_class
+    get_environment_class(sys.argv[1])
+except ImportError: # before the environment registry, SBB.sbb imported all environments
+    pass
+elapsed = time.time()-start
+print json.dumps({'time': elapsed, 'modules': len(sys.modules),
+    'imported': [module for module in json.loads(sys.argv[2]) if module in sys.modules]})
+"""
+
+def measure_startup(environment, repetitions):
+    results = []
+    for repetition in range(repetitions):
+        output = subprocess.check_output([sys.executable, '-c', STARTUP_CODE, environment, json.dumps(MODULES)])
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    times = [result['time'] for result in results]
+    return numpy.median(times), numpy.std(times), results[-1]
+
+if __name__ == "__main__":
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print "environment\tmedian (s)\tstd (s)\tmodules\timported"
+    for environment in ENVIRONMENTS:
+        median, std, result = measure_startup(environment, repetitions)
+        imported = [module.split('.')[-1] for module in result['imported']]
+        print environment+"\t"+str(round(median, 4))+"\t"+str(round(std, 4))+"\t"+str(result['modules'])+"\t"+", ".join(imported)
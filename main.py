@@ -1,5 +1,6 @@
 from optparse import OptionParser
 from SBB.sbb import SBB
+from SBB.core.distributed_worker import DistributedWorker
 from SBB.config import Config
 
 if __name__ == "__main__":
@@ -7,8 +8,15 @@ if __name__ == "__main__":
     parser.add_option("-f", "--config_file", dest="config_file",
                       help="configuration file that will be used by SBB", 
                       default="SBB/configs/default_config.json")
+    parser.add_option("-w", "--worker", dest="coordinator",
+                      help="run as a worker for the 'distributed' parallelism, connected to the coordinator at host:port "
+                      "(the configuration is received from the coordinator)")
     (options, args) = parser.parse_args()
 
-    Config.load_config(options.config_file)
-    Config.check_parameters()
-    SBB().run()
\ No newline at end of file
+    if options.coordinator:
+        host, port = options.coordinator.rsplit(":", 1)
+        DistributedWorker(host, int(port)).run()
+    else:
+        Config.load_config(options.config_file)
+        Config.check_parameters()
+        SBB().run()
\ No newline at end of file